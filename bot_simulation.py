@@ -0,0 +1,175 @@
+# Test Your Memory: batch simulation of the bots (python memory.py simulate)
+# Numpy-free, so the worker processes only import the game engine (see memory_core.py)
+
+# Standard Libraries
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import math
+import os
+import random
+import sys
+
+# Game Modules
+from memory_core import BOT_NAMES, createBot, playBotGame, totalMovesToScore
+
+
+def simulateBotChunk(n, strategy, capacity, seeds):
+    """
+    Work unit of a batch simulation: lets a bot play one game per seed and counts the results
+
+    Parameters:
+        n (int): Size of the board
+        strategy (str): Name of the bot (see BOT_NAMES)
+        capacity (int): Number of cards remembered by the 'lru' bot
+        seeds (list): Seed of every game (used for both the board and the bot), None for random games
+
+    Returns:
+        movesHistogram (Counter): number of games per total moves
+        scoreHistogram (Counter): number of games per score
+    """
+    movesHistogram = Counter()
+    scoreHistogram = Counter()
+    for seed in seeds:
+        game = playBotGame(createBot(strategy, capacity, seed), n, seed)
+        movesHistogram[game.totalMoves] += 1
+        scoreHistogram[game.score()] += 1
+    return movesHistogram, scoreHistogram
+
+
+def runBotSimulation(n, games, strategy, capacity=8, workers=None, chunkSize=None, seed=None):
+    """
+    Plays many bot games spread over a pool of worker processes and merges their histograms
+
+    Parameters:
+        n (int): Size of the board
+        games (int): Number of games to play
+        strategy (str): Name of the bot (see BOT_NAMES)
+        capacity (int): Number of cards remembered by the 'lru' bot
+        workers (int): Number of worker processes (defaults to the number of CPUs)
+        chunkSize (int): Number of games per work unit (defaults to about 8 work units per worker)
+        seed (int): Optional seed to make the whole simulation reproducible
+
+    Returns:
+        movesHistogram (Counter): number of games per total moves
+        scoreHistogram (Counter): number of games per score
+    """
+    if strategy not in BOT_NAMES:
+        raise ValueError(f"Unknown strategy '{strategy}', expected one of {BOT_NAMES}")
+
+    workers = workers or os.cpu_count() or 1
+    chunkSize = chunkSize or max(1, min(10000, math.ceil(games / (workers * 8))))
+
+    # Every game gets its own seed, so results do not depend on how games are split over workers
+    if seed is None:
+        seeds = [None] * games
+    else:
+        baseSeed = random.Random(seed).getrandbits(64)
+        seeds = [baseSeed + index for index in range(games)]
+    chunks = [seeds[start:start + chunkSize] for start in range(0, games, chunkSize)]
+
+    movesHistogram = Counter()
+    scoreHistogram = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(simulateBotChunk, [n] * len(chunks), [strategy] * len(chunks), [capacity] * len(chunks), chunks)
+        for chunkMoves, chunkScores in results:
+            movesHistogram.update(chunkMoves)
+            scoreHistogram.update(chunkScores)
+
+    return movesHistogram, scoreHistogram
+
+
+def summarizeHistogram(histogram):
+    """
+    Summarizes a histogram (value -> number of games) without expanding it
+
+    Parameters:
+        histogram (Counter): number of games per value
+
+    Returns:
+        summary (dict): number of games, mean/std/min/max and percentiles (p5, p25, p50, p75, p95) of the values
+    """
+    values = sorted(histogram)
+    games = sum(histogram.values())
+    mean = sum(value * count for value, count in histogram.items()) / games
+    variance = sum(count * (value - mean) ** 2 for value, count in histogram.items()) / games
+
+    summary = {'games': games, 'mean': mean, 'std': math.sqrt(variance), 'min': values[0]}
+
+    # Walk the sorted values once, picking the value where each percentile's rank is reached
+    percentiles = [5, 25, 50, 75, 95]
+    seen = 0
+    for value in values:
+        seen += histogram[value]
+        while percentiles and seen >= percentiles[0] / 100 * games:
+            summary[f"p{percentiles.pop(0)}"] = value
+
+    summary['max'] = values[-1]
+    return summary
+
+
+def writeHistogramCsv(movesHistogram, n, file):
+    """
+    Writes a moves histogram as CSV with columns TotalMoves, Score and Games
+
+    Parameters:
+        movesHistogram (Counter): number of games per total moves
+        n (int): Size of the board (to convert total moves to scores)
+        file: Text stream to write to
+    """
+    writer = csv.writer(file)
+    writer.writerow(["TotalMoves", "Score", "Games"])
+    for totalMoves in sorted(movesHistogram):
+        writer.writerow([totalMoves, int(totalMovesToScore(totalMoves, n)), movesHistogram[totalMoves]])
+
+
+def simulateCommand(argv):
+    """
+    Command line entry point: python memory.py simulate --games N --size n --strategy S --workers W
+
+    Parameters:
+        argv (list): Command line arguments after "simulate"
+
+    Returns:
+        0 (int): Exit status
+    """
+    parser = argparse.ArgumentParser(prog="memory.py simulate", description="Play many bot games in parallel and summarize their moves and scores.")
+    parser.add_argument("--games", type=int, default=10000, help="number of games to play (default: 10000)")
+    parser.add_argument("--size", type=int, default=4, help="board size n of an n x n board (default: 4)")
+    parser.add_argument("--strategy", choices=BOT_NAMES, default="perfect", help="bot that plays the games (default: perfect)")
+    parser.add_argument("--capacity", type=int, default=8, help="number of cards the lru bot remembers (default: 8)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="games per work unit (default: about 8 work units per worker)")
+    parser.add_argument("--seed", type=int, default=None, help="seed to make the simulation reproducible")
+    parser.add_argument("--csv", default=None, help="also write the moves/score histogram to this CSV file ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    if args.games < 1:
+        parser.error("--games must be at least 1")
+    if args.size < 2 or args.size % 2 != 0:
+        parser.error("--size must be an even number of at least 2")
+    if args.strategy == "lru" and args.capacity < 1:
+        parser.error("--capacity must be at least 1")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    movesHistogram, scoreHistogram = runBotSimulation(args.size, args.games, args.strategy, args.capacity, args.workers, args.chunk_size, args.seed)
+
+    # Summary table: one row for the moves and one for the scores
+    rows = [("TotalMoves", summarizeHistogram(movesHistogram)), ("Score", summarizeHistogram(scoreHistogram))]
+    columns = ["games", "mean", "std", "min", "p5", "p25", "p50", "p75", "p95", "max"]
+    print(f"{args.size}x{args.size} board, {args.strategy} strategy")
+    print(f"{'':<12}" + "".join(f"{column:>10}" for column in columns))
+    for name, summary in rows:
+        print(f"{name:<12}" + "".join(f"{summary[column]:>10.2f}" if isinstance(summary[column], float) else f"{summary[column]:>10}" for column in columns))
+
+    if args.csv == "-":
+        writeHistogramCsv(movesHistogram, args.size, sys.stdout)
+    elif args.csv:
+        with open(args.csv, "w", newline="") as file:
+            writeHistogramCsv(movesHistogram, args.size, file)
+
+    return 0
@@ -1,232 +1,426 @@
 # 𝙏𝙚𝙨𝙩 𝙔𝙤𝙪𝙧 𝙈𝙚𝙢𝙤𝙧𝙮: 𝘼 𝙏𝙚𝙭𝙩 𝘽𝙖𝙨𝙚𝙙 𝙈𝙚𝙢𝙤𝙧𝙮 𝙂𝙖𝙢𝙚 
 
 # Standard Libraries
+import argparse
+import asyncio
+import atexit
+from collections import deque
+from contextlib import contextmanager, suppress
 import csv
 from datetime import date
-from datetime import datetime
-import math
+import functools
+import importlib.util
+import json
 import os
 import platform
 import random
+import re
+import shutil
 import sys
 import time
+import unicodedata
 
 # Third Party Libraries
-from art import text2art
+# art, cryptography, pyfiglet, rich and termcolor are imported by the functions that use them,
+# so the first screen doesn't wait for them (see --startup-profile)
 from colorama import Fore, Style, init
-from cryptography.fernet import Fernet
-import pandas as pd
-import pickle
-from pyfiglet import Figlet, figlet_format
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-from termcolor import colored
 
+# Game Modules
+# The game engine only needs the standard library (see memory_core.py)
+from memory_core import AssignmentBoard, MemoryGame, StateBoard
+# The game log, the players and the saved game are kept in files or in SQLite (see memory_storage.py)
+from memory_storage import STORAGE_BACKENDS, openStorage, replaceFile
 
 
 # Initialize the colorama module for adding stylized text
 init()
 
 
-def initialState(n):
+# Largest board that can be chosen from the custom difficulty option
+MAX_BOARD_SIZE = 64
+
+# Seconds a mismatched pair stays visible unless a key is pressed first (see playRounds and the --reveal option;
+# none with a speed of 0, unless --reveal is given)
+REVEAL_SECONDS = 2
+
+# Number of times the screen has been cleared (see clearScreen and BoardRenderer)
+screenGeneration = 0
+
+
+def boardCells(assignmentBoard, stateBoard, selectedCard):
     """
-    Returns a n x n sized board containing the initial state
+    Returns the colored text of every cell of the board, row by row (coordinate 1 first)
 
     Parameters:
-        n (int): Size of the board
+        assignmentBoard (AssignmentBoard): assignment board of size n x n
+        stateBoard (StateBoard): state board of size n x n
+        selectedCard (list): list containing the currently selected cards of the player
 
     Returns:
-        stateBoard (list): multidimensional list of size n x n containing the initial state
+        cells (list): colored text (str) of every cell
     """
-        
-    stateBoard = []
-    for i in range(n):
-        stateBoard.append([])
-        for j in range(n):
-            stateBoard[i].append(False)
+    from termcolor import colored
 
-    return stateBoard
+    # Get coordinates of selectedCard
+    coordSelectedCard = []
+
+    if selectedCard != False:
+        coordSelectedCard = selectedCard
+
+    cells = []
+    for coordinate in range(1, assignmentBoard.n * assignmentBoard.n + 1):
+        if stateBoard.isSolved(coordinate):
+            value = assignmentBoard.faceAt(coordinate)  # Card faces are only looked up when rendered
+            cells.append(colored(f"{value:^5}", 'green'))  # Show actual value if revealed match
+        elif coordinate in coordSelectedCard:
+            value = assignmentBoard.faceAt(coordinate)
+            cells.append(colored(f"{value:^5}", 'red'))  # Show actual value if temporarily revealed as Selected card
+        else:
+            cells.append(colored(f"{coordinate:^5}", 'magenta'))  # Show sequential number if hidden
+    return cells
 
 
-def initialAssignment(n):
+class BoardRenderer:
     """
-    Returns a n x n sized board containing the assignment of values. 
-    Values location is subjected to randomization.
+    Draws the board during a game and remembers the last frame it drew.
+
+    The first frame (and the first frame after the screen was cleared) is drawn in full: the cells of every
+    row joined by '|', followed by an empty line.
+    Later frames only rewrite the cells that changed, using ANSI cursor positioning, and clear whatever
+    was printed below the board (prompts and messages). If the board does not fit in the terminal,
+    every frame is drawn in full since cursor positions would not be reliable.
 
     Parameters:
         n (int): Size of the board
+    """
 
-    Returns:
-        assignmentBoard (list): multidimensional list of size n x n 
-        containing values with randomized placement
-    """
-    # Get the number of unique cards needed for this game.
-    libraryQty = int((n**2)/2)
- 
-    # The 52-card deck contains 4 suites and 13 values.
-    cardSuits = ['\u2660','\u2663','\u2665','\u2666']   
-    cardValues = [
-        ' A',' 2',' 3',' 4',' 5',' 6',' 7',
-        ' 8',' 9','10',' J',' Q',' K'
-    ]    
-
-    # Create a library containing unique cards with qty = libraryQty.
-    library = [] 
-    for i in range (libraryQty):
-        while True:
-            card = random.choice(cardValues) + random.choice(cardSuits)
-            if card not in library:
-                break                            
-        library.append(card)
-    
-    # Duplicate the cards in the library to make card-pairs.
-    library += library
-    
-    # Shuffle the cards before starting the game.
-    random.shuffle(library)
+    # Every cell is 5 characters wide followed by a '|' separator, and every board row is followed by an empty line
+    CELL_WIDTH = 6
+    ROW_HEIGHT = 2
+
+    def __init__(self, n):
+        self.n = n
+        self.lastFrame = None
+        self.screen = None
+
+    def fitsTerminal(self):
+        """
+        Returns True if the whole board (and the prompt below it) fits in the terminal
+        """
+        columns, lines = shutil.get_terminal_size()
+        return self.n * self.CELL_WIDTH <= columns and self.n * self.ROW_HEIGHT + 2 <= lines
 
-    # Take a card from the library and configure as a matrix.
-    assignmentBoard = [[library.pop() for j in range(n)] for row in range(n)]
+    def draw(self, assignmentBoard, stateBoard, selectedCard, message=None):
+        """
+        Draws the board, rewriting only the cells that changed since the last frame
+
+        Parameters:
+            assignmentBoard (AssignmentBoard): assignment board of size n x n
+            stateBoard (StateBoard): state board of size n x n
+            selectedCard (list): list containing the currently selected cards of the player
+            message (str): Optional message printed below the board
+
+        Returns:
+            None (only prints the board)
+        """
+        frame = boardCells(assignmentBoard, stateBoard, selectedCard)
+        n = self.n
 
-    return assignmentBoard
+        # Full redraw: nothing drawn yet, the screen was cleared since, or the board does not fit
+        if self.lastFrame is None or self.screen != screenGeneration or not self.fitsTerminal():
+            clearScreen()
+            output = []
+            for i in range(n):
+                output.append('|'.join(frame[i * n:(i + 1) * n]) + "\n\n")
+
+        # Partial redraw: move the cursor to every changed cell and rewrite it
+        else:
+            output = []
+            for index, cell in enumerate(frame):
+                if cell != self.lastFrame[index]:
+                    row = (index // n) * self.ROW_HEIGHT + 1
+                    column = (index % n) * self.CELL_WIDTH + 1
+                    output.append(f"\x1b[{row};{column}H{cell}")
 
+            # Move below the board and clear the old prompt and messages
+            output.append(f"\x1b[{n * self.ROW_HEIGHT + 1};1H\x1b[J")
 
-def gameOver(stateBoard):
+        if message:
+            output.append(message + "\n")
+
+        frameBuffer.write(''.join(output))
+        frameBuffer.flush()
+        frameBuffer.resetStyle()  # The cells carry their own color codes
+
+        self.lastFrame = frame
+        self.screen = screenGeneration
+
+
+def displayWidth(line):
     """
-    Checks if the board is in the terminal state / fully solved
+    Returns the number of terminal columns a line takes (color codes take none, wide characters take two)
+    """
+    line = re.sub(r'\x1b\[[0-9;]*m', '', line).expandtabs()
+    return sum(2 if unicodedata.east_asian_width(char) in ['W', 'F'] else 1 for char in line)
 
-    Parameters:
-        stateBoard (list): multidimensional list of size n x n containing the state
 
-    Returns:
-        Returns True if the board is in the terminal state / no more cards left, False otherwise
+class MenuRenderer:
     """
-    for row in stateBoard:
-        for all_card_revealed in row:
-            if not all_card_revealed:  # If any card is not revealed
-                return False
-    return True  # All cards are revealed
+    Draws a menu and remembers which option it highlighted.
 
+    The whole menu (header, options and footer) is drawn once; when the highlighted option changes only
+    the old and the new highlighted lines are rewritten, using ANSI cursor positioning. Like BoardRenderer,
+    the menu is drawn in full again after the screen was cleared or if it does not fit in the terminal.
 
-def displayBoard(assignmentBoard, stateBoard, selectedCard, ciMapDict):
+    Parameters:
+        header (str): Text above the options (banners and borders), ending with a newline
+        options (list): (normal, highlighted) pair of lines for every option
+        footer (str): Text below the options, ending with a newline
     """
-    Displays board to be played each move of the game. Also, display the current score
 
-    Displays the board containing the "coordinates" - guide for selection and faced up cards (solved and selected cards)
+    def __init__(self, header, options, footer):
+        self.header = header
+        self.options = options
+        self.footer = footer
+        self.selected = None
+        self.screen = None
+
+        # Row of the first option (rows start at 1) and of the line below the footer
+        self.firstRow = header.count('\n') + 1
+        self.lastRow = self.firstRow + len(options) + footer.count('\n')
+        self.width = max(displayWidth(line) for line in (header + footer).split('\n') + [line for pair in options for line in pair])
+
+    def fitsTerminal(self):
+        """
+        Returns True if the whole menu fits in the terminal without wrapping or scrolling
+        """
+        columns, lines = shutil.get_terminal_size()
+        return self.width < columns and self.lastRow <= lines
+
+    def draw(self, selected):
+        """
+        Draws the menu with the given option (0-based index) highlighted
+
+        Parameters:
+            selected (int): Index of the highlighted option
+
+        Returns:
+            None (only prints the menu)
+        """
+        # Full redraw: nothing drawn yet, the screen was cleared since, or the menu does not fit
+        if self.selected is None or self.screen != screenGeneration or not self.fitsTerminal():
+            clearScreen()
+            output = [self.header]
+            for index, (line, highlighted) in enumerate(self.options):
+                output.append((highlighted if index == selected else line) + "\n")
+            output.append(self.footer)
+
+        # Partial redraw: rewrite the line that lost the highlight and the one that got it, then go back below the menu
+        else:
+            output = []
+            if selected != self.selected:
+                output.append(f"\x1b[{self.firstRow + self.selected};1H\x1b[2K{self.options[self.selected][0]}")
+                output.append(f"\x1b[{self.firstRow + selected};1H\x1b[2K{self.options[selected][1]}")
+            output.append(f"\x1b[{self.lastRow};1H")
+
+        frameBuffer.write(''.join(output))
+        frameBuffer.flush()
+        frameBuffer.resetStyle()
+
+        self.selected = selected
+        self.screen = screenGeneration
+
+
+def parseSpeed(value):
+    """
+    Converts a speed setting to an animation speed factor
 
     Parameters:
-        assignmentBoard (list): multidimensional list of size n x n containing the assignments
-        stateBoard (list): multidimensional list of size n x n containing the state
-        selectedCard (list): list containing the currently selected cards of the player
-        ciMapDict (dict): Dictionary which maps a "coordinate" to its i and j index board position
+        value (str): 'turbo' (no delays at all) or a number, e.g. '2' for animations twice as fast
 
     Returns:
-        None (only prints the board)    
+        speed (float): Speed factor (0 means no delays)
     """
-    hidden_counter = 1  # Starting number of the cards in a selected boardsize
-    
-    # Get coordinates of selectedCard
-    coordSelectedCard = []
+    if value.strip().lower() == 'turbo':
+        return 0.0
 
-    if selectedCard != False:
-        for card in selectedCard:
-            coordSelectedCard.append(ciMapDict[card])
-
-    for i, card in enumerate(assignmentBoard):
-        card_display = []
-        for j, value in enumerate(card):
-            if stateBoard[i][j]:  # (i,j) in selected card is coordinate of the selected card
-                card_display.append(colored(f"{value:^5}", 'green'))  # Show actual value if revealed match or temporarily revealed as Selected card
-            elif (i, j) in coordSelectedCard:
-                card_display.append(colored(f"{value:^5}", 'red'))
-            else:
-                card_display.append(colored(f"{hidden_counter:^5}", 'magenta'))  # Show sequential number if hidden
-            hidden_counter += 1  # Increment counter for the next hidden value
-        print('|'.join(card_display))  # Print card with indices and values
-        print()
+    speed = float(value)
+    if speed < 0:
+        raise ValueError("speed can't be negative")
+    return speed
 
 
-def coordinateToIndexMap(n):
+class AnimationClock:
     """
-    Creates a dictionary which maps a coordinate to its i and j index board position
+    Every pause of the user interface (typing effects, flashing headers, reveal delays) goes through this clock
+
+    The delays are divided by a global speed factor; a speed of 0 turns them off. When the game runs in a
+    terminal, pressing any key during a pause ends it, and pressing a key during an animation (see the
+    animated decorator and typeText) skips the rest of that animation. The terminal stays in raw mode for
+    the whole animation (see animation), so keys typed between its frames are not echoed.
+
+    Keys that end a pause outside an animation are kept as typeahead for whoever reads the keyboard next
+    (see takeTypeahead), like the keys that cancel an asyncio animation stay queued (see playAnimation).
 
     Parameters:
-        size (n): size of the board 
+        speed (float): Speed factor of all delays
+    """
 
-    Returns:
-        ciMapDict (dict): Dictionary which maps a "coordinate" to its i and j index board position
+    def __init__(self, speed=1.0):
+        self.speed = speed
+        self.skipping = False
+        self.depth = 0
+        self.terminal = None
+        self.typeahead = []
+
+    def scaled(self, seconds):
+        """
+        Returns how long a delay of the given seconds actually lasts
+        """
+        if self.speed <= 0 or self.skipping:
+            return 0
+        return seconds / self.speed
+
+    def sleep(self, seconds):
+        """
+        Pauses the game for the given (unscaled) seconds, or until a key is pressed
+        """
+        duration = self.scaled(seconds)
+        if duration <= 0:
+            return
+
+        if self.terminal is not None:
+            keys = self.terminal.readKeys(duration)
+        elif sys.stdin.isatty():
+            keys = waitForKey(duration)
+        else:
+            time.sleep(duration)
+            return
+
+        if keys and self.depth:
+            self.skipping = True
+        else:
+            self.typeahead += keys
+
+    def takeTypeahead(self):
+        """
+        Returns the keys that ended pauses outside an animation since the last call, oldest first
+        """
+        keys, self.typeahead = self.typeahead, []
+        return keys
+
+    async def asleep(self, seconds):
+        """
+        Pauses a coroutine for the given (unscaled) seconds; cancelling its task ends the pause (see playAnimation)
+        """
+        duration = self.scaled(seconds)
+        if duration > 0:
+            await asyncio.sleep(duration)
+
+    def waitForInput(self, seconds):
+        """
+        Waits until a key is pressed or the given seconds pass, and returns the keys typed that a line reader
+        uses (printable keys, 'BACKSPACE' and 'ENTER', see readLine)
+
+        In a terminal the time is not scaled by the speed factor, since it is how long the player gets to look at
+        the board (a speed of 0 sets REVEAL_SECONDS to 0 instead, see __main__). Without a terminal nobody is
+        looking, so the scaled time is waited, like sleep.
+        """
+        if seconds <= 0:
+            return self.takeTypeahead()
+
+        if not sys.stdin.isatty():
+            time.sleep(self.scaled(seconds))
+            return []
+
+        keys = self.takeTypeahead() + (self.terminal.readKeys(seconds) if self.terminal is not None else waitForKey(seconds))
+        return [key for key in keys if key in ('BACKSPACE', 'ENTER') or (len(key) == 1 and key.isprintable())]
+
+    @contextmanager
+    def animation(self):
+        """
+        Marks the start and end of an animation; a skipped animation stops skipping when it ends
+
+        The outermost animation holds the terminal in raw mode (see RawTerminal) until it ends, and its pauses
+        read the keys from it.
+        """
+        terminal = None
+        if not self.depth and self.speed > 0 and sys.stdin.isatty():
+            terminal = self.terminal = RawTerminal()
+            terminal.__enter__()
+
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            if not self.depth:
+                self.skipping = False
+            if terminal is not None:
+                self.terminal = None
+                terminal.__exit__(None, None, None)
+
+
+def speedFromEnvironment():
+    """
+    Reads the animation speed from the MEMORY_SPEED environment variable (1, i.e. normal speed, if unset or invalid)
+    """
+    try:
+        return parseSpeed(os.environ.get('MEMORY_SPEED', '1'))
+    except ValueError:
+        return 1.0
+
+
+# Set MEMORY_SPEED (or use the --speed and --turbo options) to change the speed of all animations
+animationClock = AnimationClock(speedFromEnvironment())
+
+
+def animated(function):
     """
-    ciMapDict = {}
-    index = 1
-    for r in range(n):
-        for c in range(n):
-            ciMapDict[index] = (r, c)
-            index += 1
-    return ciMapDict
+    Decorator for functions that play an animation, so a keypress skips the rest of it
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with animationClock.animation():
+            return function(*args, **kwargs)
+    return wrapper
 
 
-def indexToCoordinateMap(n):
+def storageFromEnvironment():
+    """
+    Opens the storage named by the MEMORY_STORAGE environment variable ('files' if unset), next to the game
     """
-    Creates a dictionary which maps the i and j index board position to its coordinate
+    return openStorage(os.environ.get('MEMORY_STORAGE', 'files'), os.path.dirname(os.path.abspath(__file__)))
 
-    Parameters:
-        size (n): size of the board 
 
-    Returns:
-        icMapDict (dict): Dictionary which maps the i and j index board positions to the "coordinate"     
-    """
-    icMapDict = {}
-    index = 1
-    for r in range(n):
-        for c in range(n):
-            icMapDict[(r, c)] = index
-            index += 1
-    return icMapDict
-  
+# Set MEMORY_STORAGE=sqlite (or use the --storage option) to keep the game log, players and saved game in memory.db
+gameStorage = storageFromEnvironment()
+
 
 # Leaderboard functions
-def readLeaderboard(gameLogFile):
+def readLeaderboard():
     """
-    Reads the leaderboard from the given file and returns the entries
+    Reads the leaderboard from the game log and returns the entries
 
     Parameters:
-        gameLogFile (str): Path of gamelog file
+        None
 
     Returns:
-        leaderboard (dict): Dictionary containing leaderboard entries of each game type     
+        leaderboard (dict): Dictionary containing leaderboard entries of each game type (dates as 'YYYY-MM-DD')
     """
 
-    leaderboard = {4: [], 6: [], 8: []}
-    try:
-        with open(gameLogFile, 'r') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                board_size = int(row['GameType'])
-                if board_size in leaderboard:
-                    score = int(row['Score'])
-                    name = row['Name']
-                    date_achieved = datetime.strptime(row['Date'], '%Y-%m-%d')
-
-                    leaderboard[board_size].append({
-                        'name': name,
-                        'score': score,
-                        'date_achieved': date_achieved
-                    })
-
-        for size in leaderboard:
-            leaderboard[size].sort(key=lambda x: (-x['score'], x['date_achieved']))
-            leaderboard[size] = leaderboard[size][:5]
-
-            if len(leaderboard[size]) < 5:
-                leaderboard[size] += [{'name': '', 'score': '', 'date_achieved': ''}] * (5 - len(leaderboard[size]))
-
-        return leaderboard
-    except FileNotFoundError:
-        return leaderboard
+    leaderboard = {}
+    for size, games in gameStorage.topScores([4, 6, 8], 5).items():
+        leaderboard[size] = [{'name': name, 'score': score, 'date_achieved': day} for name, score, day in games]
+
+        if len(leaderboard[size]) < 5:
+            leaderboard[size] += [{'name': '', 'score': '', 'date_achieved': ''}] * (5 - len(leaderboard[size]))
+
+    return leaderboard
 
       
 # Leaderboard functions
+@animated
 def displayLeaderboard(leaderboard):
     """
     Displays the leaderboard
@@ -237,11 +431,14 @@ def displayLeaderboard(leaderboard):
     Returns:
         None     
     """
+    from rich.console import Console
+    from rich.table import Table
+
     if not leaderboard:
         print("Leaderboard is empty.")
         return
     
-    f = figlet_format("MEMORYLAND HALL OF FAME", font="slant")
+    f = renderBanner("MEMORYLAND HALL OF FAME", "slant")
     text_effect(f, Fore.RED, delay=.001)    
 
     for size, entries in leaderboard.items():
@@ -257,78 +454,71 @@ def displayLeaderboard(leaderboard):
         currentplace = 1
 
         if size == 4:
-            time.sleep(1)
+            animationClock.sleep(1)
         else:
-            time.sleep(2.4)
+            animationClock.sleep(2.4)
 
         # Add row entries
         for entry in entries:
             if currentplace == 1 and entry['score'] != '':
-                table.add_row(f"{entry['name']} 🥇", str(f"{entry['score']}"), str(entry['date_achieved'].strftime('%Y-%m-%d')) if entry['date_achieved'] else '')
+                table.add_row(f"{entry['name']} 🥇", str(f"{entry['score']}"), entry['date_achieved'])
             elif currentplace == 2 and entry['score'] != '' :
-                table.add_row(f"{entry['name']} 🥈", str(f"{entry['score']}"), str(entry['date_achieved'].strftime('%Y-%m-%d')) if entry['date_achieved'] else '')
+                table.add_row(f"{entry['name']} 🥈", str(f"{entry['score']}"), entry['date_achieved'])
             elif currentplace == 3 and entry['score'] != '':
-                table.add_row(f"{entry['name']} 🥉", str(f"{entry['score']}"), str(entry['date_achieved'].strftime('%Y-%m-%d')) if entry['date_achieved'] else '')
+                table.add_row(f"{entry['name']} 🥉", str(f"{entry['score']}"), entry['date_achieved'])
             else:
-                table.add_row(entry['name'], str(f"{entry['score']}"), str(entry['date_achieved'].strftime('%Y-%m-%d')) if entry['date_achieved'] else '')
+                table.add_row(entry['name'], str(f"{entry['score']}"), entry['date_achieved'])
             currentplace += 1
 
         # Print table
         console = Console()
         console.print(table, style="bold #A52A2A") 
 
-    time.sleep(1)     
+    animationClock.sleep(1)     
     print("")
     text_effect("🔥 Engraved in this hall are the names of those who remembered and will be remembered 🔥\n", Fore.RED, delay=.04)
 
         
-def leaderboards(gameLogFile):
+def leaderboards():
     """
     Main function to display the leaderboard. Calls other leaderboard feature functions.
 
     Parameters:
-        leaderboard (dict): gameLogFile (str): Path of gamelog file   
+        None
 
     Returns:
         1 (int): Indicates the return to main menu     
     """
     clearScreen()
 
-    # Get current path
-    currentPath = os.path.dirname(os.path.abspath(__file__))
-
-    # Specify game log file path
-    filepath = os.path.join(currentPath, 'gamelog/gamelog.csv')    
-
-   # File does not exist, return to leaderboards
-    if not os.path.isfile(filepath):
+   # No game was recorded yet, return to main menu
+    if not gameStorage.hasGames():
         text_effect("The leaderboards screen is currently locked. Play a game to unlock the leaderboards.")
         text_effect("Returning to main menu.")
-        time.sleep(3)
+        animationClock.sleep(3)
         return None
 
-    leaderboard = readLeaderboard(gameLogFile)
+    leaderboard = readLeaderboard()
     displayLeaderboard(leaderboard)
     text_effect_input("Press Enter to return to main menu", Fore.BLUE)
     print(Style.RESET_ALL)
     return 1
 
   
-def isAddedToLeaderboard(score, n, gameLogFile="gamelog/gamelog.csv"):
+def isAddedToLeaderboard(score, n):
     """
     Checks if the user's latest record is added to the leaderboard
 
     Parameters:
         score (int): Final score of player
         n (int): Game mode chosen (e.g. 4 corresponds to 4x4 game mode)
-        gameLogFile (str): Path of gamelog file   
 
     Returns:
         True, if user's latest record is added to leaderboard. Otherwise, False.
     """
 
     # Get leaderboard dictionary
-    leaderboard = readLeaderboard(gameLogFile)
+    leaderboard = readLeaderboard()
     if n not in leaderboard:
         return False
       
@@ -341,62 +531,13 @@ def isAddedToLeaderboard(score, n, gameLogFile="gamelog/gamelog.csv"):
         return True
     
     
-def getAvailableCoordinates(stateBoard, currentSelection, icMapDict):
-    """
-    Gets the list of available coordinates (to be used for validity checking in card selection)
-
-    Parameters:
-        assignmentBoard (list): multidimensional list of size n x n containing the assignments
-        stateBoard (list): multidimensional list of size n x n containing the state
-        icMapDict (dict): dictionary of index to coordinate mapping
-    Returns:
-        availableCoordinatesFinal (list): list of available coordinates  
-        availableCoordinatesInitial (list): all coordinates found in the board whether available or not
-    """
-    # FILTERING approach (start from all coordinates in the board, then removing solved coordinates and selected coordinates)
-
-    # Get the dimension of the board (use stateBoard as reference) (Assumption: n x n board is used)
-    n = len(stateBoard)
-
-    # Create initial list of coordinates (e.g. if 4x4 board, coordinates will be from 1-16) - Initialize first as empty
-    # Initial list of coordinates = all coordinates found in the board
-    availableCoordinatesInitial = []
-
-    # Populating the initial list
-    for i in range(1, (n*n) + 1):
-        availableCoordinatesInitial.append(i)
-
-    # Initialize solved coordinates array
-    solvedCoordinates = []
-
-    # Get all solved coordinates in stateBoard
-    for rowIndex, row in enumerate(stateBoard):
-        for colIndex, element in enumerate(row):
-            if element == True:
-                solvedCoordinates.append(icMapDict[(rowIndex,colIndex)])
-
-    # Create final list of coordinates (filtered version) - Initialize first as empty
-    availableCoordinatesFinal = []
-
-    # Populate final list of coordinates: Remove solved coordinates and currentSelection from initial list of coordinates
-    for coordinate in availableCoordinatesInitial:
-        if coordinate in solvedCoordinates or coordinate in currentSelection:
-            pass
-        else:
-            availableCoordinatesFinal.append(coordinate)
-
-    # Return the final available coordinate
-    return availableCoordinatesFinal, availableCoordinatesInitial
-
-
-def selectCard(stateBoard, currentSelection, icMapDict):
+def selectCard(game, typeahead=()):
     """
     Asks the user for a valid card
 
     Parameters:
-        stateBoard (list): multidimensional list of size n x n containing the state
-        currentSelection (list): list containing the currently selected cards of the player
-        icMapDict (dict): dictionary of index to coordinate mapping
+        game (MemoryGame): Game engine (keeps the set of available cards used for validation)
+        typeahead (list): Keys the player already typed (while the last pair was shown), read as the start of the answer
 
     Returns:
         cardSelected (int): card coordinate selected
@@ -404,28 +545,19 @@ def selectCard(stateBoard, currentSelection, icMapDict):
         False: if an invalid card is selected
     """
 
-    # Get list of available coordinates and board cards (all coordinates found in the board whether available or not)
-    availableCards, boardCards = getAvailableCoordinates(stateBoard, currentSelection, icMapDict)
-
     # Ask user for a card they want to select
     try:
-        cardSelected = input(Fore.MAGENTA + "Select card to flip: " + Style.RESET_ALL)
+        # In a terminal the keys typed ahead are echoed and can be erased like the rest of the answer (see readLine)
+        if sys.stdin.isatty():
+            cardSelected = asyncio.run(promptLine("Select card to flip: ", Fore.MAGENTA, 0, typeahead))
+        else:
+            cardSelected = input(Fore.MAGENTA + "Select card to flip: " + Style.RESET_ALL)
 
         if cardSelected.lower() == 's':
 
-            # Specify saved files folder path
-            folderpath = './savefiles'
-
-            # If path does not exist, create one
-            if not os.path.exists(folderpath):
-                os.mkdir(folderpath)
-
-            # Get a list of all directories (files and folder) inside the folder path
-            dir = os.listdir(folderpath) 
-
             clearScreen()
 
-            if len(dir) == 0:
+            if not gameStorage.hasSave():
                 answer = text_effect_input("Are you sure you want to save and close the game? Type and enter Y/y\n", Fore.RED, delay=.02)
                 print(Style.RESET_ALL)
             else:
@@ -459,25 +591,19 @@ def selectCard(stateBoard, currentSelection, icMapDict):
                 # Convert card selected to integer
                 cardSelected = int(cardSelected)
 
-                # Check if card selected is in list of available cards
-                if cardSelected not in boardCards:
-                    clearScreen()
-                    print(Fore.RED + "Card selected is invalid :(" + Style.RESET_ALL)
-                    time.sleep(1)
-                    return False            
-                elif cardSelected not in availableCards:
-                    clearScreen()
-                    print(Fore.RED + "Selected card already flipped :)" + Style.RESET_ALL)
-                    time.sleep(1)
+                # Check if card selected is in the set of available cards
+                invalidReason = game.checkSelection(cardSelected)
+                if invalidReason is not None:
+                    print(Fore.RED + invalidReason + Style.RESET_ALL)
+                    animationClock.sleep(1)
                     return False
                 else:
                     return cardSelected
                 
             except:
                 
-                clearScreen()
                 print(Fore.RED + "Card selected is invalid :(" + Style.RESET_ALL)
-                time.sleep(1)
+                animationClock.sleep(1)
                 return False       
 
         return False        
@@ -487,49 +613,202 @@ def selectCard(stateBoard, currentSelection, icMapDict):
         return False
 
 
-def checkMatchUpdateBoard(assignmentBoard, stateBoard, currentSelection, ciDictMap):
+def libraryVersion(name):
     """
-    Checks if the two selections are matching and if matching updates the state board
-    
-    Returns the updated assignmentBoard and stateBoard
+    Returns the installed version of a library without importing it (importing pyfiglet or art
+    would cost more than the banner cache saves), or None if it can't be found
 
     Parameters:
-        assignmentBoard (list): multidimensional list of size n x n containing the assignments
-        stateBoard (list): multidimensional list of size n x n containing the state
-        currentSelection (list): list containing the 2 currently selected cards of the player
-        ciDictMap (dict): coordinate to index map
+        name (str): Name of the library (its distribution and its package have the same name)
     Returns:
-        Updated stateBoard
-        matchFound (bool): True if a match is found, False otherwise
-    """
-    sel1_coor = ciDictMap.get(currentSelection[0])
-    sel2_coor = ciDictMap.get(currentSelection[1])
-    sel1_coor_x = sel1_coor[0]
-    sel1_coor_y = sel1_coor[1]
-    sel2_coor_x = sel2_coor[0]
-    sel2_coor_y = sel2_coor[1]
-
-    selection1 = assignmentBoard[sel1_coor_x][sel1_coor_y]
-    selection2 = assignmentBoard[sel2_coor_x][sel2_coor_y]
-    if selection1 == selection2:
-        stateBoard[sel1_coor_x][sel1_coor_y] = True
-        stateBoard[sel2_coor_x][sel2_coor_y] = True
-        return stateBoard, True
-    else:
-        return stateBoard, False
+        version (str): Version of the library
+    """
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.origin is None:
+        return None
 
+    # Installed packages sit next to their "<name>-<version>.dist-info" folder
+    packageFolder = os.path.dirname(os.path.dirname(spec.origin))
+    prefix = name.lower() + '-'
+    try:
+        for entry in os.listdir(packageFolder):
+            if entry.lower().startswith(prefix) and entry.endswith('.dist-info'):
+                return entry[len(prefix):-len('.dist-info')]
+    except OSError:
+        pass
+    return None
 
-def animated_header():
+
+class BannerCache:
+    """
+    Keeps the banners rendered from Figlet and art fonts in a file, so they are not rendered again on the next run
+
+    Banners are keyed by library, font and text. The file is only read when the first banner is needed and
+    is ignored if it was written by other versions of pyfiglet or art. Banners rendered during a run are
+    written in one go when the game exits (see save). Counts hits, misses and the time spent rendering and
+    loading (see report).
+
+    Parameters:
+        path (str): Path of the cache file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.banners = None
+        self.changed = False
+        self.hits = 0
+        self.misses = 0
+        self.renderSeconds = 0.0
+        self.loadSeconds = 0.0
+
+    def versions(self):
+        """
+        Returns the versions of the libraries the banners were rendered with
+        """
+        return {'pyfiglet': libraryVersion('pyfiglet'), 'art': libraryVersion('art')}
+
+    def load(self):
+        """
+        Reads the cache file (an empty cache if it is missing, unreadable or from other library versions)
+        """
+        start = time.perf_counter()
+        self.banners = {}
+        try:
+            with open(self.path, encoding='utf-8') as file:
+                data = json.load(file)
+            if data.get('versions') == self.versions():
+                self.banners = data['banners']
+        except (OSError, ValueError, KeyError):
+            pass
+        self.loadSeconds += time.perf_counter() - start
+
+    def save(self):
+        """
+        Writes the cache file if banners were rendered since it was read (replaced in one step with replaceFile,
+        so a crash never leaves half a file)
+        """
+        if not self.changed:
+            return
+        self.changed = False
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            replaceFile(self.path, json.dumps({'versions': self.versions(), 'banners': self.banners}, ensure_ascii=False))
+        except OSError:
+            pass  # The cache is optional (e.g. read-only installation)
+
+    def get(self, library, text, font, render):
+        """
+        Returns the cached banner, rendering (and caching) it if it is missing
+
+        Parameters:
+            library (str): 'figlet' or 'art'
+            text (str): Text of the banner
+            font (str): Font name
+            render (function): Renders the banner when it is missing
+        Returns:
+            banner (str): The rendered banner
+        """
+        if self.banners is None:
+            self.load()
+
+        key = f"{library}:{font}:{text}"
+        if key in self.banners:
+            self.hits += 1
+            return self.banners[key]
+
+        self.misses += 1
+        start = time.perf_counter()
+        banner = self.banners[key] = render()
+        self.renderSeconds += time.perf_counter() - start
+        self.changed = True
+        return banner
+
+    def report(self):
+        """
+        Returns a line summarizing the cache usage of this run
+        """
+        return (f"banner cache: {self.hits} hits, {self.misses} misses, "
+                f"{self.loadSeconds * 1000:.1f} ms loading, {self.renderSeconds * 1000:.1f} ms rendering")
+
+
+# Fixed banners are cached next to the game and saved on exit; set MEMORY_BANNER_STATS=1 to print the cache usage on exit
+bannerCache = BannerCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'banners.json'))
+atexit.register(bannerCache.save)
+if os.environ.get('MEMORY_BANNER_STATS') == '1':
+    atexit.register(lambda: print(bannerCache.report(), file=sys.stderr))
+
+
+@functools.lru_cache(maxsize=None)
+def renderBanner(text, font):
+    """
+    Renders text with a Figlet font; every banner is only rendered once per process,
+    and kept in the banner cache for the next runs
+
+    Parameters:
+        text (str): Text of the banner
+        font (str): Figlet font name
+    Returns:
+        banner (str): The rendered banner
+    """
+    def render():
+        from pyfiglet import figlet_format
+        return figlet_format(text, font=font)
+
+    return bannerCache.get('figlet', text, font, render)
+
+
+@functools.lru_cache(maxsize=None)
+def renderArt(text, font):
+    """
+    Renders text with an art font (see renderBanner)
+    """
+    def render():
+        from art import text2art
+        return text2art(text, font=font)
+
+    return bannerCache.get('art', text, font, render)
+
+
+# Every fixed banner of the game, as (library, text, font), for --build-banner-cache
+BANNERS = [
+    ('figlet', "TEST YOUR MEMORY  !", "slant"),
+    ('figlet', "TEST YOUR  MEMORY  !", "slant"),
+    ('art', "\t   A TEXT-BASED MEMORY GAME", 'fancy141'),
+    ('figlet', " SELECT DIFFICULTY", "straight"),
+    ('figlet', "MEMORYLAND HALL OF FAME", "slant"),
+    ('figlet', "   Memory Port", "doom"),
+    ('figlet', "Congratulations !", "standard"),
+    ('figlet', "memory camp", "doom"),
+    ('figlet', "⚔️ HERE COMES A NEW 🛡️", "cybermedium"),
+    ('figlet', "CHALLENGER!", "big"),
+    ('figlet', "MEMORYLAND TEMPLE", "standard"),
+    ('figlet', "MEMORY ARENA", "starwars"),
+]
+
+
+def buildBannerCache():
+    """
+    Renders every fixed banner into the banner cache ahead of time (e.g. when installing the game)
+    """
+    for library, text, font in BANNERS:
+        if library == 'figlet':
+            renderBanner(text, font)
+        else:
+            renderArt(text, font)
+    bannerCache.save()
+
+
+async def animated_header():
     """
     Provides a flashy animation for the menu's header via a three-cycle for-loop.
+    Runs as a task on the event loop, so a keypress cancels it (see mainMenu).
 
     Arguments: None
 
     Returns: None
     """
 
-    # Creates Figlet instance with "slant" as the font for the animated header
-    fig = Figlet(font="slant") 
+    # The header is rendered with the "slant" font (see renderBanner)
     title, subheader = f"TEST YOUR MEMORY  !", f"\t   A TEXT-BASED MEMORY GAME"
 
     # The list of colors to cycle for the flashing effect
@@ -544,8 +823,8 @@ def animated_header():
             if cycle == 2:
                 print(color + "=" * 50)
                 print(" ")
-                print(color + fig.renderText(title))
-                print(color + text2art(subheader, font='fancy141'), f"\n")
+                print(color + renderBanner(title, "slant"))
+                print(color + renderArt(subheader, 'fancy141'), f"\n")
                 # print(color + "=" * 50 + Style.RESET_ALL)
                 print(color + "=" * 50)
 
@@ -553,15 +832,16 @@ def animated_header():
             else:
                 print(" ")
                 print(" ")
-                print(color + fig.renderText(title))
-            time.sleep(0.15)
+                print(color + renderBanner(title, "slant"))
+            sys.stdout.flush()
+            await animationClock.asleep(0.15)
 
     # Displays the final frame of the header after the flashing effect
     clearScreen()
     print(Fore.CYAN + "=" * 50)
     print(" ")
-    print(Fore.GREEN + fig.renderText(title))
-    print(Fore.GREEN + text2art(f"\t   A TEXT-BASED MEMORY GAME", font='fancy141'), f"\n")
+    print(Fore.GREEN + renderBanner(title, "slant"))
+    print(Fore.GREEN + renderArt(subheader, 'fancy141'), f"\n")
     print(Fore.CYAN + "=" * 50 + Style.RESET_ALL)
 
     # Next, we display the player's options sequentially
@@ -577,195 +857,750 @@ def animated_header():
 
     for color, option in player_options:
         print(color + option + Style.RESET_ALL)
-        time.sleep(0.5)
+        sys.stdout.flush()
+        await animationClock.asleep(0.5)
 
     print(Fore.CYAN + "=" * 50 + Style.RESET_ALL)
 
 
-def show_menu(selected=1):
+def show_menu(selected=1, renderer=None):
     """
     handle_menu()'s helper function for displaying a menu instance during player navigation.
+    The menu is drawn once; passing back the renderer of the previous call only rewrites the highlighted lines.
 
-    Arguments: selected (int): A selection index (1-7) that corresponds to a menu option
+    Arguments: selected (int): A selection index (1-7) that corresponds to a menu option,
+    renderer (MenuRenderer): The renderer returned by the previous call (None to draw a new menu)
 
-    Returns: None
+    Returns: renderer (MenuRenderer): The renderer of the menu
     """
 
-    options = ["New Game", "Load Game", "Change User", "Instructions", "Leaderboards", "Achievements", "Quit"]
-    clearScreen()
-    fig = Figlet(font="slant")
-    print(Fore.CYAN + "=" * 50)
-    print(" ")
-    print(Fore.GREEN + fig.renderText("TEST YOUR  MEMORY  !"))  # Main header in green
-    # print(f"\t    {Back.GREEN} A CLASSIC MEMORY GAME", Back.RESET, "\n")
-    print(Fore.WHITE + text2art(f"\t   A TEXT-BASED MEMORY GAME", font='fancy141'), f"\n") 
-    print(Fore.CYAN + "=" * 50 + Style.RESET_ALL)
+    if renderer is None:
+        options = ["New Game", "Load Game", "Change User", "Instructions", "Leaderboards", "Achievements", "Quit"]
+        header = (Fore.CYAN + "=" * 50 + "\n"
+                  + " \n"
+                  + Fore.GREEN + renderBanner("TEST YOUR  MEMORY  !", "slant") + "\n"  # Main header in green
+                  + Fore.WHITE + renderArt(f"\t   A TEXT-BASED MEMORY GAME", 'fancy141') + " \n\n"
+                  + Fore.CYAN + "=" * 50 + Style.RESET_ALL + "\n")
 
-    # Highlights the selected option
-    for index, option in enumerate(options, start=1):
-        if index == selected:
-            print(Fore.GREEN + f"--> {index}. {option}" + Style.RESET_ALL)
-        else:
-            print(Fore.WHITE + f"    {index}. {option}" + Style.RESET_ALL)
-    print(Fore.CYAN + "=" * 50 + Style.RESET_ALL)
-    # print(Fore.YELLOW + "Use ↑/↓ to navigate and 'Enter' to select." + Style.RESET_ALL)
+        # Every option has a normal line and a highlighted one
+        lines = [(Fore.WHITE + f"    {index}. {option}" + Style.RESET_ALL,
+                  Fore.GREEN + f"--> {index}. {option}" + Style.RESET_ALL) for index, option in enumerate(options, start=1)]
+
+        footer = (Fore.CYAN + "=" * 50 + Style.RESET_ALL + "\n"
+                  + Fore.YELLOW + "Use ↑/↓ to navigate and Enter to select." + Style.RESET_ALL + "\n")
+        renderer = MenuRenderer(header, lines, footer)
+
+    renderer.draw(selected - 1)
+    return renderer
+
+
+class KeyDecoder:
+    """
+    Turns what is read from the terminal into keys, one read at a time
+
+    Arrow keys, Enter and Backspace become 'UP', 'DOWN', 'LEFT', 'RIGHT', 'ENTER' and 'BACKSPACE', an Escape key
+    on its own becomes 'ESC' and every other character is passed as it is. Several keys can arrive in one read
+    (typing ahead, holding an arrow key), and an escape sequence split over two reads is completed by the next one.
+    """
+
+    # Escape sequences of the arrow keys (normal and application cursor mode) and their Windows scan codes
+    SEQUENCES = {
+        '\x1b[A': 'UP', '\x1b[B': 'DOWN', '\x1b[C': 'RIGHT', '\x1b[D': 'LEFT',
+        '\x1bOA': 'UP', '\x1bOB': 'DOWN', '\x1bOC': 'RIGHT', '\x1bOD': 'LEFT',
+        '\xe0H': 'UP', '\xe0P': 'DOWN', '\xe0M': 'RIGHT', '\xe0K': 'LEFT',
+        '\x00H': 'UP', '\x00P': 'DOWN', '\x00M': 'RIGHT', '\x00K': 'LEFT',
+    }
+
+    # Single characters with a name ('\n' is Enter in cbreak mode, '\r' in raw mode and on Windows)
+    NAMES = {'\r': 'ENTER', '\n': 'ENTER', '\x7f': 'BACKSPACE', '\b': 'BACKSPACE'}
+
+    def __init__(self):
+        self.pending = ''
+
+    def sequenceLength(self, text, start):
+        """
+        Returns the length of the escape sequence starting at text[start], or None if it is not complete yet
+        """
+        if text[start] in ['\x00', '\xe0']:
+            return 2 if start + 1 < len(text) else None
+
+        if start + 1 >= len(text):
+            return None
+
+        # Control sequences: ESC [ parameters final, e.g. '\x1b[A' or '\x1b[1;5A'
+        if text[start + 1] == '[':
+            end = start + 2
+            while end < len(text) and '\x20' <= text[end] <= '\x3f':
+                end += 1
+            return end - start + 1 if end < len(text) else None
+
+        if text[start + 1] == 'O':
+            return 3 if start + 2 < len(text) else None
+
+        # Escape key followed by another key
+        return 1
+
+    def feed(self, text):
+        """
+        Decodes text read from the terminal
+
+        Parameters:
+            text (str): What was read
+        Returns:
+            keys (list): The complete keys in text (an unfinished escape sequence is kept for the next call)
+        """
+        text = self.pending + text
+        keys = []
+        index = 0
+
+        while index < len(text):
+            char = text[index]
+            if char in ['\x1b', '\x00', '\xe0']:
+                length = self.sequenceLength(text, index)
+                if length is None:
+                    break
+                sequence = text[index:index + length]
+                if sequence in self.SEQUENCES:
+                    keys.append(self.SEQUENCES[sequence])
+                elif sequence == '\x1b':
+                    keys.append('ESC')
+                index += length  # Other sequences (function keys, etc.) are ignored
+            else:
+                keys.append(self.NAMES.get(char, char))
+                index += 1
+
+        self.pending = text[index:]
+        return keys
+
+    def flush(self):
+        """
+        Gives up on an unfinished escape sequence: a lone escape character was the Escape key
+        """
+        keys = ['ESC'] if self.pending == '\x1b' else []
+        self.pending = ''
+        return keys
 
 
 # Cross-platform keypress handling
 if platform.system() == "Windows":
     import msvcrt # For capturing key presses on Windows
 
-    def getch():
-        """Captures a single keypress from the user on Windows."""
-        # removed the call to the decode method here since we're
-        # already using the raw bytes
-        return msvcrt.getch()   
+    def enterRawMode():
+        """Windows consoles already pass msvcrt every key without Enter and without echo; nothing to change."""
+        return None
+
+    def leaveRawMode(settings):
+        """Nothing to restore on Windows."""
+        pass
+
+    def readPending(timeout=None):
+        """
+        Waits up to timeout seconds (forever if None) for a keypress on Windows and returns every key pressed so far.
+        Arrow keys arrive as their two characters, e.g. '\xe0H' for the up arrow ('' if nothing was pressed).
+        """
+        end = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if end is not None and time.monotonic() >= end:
+                return ''
+            time.sleep(0.01)
+
+        text = ''
+        while msvcrt.kbhit():
+            text += msvcrt.getwch()
+        return text
+
+    def startKeyReader(reader):
+        """
+        Starts a thread that passes every key pressed to reader (a KeyReader) on its event loop.
+        """
+        import threading
+
+        def poll():
+            while reader.running:
+                keys = reader.terminal.readKeys(0.05)
+                if keys:
+                    reader.loop.call_soon_threadsafe(reader.feed, keys)
+
+        reader.running = True
+        reader.thread = threading.Thread(target=poll, daemon=True)
+        reader.thread.start()
+
+    def stopKeyReader(reader):
+        """
+        Stops the thread started by startKeyReader
+        """
+        reader.running = False
+        reader.thread.join()
 
 elif platform.system() in ["Linux", "Darwin"]:  # Darwin is for macOS
+    import codecs
+    import select
     import termios
     import tty
 
-    def getch():
+    # Keeps the bytes of a character split over two reads
+    stdinDecoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+
+    def enterRawMode():
         """
-        Captures a single keypress from the user on macOS/Linux systems.
+        Puts the terminal in cbreak mode: keys are passed without Enter and not echoed, while output
+        and Ctrl+C work as usual. Returns the previous settings for leaveRawMode.
+        """
+        # https://stackoverflow.com/questions/44736580/read-any-key-pressed-without-pressing-enter
+        fd = sys.stdin.fileno()
+        settings = termios.tcgetattr(fd)
+        tty.setcbreak(fd, termios.TCSANOW)
+        return settings
+
+    def leaveRawMode(settings):
+        """Restores the terminal settings saved by enterRawMode."""
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN, settings)
+
+    def readPending(timeout=None):
+        """
+        Waits up to timeout seconds (forever if None) for a keypress on macOS/Linux and returns
+        everything typed so far in a single read ('' if nothing was typed).
+        """
+        fd = sys.stdin.fileno()
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            return ''
+        return stdinDecoder.decode(os.read(fd, 4096))
+
+    def startKeyReader(reader):
+        """
+        Passes the keys typed to reader (a KeyReader) as soon as stdin is readable
+        """
+        reader.loop.add_reader(sys.stdin.fileno(), lambda: reader.feed(reader.terminal.readKeys(0)))
+
+    def stopKeyReader(reader):
+        """
+        Stops watching stdin
+        """
+        reader.loop.remove_reader(sys.stdin.fileno())
+
+
+class RawTerminal:
+    """
+    Keeps the terminal in raw mode (keys without Enter, no echo) for a whole screen and reads it as keys
+
+    The terminal settings are changed once when the screen starts and restored when it ends, instead of around
+    every keypress, so keys typed in between are not lost. Use it as a context manager:
+
+        with RawTerminal() as terminal:
+            for key in terminal.readKeys():
+                ...
+    """
+
+    # Seconds to wait for the rest of an escape sequence before taking a lone escape character as the Escape key
+    ESCAPE_TIMEOUT = 0.05
+
+    def __init__(self):
+        self.decoder = KeyDecoder()
+        self.settings = None
+
+    def __enter__(self):
+        self.settings = enterRawMode()
+        return self
+
+    def __exit__(self, *exc):
+        leaveRawMode(self.settings)
+
+    def readKeys(self, timeout=None):
+        """
+        Waits up to timeout seconds (forever if None) for a keypress and returns all the keys typed so far
+
+        Parameters:
+            timeout (float): Seconds to wait
+        Returns:
+            keys (list): Keys as decoded by KeyDecoder (empty if nothing was typed)
+        """
+        keys = self.decoder.feed(readPending(timeout))
+
+        while self.decoder.pending:
+            text = readPending(self.ESCAPE_TIMEOUT)
+            if not text:
+                keys += self.decoder.flush()
+            else:
+                keys += self.decoder.feed(text)
+
+        return keys
+
+
+def waitForKey(timeout):
+    """
+    Waits up to timeout seconds for a keypress. Returns the keys pressed (an empty list if none).
+    """
+    with RawTerminal() as terminal:
+        return terminal.readKeys(timeout)
+
+
+class KeyReader:
+    """
+    Reads the keyboard without blocking the asyncio event loop, so animations can run while the player types
+
+    Keys (see KeyDecoder) are queued until a coroutine asks for them, starting with the keys typed during the
+    last pauses (see AnimationClock.takeTypeahead). The terminal stays in raw mode while the reader is open.
+    Use it as a context manager inside a coroutine:
+
+        with KeyReader() as keys:
+            key = await keys.get()
+    """
+
+    def __init__(self):
+        self.keys = deque()
+        self.ready = asyncio.Event()
+        self.loop = None
+        self.terminal = RawTerminal()
+
+    def __enter__(self):
+        self.loop = asyncio.get_running_loop()
+        self.terminal.__enter__()
+        self.feed(animationClock.takeTypeahead())
+        startKeyReader(self)
+        return self
+
+    def __exit__(self, *exc):
+        stopKeyReader(self)
+        self.terminal.__exit__(*exc)
+
+    def feed(self, keys):
+        """
+        Queues the keys typed (called on the event loop by the platform specific reader)
+        """
+        if keys:
+            self.keys.extend(keys)
+            self.ready.set()
+
+    async def wait(self):
+        """
+        Waits until something was typed, without taking it from the queue
+        """
+        await self.ready.wait()
+
+    async def get(self):
+        """
+        Waits for and returns the next key
+        """
+        await self.ready.wait()
+        key = self.keys.popleft()
+        if not self.keys:
+            self.ready.clear()
+        return key
+
+    async def getAll(self):
+        """
+        Waits for a key and returns every key queued so far (e.g. all the repeats of a held arrow key)
+        """
+        await self.ready.wait()
+        keys = list(self.keys)
+        self.keys.clear()
+        self.ready.clear()
+        return keys
+
+
+async def playAnimation(keys, animation):
+    """
+    Plays an animation until it ends or the player types something, which cancels it.
+    What was typed stays queued in keys for whoever reads next.
+
+    Parameters:
+        keys (KeyReader): Keyboard of the current screen
+        animation (coroutine): The animation to play
+    Returns:
+        None
+    """
+    task = asyncio.ensure_future(animation)
+    keyPressed = asyncio.ensure_future(keys.wait())
+    await asyncio.wait([task, keyPressed], return_when=asyncio.FIRST_COMPLETED)
+
+    keyPressed.cancel()
+    if not task.done():
+        task.cancel()
+    with suppress(asyncio.CancelledError):
+        await task
+
+
+async def typeTextAsync(text, color, delay):
+    """
+    Coroutine version of typeText; if it is cancelled the rest of the text is written at once
+    text: Text to display.
+    color: Color of the text.
+    delay: Delay between each character (seconds).
+    """
+    frameBuffer.resetStyle()
+    chunks = frameBuffer.frames(text, animationClock.scaled(delay))
+    try:
+        for chunk in chunks:
+            frameBuffer.write(chunk, color + Style.BRIGHT)
+            frameBuffer.flush()
+            await animationClock.asleep(delay * len(chunk))
+    except asyncio.CancelledError:
+        frameBuffer.write(''.join(chunks), color + Style.BRIGHT)
+        frameBuffer.flush()
+        raise
+
+
+async def readLine(keys):
+    """
+    Reads a line from the keyboard, echoing it like input() does (Backspace erases, arrow and control keys are ignored)
+
+    Parameters:
+        keys (KeyReader): Keyboard of the current screen
+    Returns:
+        line (str): The line typed, without the Enter
+    """
+    line = ''
+    while True:
+        for key in await keys.getAll():
+            if key == 'ENTER':
+                frameBuffer.write("\n")
+                frameBuffer.flush()
+                return line
+            elif key == 'BACKSPACE':
+                if line:
+                    line = line[:-1]
+                    frameBuffer.write("\b \b")
+            elif len(key) == 1 and key.isprintable():
+                line += key
+                frameBuffer.write(key)
+        frameBuffer.flush()
+
+
+def inputLine(prompt=''):
+    """
+    Reads a line like input(prompt); in a terminal the keys typed during the last pauses are read first
+    (see AnimationClock.takeTypeahead), so they are echoed and can be erased like the rest of the line
+    """
+    if not sys.stdin.isatty():
+        return input(prompt)
+
+    async def session():
+        with KeyReader() as keys:
+            print(prompt, end='', flush=True)
+            return await readLine(keys)
+
+    return asyncio.run(session())
+
 
-        This function uses "terminal configurations" to capture a single character
-        from the input.
+async def promptLine(text, color, delay, typeahead=()):
+    """
+    Types a prompt while reading the answer; typing the answer early shows the rest of the prompt at once
+
+    Keys typed before the prompt (typeahead, see AnimationClock.waitForInput) are read first, as if they were
+    typed again, so they are echoed and can be erased with Backspace (an Enter among them ends the answer).
+    """
+    with KeyReader() as keys:
+        keys.feed(list(typeahead))
+        await playAnimation(keys, typeTextAsync(text, color, delay))
+        return await readLine(keys)
+
+
+async def handle_menu(keys):
+    """
+    Allows the user to navigate the menu using the up and down arrow keys
+    and select an option using the Enter key.
+
+    Arguments: keys (KeyReader): Keyboard of the menu screen (keys pressed during the header animation are already queued)
+
+    Returns: selected (int): Index (1-7) corresponding to an option selected by the player
+    """
+
+    # Selection index we pass as an argument to show_menu(). Default is 1
+    selected = 1  
+
+    # Represents the number of player options in the menu
+    # We can add more (e.g., Load From Save) as we progress
+    total_options = 7
+
+    renderer = None
+    while True:
+        renderer = show_menu(selected, renderer)  # Show the menu with the current selection
+
+        # Every key typed since the last frame is handled before drawing again, so held arrow keys don't lag behind
+        for key in await keys.getAll():
+            if key == 'UP': # Up arrow key
+                selected = (selected - 1) % total_options  # Wrap around if at the top
+            elif key == 'DOWN': # Down arrow key
+                selected = (selected + 1) % total_options  # Wrap around if at the bottom
+            elif key == 'ENTER': # Enter key
+                break
+            if selected == 0:  # "selected" becomes 0 when at "7. Quit" due to the modulo operation with "total_options"
+                selected = 7  # We do a reassignment here to reflect the correct index at "show_menu()"
+
+        if key == 'ENTER':
+            if selected == 2:
+                print(Fore.BLUE + "Fetching saved games..." + Style.RESET_ALL)
+            elif selected == 3:
+                print(Fore.BLUE + "Fetching user list..." + Style.RESET_ALL)
+            elif selected == 4:
+                # print(Fore.BLUE + "Instructions: Match all pairs in the board to win!" + Style.RESET_ALL)
+                # input("Press Enter to return to the menu...")
+                # continue
+                pass
+            elif selected == 5:
+                print(Fore.BLUE + "Loading leaderboards..." + Style.RESET_ALL)            
+            elif selected == 6:
+                print(Fore.BLUE + "Loading player achievements..." + Style.RESET_ALL)
+            elif selected == 7:
+                # print(Fore.RED + "Exiting the game. Goodbye!" + Style.RESET_ALL)
+                # time.sleep(1)
+                # exit()
+                pass
+            sys.stdout.flush()
+            await animationClock.asleep(1)
+            return selected
+
+
+def select_difficulty():
+    """
+    Allows the user to select a difficulty level for the game.
+    The user can navigate between difficulty options using the up and down
+    arrow keys and select one using the Enter key.
+
+    Arguments: None
+
+    Returns: diff_level (int): An integer (4, 6, 8 or a custom even size) corresponding to the difficulty level chosen by the user
+    """
+
+    # The custom option has no fixed size; it is asked for after selection
+    difficulties = {"Casual (4x4 Board)":4, "Serious (6x6 Board)":6, "Challenging (8x8 Board)":8, "Custom (Any Even Size Board)":None}
+    selected = 0  # Default selection is "Casual"
+    total_options = len(difficulties)
+
+    # The terminal stays in raw mode for the whole screen, so no key is lost between frames
+    with RawTerminal() as terminal:
+        diff_level = select_difficulty_level(terminal, difficulties, selected, total_options)
 
-        Arguments: None
+    # The custom size is typed like any other answer, with the terminal back to normal
+    if diff_level is None:
+        diff_level = select_custom_size()
+    return diff_level
+
+
+def select_difficulty_level(terminal, difficulties, selected, total_options):
+    """
+    select_difficulty()'s helper function that draws the options and handles the arrow keys until one is chosen.
+
+    Arguments: terminal (RawTerminal): Terminal of the screen, difficulties (dict): Difficulty options,
+    selected (int): Index of the highlighted option, total_options (int): Number of options
+
+    Returns: diff_level (int): Board size of the option chosen (None for the custom option)
+    """
+    header = (Fore.CYAN + "=" * 50 + "\n"
+              + " \n"
+              + Fore.BLUE + renderBanner(f" SELECT DIFFICULTY", "straight") + "\n"  # Alternative font style
+              + Fore.CYAN + "=" * 50 + Style.RESET_ALL + "\n"
+              + " \n")
+    lines = [(Fore.WHITE + f"    {index + 1}. {difficulty}" + Style.RESET_ALL,
+              Fore.GREEN + f"--> {index + 1}. {difficulty}" + Style.RESET_ALL) for index, difficulty in enumerate(difficulties.keys())]
+    footer = " \n" + Fore.YELLOW + "Use ↑/↓ to navigate and Enter to select." + Style.RESET_ALL + "\n"
+
+    # Drawn once; arrow keys only rewrite the highlighted lines
+    renderer = MenuRenderer(header, lines, footer)
+
+    while True:
+        renderer.draw(selected)
+
+        # Every key typed since the last frame is handled before drawing again
+        for key in terminal.readKeys():
+            if key == 'UP': # Up arrow key
+                selected = (selected - 1) % total_options  # Wrap around if at the top
+            elif key == 'DOWN': # Down arrow key
+                selected = (selected + 1) % total_options  # Wrap around if at the bottom
+            elif key == 'ENTER':  # Enter key
+
+                # Converts key values into a list then indexed with the current "select" value.
+                # The resulting lookup maps to the corresponding diff. level (4, 6, 8 or None for custom)
+                return difficulties[list(difficulties.keys())[selected]]
+
+
+def select_custom_size():
+    """
+    Asks the user for a custom board size (an even number from 2 up to MAX_BOARD_SIZE).
+
+    Arguments: None
+
+    Returns: size (int): The board size chosen by the user
+    """
+
+    while True:
+        print(" ")
+        answer = text_effect_input(f"Enter the board size (an even number from 2 to {MAX_BOARD_SIZE}, e.g. 16 for a 16x16 board): ", Fore.CYAN, delay=.01)
+        print(Style.RESET_ALL)
+
+        try:
+            size = int(answer)
+        except ValueError:
+            size = -1
+
+        if 2 <= size <= MAX_BOARD_SIZE and size % 2 == 0:
+            return size
+
+        print(Fore.RED + "Board size is invalid :(" + Style.RESET_ALL)
+        
+
+def mainMenu():
+    """
+    Plays the animated header and lets the player choose an option. Both run on one event loop:
+    a key pressed during the animation ends it and already counts for the menu.
+    """
+    async def session():
+        with KeyReader() as keys:
+            await playAnimation(keys, animated_header())
+            return await handle_menu(keys)
+
+    return asyncio.run(session())
+
+
+def enableAnsiOutput():
+    """
+    Checks if escape sequences can be used to control the screen (turns them on for Windows 10+ consoles)
+
+    Parameters:
+        None
+    Returns:
+        True if the terminal understands ANSI escape sequences, False otherwise
+    """
+    if os.name != 'nt':
+        return True
+
+    try:
+        import ctypes
+
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # Standard output
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))  # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    except Exception:
+        return False
+
+
+# Escape sequences work on this terminal (otherwise clearScreen falls back to the 'cls' command on Windows)
+ansiOutput = enableAnsiOutput()
+
+# Moves the cursor home, then clears the screen and the scrollback (the same bytes the 'clear' command prints)
+CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+
+def clearScreen():
+    """
+    Clears the terminal screen
+
+    The escape sequence is written to the (buffered) standard output without starting a new process,
+    so it reaches the terminal together with the next frame. Windows consoles without escape
+    sequence support fall back to the 'cls' command.
+    """
+    global screenGeneration
+
+    if ansiOutput:
+        sys.stdout.write(CLEAR_SCREEN)
+    else:
+        sys.stdout.flush()
+        os.system('cls')
 
-        Returns: key (str): The key pressed by the user repr. as an escape sequence
-        """
+    # Lets renderers know that what they drew before is gone
+    screenGeneration += 1
 
-        # https://stackoverflow.com/questions/44736580/read-any-key-pressed-without-pressing-enter
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
 
-            # This will capture the 'return' key on Linux-based systems 
-            # It resolves to '\x1b (or 27 in ord())' when an arrow key is pressed
-            key = sys.stdin.read(1)  
+# Length of one animation frame; characters typed within the same frame are written together
+FRAME_INTERVAL = 1 / 60
 
-            # For arrow keys, we need to set read to 2 to capture the 
-            # full escape sequence ("\x1b[A" for up arrow and "\x1b[B" for down)
-            if ord(key) == 27:
-                key += sys.stdin.read(2)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return key
+# Longer frames for slow (e.g. SSH) connections: fewer, larger writes and no flashing text
+LOW_BANDWIDTH_FRAME_INTERVAL = 0.1
 
 
-def handle_menu():
+class FrameBuffer:
     """
-    Allows the user to navigate the menu using the up and down arrow keys
-    and select an option using the Enter key.
+    Collects the output of the text animations and writes it to the terminal once per frame
 
-    Arguments: None
+    Color codes are only written when the color changes instead of before every character. The number of
+    bytes and writes (one write and flush each) is counted per screen, i.e. between two clearScreen calls,
+    and appended to statsFile (if given) when the screen is cleared and when the game exits.
 
-    Returns: selected (int): Index (1-7) corresponding to an option selected by the player
+    Parameters:
+        lowBandwidth (bool): Use longer frames and skip purely decorative output
+        statsFile (str): Optional path of a CSV file the per-screen counts are appended to
     """
 
-    # Selection index we pass as an argument to show_menu(). Default is 1
-    selected = 1  
-
-    # Represents the number of player options in the menu
-    # We can add more (e.g., Load From Save) as we progress
-    total_options = 7
+    def __init__(self, lowBandwidth=False, statsFile=None):
+        self.lowBandwidth = lowBandwidth
+        self.frameInterval = LOW_BANDWIDTH_FRAME_INTERVAL if lowBandwidth else FRAME_INTERVAL
+        self.statsFile = statsFile
+        self.parts = []
+        self.style = None
+        self.screen = screenGeneration
+        self.screenBytes = 0
+        self.screenWrites = 0
 
-    while True:
-        show_menu(selected)  # Show the menu with the current selection
-        print(Fore.YELLOW + "Use ↑/↓ to navigate and Enter to select." + Style.RESET_ALL)
-        key = getch()  # Get key input
-        if key in [b'\x00', b'\xe0']: # If getch is defined on Windows, these either prefix represents arrow keys
-            key += msvcrt.getch() # Another call to getch will capture the suffix (b'H' or b'P')
-
-        if key in [b'\x00H', b'\xe0H', "\x1b[A"]: # Up arrow key
-            selected = (selected - 1) % total_options  # Wrap around if at the top
-        elif key in [b'\x00P', b'\xe0P', "\x1b[B"]: # Down arrow key
-            selected = (selected + 1) % total_options  # Wrap around if at the bottom
-        elif key in [b'\r', "\r"]: # Enter key
-            if selected == 2:
-                print(Fore.BLUE + "Fetching saved games..." + Style.RESET_ALL)
-            elif selected == 3:
-                print(Fore.BLUE + "Fetching user list..." + Style.RESET_ALL)
-            elif selected == 4:
-                # print(Fore.BLUE + "Instructions: Match all pairs in the board to win!" + Style.RESET_ALL)
-                # input("Press Enter to return to the menu...")
-                # continue
-                pass
-            elif selected == 5:
-                print(Fore.BLUE + "Loading leaderboards..." + Style.RESET_ALL)            
-            elif selected == 6:
-                print(Fore.BLUE + "Loading player achievements..." + Style.RESET_ALL)
-            elif selected == 7:
-                # print(Fore.RED + "Exiting the game. Goodbye!" + Style.RESET_ALL)
-                # time.sleep(1)
-                # exit()
-                pass
-            time.sleep(1)
-            return selected
-        if selected == 0:  # "selected" becomes 0 when at "7. Quit" due to the modulo operation with "total_options"
-            selected = 7  # We do a reassignment here to reflect the correct index at "show_menu()"
+    def write(self, text, style=None):
+        """
+        Adds text to the current frame, preceded by style if it differs from the last style written
+        """
+        if style is not None and style != self.style:
+            self.parts.append(style)
+            self.style = style
+        self.parts.append(text)
 
+    def resetStyle(self):
+        """
+        Forgets the last style written, to be called after something else changed the terminal colors
+        """
+        self.style = None
 
-def select_difficulty():
-    """
-    Allows the user to select a difficulty level for the game.
-    The user can navigate between difficulty options using the up and down
-    arrow keys and select one using the Enter key.
+    def flush(self):
+        """
+        Writes the current frame to the terminal in one write
+        """
+        if not self.parts:
+            return
+        data = ''.join(self.parts)
+        self.parts.clear()
+        sys.stdout.write(data)
+        sys.stdout.flush()
 
-    Arguments: None
+        if self.statsFile:
+            if self.screen != screenGeneration:
+                self.endScreen()
+            self.screenBytes += len(data.encode('utf-8'))
+            self.screenWrites += 1
 
-    Returns: diff_level (int): An integer (4, 6, or 8)corresponding to the difficulty level chosen by the user
-    """
+    def frames(self, text, delay):
+        """
+        Splits text into the pieces typed during one frame when typing a character every delay seconds
 
-    difficulties = {"Casual (4x4 Board)":4, "Serious (6x6 Board)":6, "Challenging (8x8 Board)":8}
-    selected = 0  # Default selection is "Casual"
-    total_options = len(difficulties)
+        Parameters:
+            text (str): Text to type
+            delay (float): Delay between each character (seconds)
 
-    while True:
-        clearScreen()
-        print(Fore.CYAN + "=" * 50)
-        print(" ")
-        print(Fore.BLUE + Figlet(font="straight").renderText(f" SELECT DIFFICULTY")) # Alternative font style
-        print(Fore.CYAN + "=" * 50 + Style.RESET_ALL)
-        print(" ")
- 
-        for index, difficulty in enumerate(difficulties.keys()):
-            if index == selected:
-                print(Fore.GREEN + f"--> {index + 1}. {difficulty}" + Style.RESET_ALL)
-            else:
-                print(Fore.WHITE + f"    {index + 1}. {difficulty}" + Style.RESET_ALL)
-        print(" ")
-        print(Fore.YELLOW + "Use ↑/↓ to navigate and Enter to select." + Style.RESET_ALL)
-
-        key = getch()  # Get key input
-        if key in [b'\x00', b'\xe0']: # If getch is defined on Windows, these either prefix represents arrow keys
-            key += msvcrt.getch() # Another call to getch will capture the suffix (b'H' or b'P')
-
-        if key in [b'\x00H', b'\xe0H', "\x1b[A"]: # Up arrow key
-            selected = (selected - 1) % total_options  # Wrap around if at the top
-        elif key in [b'\x00P', b'\xe0P', "\x1b[B"]: # Down arrow key
-            selected = (selected + 1) % total_options  # Wrap around if at the bottom
-        elif key in [b'\r', "\r"]:  # Enter key
-
-            # Converts key values into a list then indexed with the current "select" value.
-            # The resulting lookup maps to the corresponding diff. level (4, 6, or 8)
-            diff_level = difficulties[list(difficulties.keys())[selected]]
-            return diff_level
-        
+        Returns:
+            Generator of strings
+        """
+        step = max(1, int(self.frameInterval / delay)) if delay > 0 else max(1, len(text))
+        for i in range(0, len(text), step):
+            yield text[i:i + step]
 
-def mainMenu():
-    animated_header()
-    return handle_menu()
+    def endScreen(self):
+        """
+        Appends the counts of the screen that just ended to the stats file and starts counting the next screen
+        """
+        if self.statsFile and self.screenWrites:
+            newFile = not os.path.exists(self.statsFile)
+            with open(self.statsFile, 'a', newline='') as file:
+                writer = csv.writer(file)
+                if newFile:
+                    writer.writerow(['Screen', 'Bytes', 'Writes'])
+                writer.writerow([self.screen, self.screenBytes, self.screenWrites])
+        self.screen = screenGeneration
+        self.screenBytes = 0
+        self.screenWrites = 0
 
 
-def clearScreen():
-    """
-    Clears the terminal screen
-    """
-    os.system('cls' if os.name == 'nt' else 'clear')
+# Set MEMORY_LOW_BANDWIDTH=1 for slow connections and MEMORY_FRAME_STATS=<file> to record the output per screen
+frameBuffer = FrameBuffer(os.environ.get('MEMORY_LOW_BANDWIDTH') == '1', os.environ.get('MEMORY_FRAME_STATS'))
+atexit.register(frameBuffer.endScreen)
 
 
 def welcomeScreen(currentName):
@@ -781,23 +1616,23 @@ def welcomeScreen(currentName):
     if response == "Z":
         clearScreen()
         text_effect("Hello....ummmm... what is your name again?", Fore.CYAN, delay=0.05)
-        time.sleep(.5)
+        animationClock.sleep(.5)
         text_effect_input("You forgot my name? I told you awhile back", Fore.GREEN)
         clearScreen()
         text_effect(f"That's right.. you are {currentName}. Pardon my memory.", Fore.CYAN, delay=0.05)
-        time.sleep(.5)
+        animationClock.sleep(.5)
         text_effect_input("No problem :)", Fore.GREEN)
         clearScreen()
         text_effect("For you to not end up like me who forget everything, I'll teleport you to MemoryLand.", Fore.CYAN, delay=0.05)
-        time.sleep(.5)
+        animationClock.sleep(.5)
         text_effect_input("What is that place?", Fore.GREEN)
         clearScreen()
         text_effect("It's a place where you can play a game Test Your Memory", Fore.CYAN, delay=0.05)
-        time.sleep(.5)
+        animationClock.sleep(.5)
         text_effect_input("That's cool! Can you give more details?", Fore.GREEN)
         clearScreen()
         text_effect(f"Sorry. I won't hold you off much longer. Good bye {currentName}!", Fore.CYAN, delay=0.05)
-        time.sleep(.5)
+        animationClock.sleep(.5)
         text_effect_input("No wait I'm not ready yet! I'm not even sure I want to go there!", Fore.GREEN)
         clearScreen()
         text_effect(f"Teleporting to MemoryLand.........", Fore.RED, delay=0.1)        
@@ -805,7 +1640,7 @@ def welcomeScreen(currentName):
         text_effect(f"Your Destination 📍:", Fore.RED, delay=0.1) 
         print("")
         text_effect(f"MemoryLand 🧠", Fore.RED, delay=0.2) 
-        time.sleep(1)       
+        animationClock.sleep(1)       
     elif response == "X":
         clearScreen()
         text_effect(f"Teleporting to MemoryLand.........", Fore.RED, delay=0.05)        
@@ -813,14 +1648,14 @@ def welcomeScreen(currentName):
         text_effect(f"Your Destination 📍:", Fore.RED, delay=0.1) 
         print("")
         text_effect(f"MemoryLand 🧠", Fore.RED, delay=0.2) 
-        time.sleep(1)      
+        animationClock.sleep(1)      
 
     print(Style.RESET_ALL)
     clearScreen()  # Clear the screen
     # text_effect("************************", Fore.RED, delay=0.01)
     # text_effect("*Test Your Memory Game *", Fore.RED, delay=0.01)
     # text_effect("************************", Fore.RED, delay=0.01)
-    f = figlet_format("   Memory Port", font="doom")
+    f = renderBanner("   Memory Port", "doom")
     text_effect(f, Fore.CYAN, delay=.0002)
     clearScreen() 
     text_effect(f, Fore.GREEN, delay=.0002)
@@ -845,7 +1680,7 @@ def welcomeScreen(currentName):
     text_effect("Match all the pairs with the fewest moves possible!", Fore.RED, delay=0.02)
     print()
     text_effect("Press Enter to start the game...", Fore.GREEN, delay=.02)
-    input()
+    inputLine()
 
 
 def congratsScreen(currentName, score, n):
@@ -853,7 +1688,7 @@ def congratsScreen(currentName, score, n):
     Displays a congratulation screen
     """
     clearScreen()  # Clear the screen
-    f = figlet_format("Congratulations !", font="standard")
+    f = renderBanner("Congratulations !", "standard")
     text_effect(f, Fore.GREEN, delay=.001)    
     text_effect(f"Well done, {currentName} !", Fore.BLUE, delay=.001)    
     text_effect(f"You conquered the arena and was able to Test your memory and your final score is....", Fore.BLUE, delay=.04)
@@ -864,62 +1699,26 @@ def congratsScreen(currentName, score, n):
     print("")
 
     if isAddedToLeaderboard(score, n):
-        time.sleep(2)
+        animationClock.sleep(2)
         text_effect("Wow you also got an amazing feat 🥳", Fore.YELLOW, delay=.02)
-        time.sleep(1)
+        animationClock.sleep(1)
         text_effect("You've reached the leaderboard! 🏆", Fore.BLUE, delay=.02)  
         print("")
-        time.sleep(1)
+        animationClock.sleep(1)
         text_effect("Visit the Hall Of Fame to see your name! 🔥", Fore.RED, delay=.02)
-    time.sleep(1.5)  
+    animationClock.sleep(1.5)  
     print("")
     text_effect("Keep playing to improve your memory!", Fore.GREEN, delay=.01)
     print()
     text_effect_input("Press Enter to continue...", Fore.GREEN, delay=.01)
 
 
-def totalMovesToScore(totalMoves,n):
-    """
-    Converts total moves to score
-
-    Parameters:
-        totalMoves (int): Total moves by the user
-        size (n): size of the board
-    Returns:
-        score (int): Score by the user    
-    """
-    #if totalMoves is calculated by counting the number of moves a player makes, regardless of whether the moves result in a correct match or not
-    #1 pair = 2 moves
-
-    min_possible_moves_actual = (n * n) #minimum moves to get all correct combinations (if 1 pair = 2 moves)
-    buffer=int(0.2*n*n) #allowing some mistakes, changes with n
-    if buffer%2!=0:
-        buffer+=1
-    min_possible_moves_theoretical= min_possible_moves_actual+buffer
-
-    if n < 4:
-        # Custom max_score formula for small grids
-        multiplier = 200 * n
-    else:
-        # Normalized max_score for n >= 4
-        # 4x4=2000, 6x6=4000, 8x8=7000
-        multiplier = math.ceil((n * n) / 10) * 1000
-
-    # display maximum score while total moves are less than or equal to minimum possible moves
-    if totalMoves<=min_possible_moves_theoretical:
-        return multiplier
-    else:
-        move_penalty=(totalMoves/min_possible_moves_theoretical) #more moves, more penalty
-    score = (min_possible_moves_theoretical / totalMoves) * multiplier / move_penalty
-    # score decreases as number of moves increases (beyond the minimum possible moves)
-    return score
-
-
 def recordGameLog(currentName, score, n):
     """
-    Stores completed game data into a csv file with columns [id, name, score, gameType, date completed]
+    Stores completed game data into the game log (entries [id, name, score, gameType, date completed])
 
-    If game log file does not exist, create one and add the first entry
+    With the default storage the entry is appended to gamelog/gamelog.csv (created with a header if it doesn't
+    exist), so recording a game costs the same however long the log is (see FileStorage.recordGame).
 
     Parameters:
         currentName (str): Current username of the player
@@ -932,70 +1731,7 @@ def recordGameLog(currentName, score, n):
     # Get current date - to be added in the log
     today = date.today()
 
-    # Get current path
-    currentPath = os.path.dirname(os.path.abspath(__file__))
-
-    # Specify game log folder path
-    folderpath = './gamelog'
-
-    # Specify game log file path
-    filepath = os.path.join(currentPath, 'gamelog/gamelog.csv')
-
-   # CASE 1: Folder and csv file does not exist
-    if not os.path.exists(folderpath):
-
-        # Create folder
-        os.mkdir('gamelog')
-
-        # Check if file exists (NOTE: This is a redundant check)
-        if not os.path.isfile(filepath):
-
-            # Create csv file
-            file = open(filepath, "w")
-            id = 1
-            file.write(f"ID,Name,Score,GameType,Date\n")
-            file.write(f"{id},{currentName},{score},{n},{today}\n")
-            file.close()
-
-    # CASE 2: CSV Folder already exist 
-    else:
-
-        # CASE 2a: File does not exist
-        if not os.path.isfile(filepath):
-
-            # Create csv file
-            file = open(filepath, "w")
-            id = 1
-            file.write(f"ID,Name,Score,GameType,Date\n")
-            file.write(f"{id},{currentName},{score},{n},{today}\n")
-            file.close()
-
-        # CASE 2b: File already exist
-        else:
-
-            # Open CSV File
-            df = pd.read_csv(filepath)
-            
-            # Special Case: User emptied the game log via deletion of users with existing log
-            if df.empty:
-
-                df.loc[len(df)] = [1, currentName, score, n, today]
-
-                # Save to csv
-                df.to_csv(filepath, index=False)
-
-            # General Case: A log already exist in the gamelog.csv file
-            else:
-
-                # Get ID of newest game log entry
-                lastRow = list(df.iloc[-1]) # Gets the last row
-                nextID = int(lastRow[0]) + 1 # Gets the index of new entry
-
-                # Add new entry to dataframe
-                df.loc[len(df)] = [nextID, currentName, score, n, today]
-
-                # Save to csv
-                df.to_csv(filepath, index=False)
+    gameStorage.recordGame(currentName, score, n, today)
 
 
 def loadRecentUserName():
@@ -1008,91 +1744,42 @@ def loadRecentUserName():
         userName (str): Current username of the player
     """
 
-    currentPath = os.path.dirname(os.path.abspath(__file__))
-    # Specify name log folder path
-    folderpath = './name'
-    # Specify name log file path
-    filepath1 = os.path.join(currentPath, 'name/currentname.txt') 
-  # CASE 1: Folder and csv file does not exist
-    if not os.path.exists(folderpath):
-
-        # Create folder
-        os.mkdir('name')
-
-        # Check if file exists (NOTE: This is a redundant check)
-        if not os.path.isfile(filepath1):
-            text_effect("Hey you!", Fore.GREEN, delay=.05)
-            text_effect("Who.. me?", Fore.RED, delay=.05)
-            input()
-            clearScreen()
-            text_effect("Yes you!!!", Fore.GREEN, delay=.05)
-            text_effect("Are you the new kid in town? It's tradition new kids got to tell their name", Fore.GREEN, delay=.05)
-            input()
-            clearScreen()
-            text_effect("Do I have a choice?....", Fore.RED, delay=.05)
-            text_effect("No exemptions kid, got to tell your name. I don't make the rules.", Fore.GREEN, delay=.05)
-            input()
-            clearScreen()
-            while True:
-                userName = str(text_effect_input("Please enter your name: ", Fore.RED, delay=.03))
-                if len(userName) not in range (3,16):
-                    text_effect("Stop fooling around names are only between 3 and 15 characters long!", Fore.GREEN, delay=.02)
-                    time.sleep(.5)
-                    clearScreen()
-                    continue
-                else:
-                    text_effect(f"Thanks for the name kid... I mean... {userName}! See you around!", Fore.GREEN)
-                    time.sleep(1)
-                    clearScreen()
-                    break 
-            # Create csv file
-            file1 = open(filepath1, "w")
-            file1.write(userName)
-            file1.close()
+    # CASE 1: A user name was set before
+    userName = gameStorage.currentName()
+    if userName is not None:
         return userName
-    # CASE 2: Folder already exist 
-    else:
-
-        # CASE 2a: File does not exist
-        if not os.path.isfile(filepath1):
 
-            text_effect("Hey you!", Fore.GREEN, delay=.05)
-            text_effect("Who.. me?", Fore.RED, delay=.05)
-            input()
-            clearScreen()
-            text_effect("Yes you!!!", Fore.GREEN, delay=.05)
-            text_effect("Are you the new kid in town? It's tradition new kids got to tell their name.", Fore.GREEN, delay=.05)
-            input()
-            clearScreen()
-            text_effect("Do I have a choice?....", Fore.RED, delay=.05)
-            text_effect("No exemptions kid, got to tell your name. I don't make the rules.", Fore.GREEN, delay=.05)
-            input()
+    # CASE 2: New player
+    text_effect("Hey you!", Fore.GREEN, delay=.05)
+    text_effect("Who.. me?", Fore.RED, delay=.05)
+    inputLine()
+    clearScreen()
+    text_effect("Yes you!!!", Fore.GREEN, delay=.05)
+    text_effect("Are you the new kid in town? It's tradition new kids got to tell their name", Fore.GREEN, delay=.05)
+    inputLine()
+    clearScreen()
+    text_effect("Do I have a choice?....", Fore.RED, delay=.05)
+    text_effect("No exemptions kid, got to tell your name. I don't make the rules.", Fore.GREEN, delay=.05)
+    inputLine()
+    clearScreen()
+    while True:
+        userName = str(text_effect_input("Please enter your name: ", Fore.RED, delay=.03))
+        if len(userName) not in range (3,16):
+            text_effect("Stop fooling around names are only between 3 and 15 characters long!", Fore.GREEN, delay=.02)
+            animationClock.sleep(.5)
             clearScreen()
-            while True:
-                userName = str(text_effect_input("Please enter your name: ", Fore.RED, delay=.03))
-                if len(userName) not in range (3,16):
-                    text_effect("Stop fooling around names are only between 3 and 15 characters long!", Fore.GREEN, delay=.02)
-                    time.sleep(.5)
-                    clearScreen()
-                    continue
-                else:
-                    text_effect(f"Thanks for the name kid... I mean... {userName}! See you around!", Fore.GREEN)
-                    clearScreen()
-                    break 
-            # Create csv file
-            file1 = open(filepath1, "w")
-            file1.write(userName)
-            file1.close()
-            return userName
-
-        # CASE 2b: File already exist
+            continue
         else:
-            if os.path.isfile(filepath1):
-                file1 = open(filepath1, "r")
-                userName = file1.readline()
-                return userName
+            text_effect(f"Thanks for the name kid... I mean... {userName}! See you around!", Fore.GREEN)
+            animationClock.sleep(1)
+            clearScreen()
+            break 
+    # Store the name
+    gameStorage.setCurrentName(userName)
+    return userName
             
 
+@animated
 def flash_text(text, delay=0.1, flash_count=5):
     """
     Print text with a randomized flashing effect.
@@ -1102,18 +1789,44 @@ def flash_text(text, delay=0.1, flash_count=5):
     """
     COLORS = [Fore.RED, Fore.GREEN, Fore.BLUE, Fore.YELLOW, Fore.CYAN, Fore.MAGENTA, Fore.WHITE]
 
+    # Flashing rewrites the whole line every frame, so slow connections only wait for the same time
+    if frameBuffer.lowBandwidth:
+        animationClock.sleep(2 * delay * flash_count)
+        flash_count = 0
+
+    frameBuffer.resetStyle()
     for _ in range(flash_count):
+        if animationClock.skipping:
+            break
         color = random.choice(COLORS)
-        sys.stdout.write(f"\r{color}{Style.BRIGHT}{text}")  # Flash the text in a random color
-        sys.stdout.flush()
-        time.sleep(delay)
-        sys.stdout.write("\r" + " " * len(text))  # Clear the line
-        sys.stdout.flush()
-        time.sleep(delay)
+        frameBuffer.write("\r")
+        frameBuffer.write(text, color + Style.BRIGHT)  # Flash the text in a random color
+        frameBuffer.flush()
+        animationClock.sleep(delay)
+        frameBuffer.write("\r" + " " * len(text))  # Clear the line
+        frameBuffer.flush()
+        animationClock.sleep(delay)
    
     print(f"{Fore.MAGENTA}{Style.BRIGHT}{text}")     # Display the text permanently
 
 
+def typeText(text, color, delay):
+    """
+    Types text one frame at a time (see FrameBuffer), or all at once if the animation is skipped or turned off
+    text: Text to display.
+    color: Color of the text.
+    delay: Delay between each character (seconds).
+    """
+    with animationClock.animation():
+        frameBuffer.resetStyle()
+        for chunk in frameBuffer.frames(text, animationClock.scaled(delay)):
+            frameBuffer.write(chunk, color + Style.BRIGHT)
+            if not animationClock.skipping:
+                frameBuffer.flush()
+                animationClock.sleep(delay * len(chunk))
+        frameBuffer.flush()
+
+
 def text_effect(text, color=Fore.WHITE, delay=0.05):
     """
     Simulates typing effect for a given text.
@@ -1121,10 +1834,7 @@ def text_effect(text, color=Fore.WHITE, delay=0.05):
     color: Color of the text.
     delay: Delay between each character (seconds).
     """
-    for char in text:
-        sys.stdout.write(f"{color}{Style.BRIGHT}{char}")
-        sys.stdout.flush()
-        time.sleep(delay)
+    typeText(text, color, delay)
     print()  # Move to the next line
 
 
@@ -1179,36 +1889,17 @@ def instructionsScreen():
 
 def updateGameLog(currentNameList):
     """
-    If a user is deleted, this function updates the game log file (deletes all log entries of deleted user)
-    After updating, reorganizes the log such that there are no empty rows
+    If a user is deleted, this function updates the game log (deletes all log entries of deleted user)
+
+    With the default storage the csv file is rewritten without those entries, while holding the game log
+    lock and in one step (see FileStorage.deletePlayers)
 
     Parameters:
         currentNameList (list): List containing all names of created users
     Returns:
-        None (only updates the game log file)   
+        None (only updates the game log)   
     """
-
-    # Store gamelog.csv as a Pandas DataFrame
-    game_log = pd.read_csv(r"gamelog/gamelog.csv")
-
-    # Convert the "Name" column (a pd.Series object) to a set 
-    unique_names_in_log = set(game_log["Name"])
-
-    # Convert "currentNameList" to another set
-    unique_names_in_list = set(currentNameList)
-
-    # Check for discrepancies using the minus operator for sets
-    name_discrepancy = list(unique_names_in_log - unique_names_in_list)
-
-    for name in name_discrepancy:
-        # Drop rows where the "Name" column matches names in name_discrepancy
-        game_log = game_log.drop(game_log.loc[game_log["Name"] == name, :].index)
-
-    # Reset index so the DataFrame doesn't have index gaps after row removal
-    game_log.reset_index(drop=True, inplace=True)
-
-    # Save the updated DataFrame back to gamelog.csv
-    game_log.to_csv(r"gamelog/gamelog.csv", index=False)
+    gameStorage.deletePlayers(currentNameList)
 
 
 def setUserName():
@@ -1217,24 +1908,21 @@ def setUserName():
 
     After adding/deleting users or changing current user, it should reflect on updating the files containing usernames and current name
     """
-    userFile = "name/currentname.txt"
-    usersFile = "name/currentnamelist.csv"
+    from rich.console import Console
+    from rich.text import Text
 
-    # Note: userFile already confirmed to be existing     
-    with open(userFile, 'r') as currentUser:
-        for line in currentUser:
-            currentPlayer = line
+    # Note: current name already confirmed to be set
+    currentPlayer = getCurrentName()
 
-    # Just in case the playersList file is missing
-    if not os.path.isfile(usersFile):
-        with open(usersFile, 'w') as f:
-            f.write(f"{currentPlayer}")
+    # Just in case the players list is missing
+    if not getCurrentNameList():
+        gameStorage.setNameList([currentPlayer])
 
     while True:
         try:
             clearScreen()
 
-            f = figlet_format("memory camp", font="doom")
+            f = renderBanner("memory camp", "doom")
             text_effect(f, Fore.BLUE, delay=.001)    
             console = Console()
             text = Text.assemble(("                    "),("Test your memory ", "bold yellow overline underline"), ("with", "bold yellow overline underline"), (" friends!", "bold yellow overline underline"))
@@ -1256,20 +1944,16 @@ def setUserName():
             pass
 
     if option == 1:
-        updateNameFile(currentPlayer, userFile, usersFile, "change")
+        updateNameFile(currentPlayer, "change")
     elif option == 2:
-        updateNameListFile(currentPlayer, userFile, usersFile)
+        updateNameListFile(currentPlayer)
     elif option == 3:
 
-        # Specify game log file path
-        currentPath = os.path.dirname(os.path.abspath(__file__))
-        filepath = os.path.join(currentPath, 'gamelog/gamelog.csv') 
-
         # Update name file
-        updateNameFile(currentPlayer, userFile, usersFile, "delete")
+        updateNameFile(currentPlayer, "delete")
         
-        # Update game log if file exists
-        if not os.path.isfile(filepath):
+        # Update game log if it exists
+        if not gameStorage.hasGames():
             pass
         else:
             updateGameLog(getCurrentNameList())
@@ -1281,14 +1965,12 @@ def setUserName():
     return
 
 
-def updateNameFile(currentPlayer, userFile, usersFile, mode):
+def updateNameFile(currentPlayer, mode):
     """
-    Updates the "currentName.txt" file based on the currentUserName input
+    Changes the current player, or deletes a player from the players list
 
     Parameters:
         currentPlayer (str): Current username of the player
-        userFile: File containing name of current player
-        usersFile: File containing list of users
         mode: "change" or "delete" a player
 
     Returns:
@@ -1298,18 +1980,17 @@ def updateNameFile(currentPlayer, userFile, usersFile, mode):
     playerNum = 1
     playerList = {}   
 
-    # Retrieve the players list from csv
-    with open(usersFile, 'r') as usersList:
-        for user in usersList:
-            if user.strip() != currentPlayer:
-                playerList[playerNum] = user.strip()
-                playerNum += 1
+    # Retrieve the players list
+    for user in getCurrentNameList():
+        if user != currentPlayer:
+            playerList[playerNum] = user
+            playerNum += 1
     
     # If players list is empty, go back to main menu
     if len(playerList) == 0:
         clearScreen()
         text_effect("Looks like you're the only player \U0001F605", Fore.RED, delay=.002)
-        key = input("Press a Enter to continue")
+        key = inputLine("Press a Enter to continue")
         setUserName()
 
     else:
@@ -1334,8 +2015,7 @@ def updateNameFile(currentPlayer, userFile, usersFile, mode):
 
         if option > 0:
             if mode == "change":
-                with open(userFile, 'w') as f:
-                    f.write(playerList[option])
+                gameStorage.setCurrentName(playerList[option])
             else:
 
                 deletedPlayer = playerList[option]
@@ -1348,60 +2028,43 @@ def updateNameFile(currentPlayer, userFile, usersFile, mode):
                 if answer.lower() != "y":
                     clearScreen()
                     text_effect(f"No user is deleted.\n", Fore.GREEN, delay=.02)
-                    time.sleep(1)
+                    animationClock.sleep(1)
                     setUserName()
 
                 clearScreen()
                 text_effect(f"User {deletedPlayer} is Forgotten\n", Fore.RED, delay=.02)
-                time.sleep(1)
+                animationClock.sleep(1)
 
                 del playerList[option]
-                with open(usersFile, 'w') as f:
-                    for v in playerList.values():
-                        f.write(f"{v}\n")
-                    f.write(currentPlayer)
-
-                # SECTION: Delete saved files if deleted player is the player in the saved files
-
-                # Get current path
-                currentPath = os.path.dirname(os.path.abspath(__file__))
+                gameStorage.setNameList(list(playerList.values()) + [currentPlayer])
 
-                # Specify game log file path
-                filepath = os.path.join(currentPath, 'savefiles/username.pkl')
+                # SECTION: Delete saved game if deleted player is the player in the saved game
 
-                # Check if savefiles/userName exists:
-                if os.path.isfile(filepath):
-                    with open("savefiles/userName.pkl", "rb") as file:
-                        savedPlayerName = pickle.load(file)  # Load the userName
+                # Check if there is a saved game:
+                if gameStorage.hasSave():
+                    savedPlayerName = gameStorage.loadGame(['userName'])['userName']  # Load the userName
 
-                        # Delete saved board if deleted player is the same as saved name
-                        if deletedPlayer == savedPlayerName:
-                            deleteBoard()
+                    # Delete saved board if deleted player is the same as saved name
+                    if deletedPlayer == savedPlayerName:
+                        deleteBoard()
         
         setUserName()
 
     return
 
-def updateNameListFile(currentPlayer, userFile, usersFile):
+def updateNameListFile(currentPlayer):
 
     """
-    Adds a new user to the currentNameList file
+    Adds a new user to the players list (and makes them the current player)
 
     Parameters:
         currentPlayer (str): Current username of the player
-        userFile: File containing name of current player
-        usersFile: File containing list of users
 
     Returns:
         None
     """
 
-    playerList = []
-
-    with open(usersFile, 'r') as usersList:
-        for user in usersList:
-            user = user.strip()
-            playerList.append(user)
+    playerList = getCurrentNameList()
 
     clearScreen()
 
@@ -1410,9 +2073,9 @@ def updateNameListFile(currentPlayer, userFile, usersFile):
         key = text_effect_input("\nPress press Enter to continue", Fore.CYAN, delay=.002)       
 
     else:
-        text_effect(figlet_format("⚔️ HERE COMES A NEW 🛡️", font = "cybermedium" ) , Fore.RED, delay=.002)
-        text_effect(figlet_format("CHALLENGER!", font = "big" ) , Fore.GREEN, delay=.001)
-        time.sleep(.5)
+        text_effect(renderBanner("⚔️ HERE COMES A NEW 🛡️", "cybermedium") , Fore.RED, delay=.002)
+        text_effect(renderBanner("CHALLENGER!", "big") , Fore.GREEN, delay=.001)
+        animationClock.sleep(.5)
 
         while True:
             clearScreen()
@@ -1420,16 +2083,13 @@ def updateNameListFile(currentPlayer, userFile, usersFile):
 
             if len(challenger) not in range(3, 16):
                 text_effect("\nMinimum of 3 characters and Maximum of 15 characters only", Fore.RED, delay=.02)
-                time.sleep(1)
+                animationClock.sleep(1)
             else:
                 break
 
         if challenger not in playerList:
-            with open(userFile, 'w') as f:
-                f.write(challenger)
-
-            with open(usersFile, 'a') as f:
-                f.write(f"\n{challenger}")
+            gameStorage.setCurrentName(challenger)
+            gameStorage.setNameList(playerList + [challenger])
             
         else:
             text_effect("\nName already exists!", Fore.RED, delay=.002)
@@ -1443,7 +2103,7 @@ def updateNameListFile(currentPlayer, userFile, usersFile):
 def getCurrentName():
     """
     Helper function: 
-    Reads and returns current user name from file
+    Reads and returns current user name from the storage
     
     Parameters:
         None
@@ -1451,10 +2111,7 @@ def getCurrentName():
         currentUserName (str): Current username of the player     
     """
     
-    currentNameFile = "name/currentname.txt"
-
-    with open(currentNameFile, "r") as currentNameText:
-        currentUserName = currentNameText.readline().strip()
+    currentUserName = gameStorage.currentName()
     
     return currentUserName
 
@@ -1462,7 +2119,7 @@ def getCurrentName():
 def getCurrentNameList():
     """
     Helper function:
-    Reads and returns current name list from file
+    Reads and returns current name list from the storage
     
     Parameters:
         None
@@ -1470,12 +2127,7 @@ def getCurrentNameList():
         currentNameList (list): List containing all names of created users    
     """
     
-    currentListFile = "name/currentnamelist.csv"
-
-    with open(currentListFile, "r") as currentListCSV:
-        currentNameList = []
-        for name in currentListCSV:
-            currentNameList.append(name.strip())
+    currentNameList = gameStorage.nameList()
 
     return currentNameList
 
@@ -1485,16 +2137,18 @@ def encryptBoard(assignmentBoard):
     Returns an encrypted assignment board and key used for encryption
 
     Parameters:
-        assignmentBoard (list): multidimensional list of size n x n containing the assignments
+        assignmentBoard (AssignmentBoard): assignment board of size n x n
     Returns:
         encryptedBoard (list): version of assignment board where every element is encrypted
         key: key object generated during encryption / to be used for decryption  
     """
+    from cryptography.fernet import Fernet
+
     key = Fernet.generate_key()
     fernet = Fernet(key)
 
     encryptedBoard = []
-    for row in assignmentBoard:
+    for row in assignmentBoard.toList():
         encryptRow = [fernet.encrypt(cell.encode()) for cell in row]
         encryptedBoard.append(encryptRow)
     return encryptedBoard, key
@@ -1510,6 +2164,8 @@ def decryptBoard(encryptedBoard, key):
     Returns:
         assignmentBoard (list): multidimensional list of size n x n containing the assignments
     """
+    from cryptography.fernet import Fernet
+
     fernet = Fernet(key)
 
     decryptedBoard = []
@@ -1521,35 +2177,26 @@ def decryptBoard(encryptedBoard, key):
 
 def saveBoard(encryptedBoard, stateBoard, currentSelection, totalMoves, key):
     """
-    Exports the assignment board, state board, current selection and total moves to a file that could be loaded for later use
+    Exports the assignment board, state board, current selection and total moves to the storage, to be loaded for later use
     
     Parameters:
         encryptedBoard (list): multidimensional list of size n x n containing the assignments (encrypted)
-        stateBoard (list): multidimensional list of size n x n containing the state
+        stateBoard (StateBoard): state board of size n x n
         currentSelection (list): list containing the 2 currently selected cards of the player
         totalMoves (int): total moves by the user
         key: object used to encrypt/decrypt assignment board
     Returns:
         None
     """
-    # Part 0: Getting file paths
-
-    # Create savefiles directory if it doesn't exist
-    os.makedirs("savefiles", exist_ok=True)
-
-    # Save data to files using pickle
-    with open("savefiles/assignmentBoard.pkl", "wb") as file:
-        pickle.dump(encryptedBoard, file)  # Save the assignment board
-    with open("savefiles/stateBoard.pkl", "wb") as file:
-        pickle.dump(stateBoard, file)  # Save the state board
-    with open("savefiles/currentSelection.pkl", "wb") as file:
-        pickle.dump(currentSelection, file)  # Save the current selection
-    with open("savefiles/totalMoves.pkl", "wb") as file:
-        pickle.dump(totalMoves, file)  # Save the total moves
-    with open("savefiles/key.pkl", "wb") as file:
-        pickle.dump(key, file)  # Save the total moves
-    with open("savefiles/userName.pkl", "wb") as file:
-        pickle.dump(getCurrentName(), file)  # Save user of the board
+    # Save data to the storage (pickled, one part each)
+    gameStorage.saveGame({
+        'assignmentBoard': encryptedBoard,  # Save the assignment board
+        'stateBoard': stateBoard.toList(),  # Save the state board (as a list of lists of booleans)
+        'currentSelection': currentSelection,  # Save the current selection
+        'totalMoves': totalMoves,  # Save the total moves
+        'key': key,  # Save the key
+        'userName': getCurrentName(),  # Save user of the board
+    })
 
 
 def loadBoard():
@@ -1560,30 +2207,23 @@ def loadBoard():
     Parameters:
         None
     Returns:
-        assignmentBoard (list): multidimensional list of size n x n containing the assignments
-        stateBoard (list): multidimensional list of size n x n containing the state
+        assignmentBoard (AssignmentBoard): assignment board of size n x n
+        stateBoard (StateBoard): state board of size n x n
         currentSelection (list): list containing the 2 currently selected cards of the player
         totalMoves (int): total moves by the user
         currentName (str): Current username of the player
     """
-    # Part 0: Getting file paths
-
-    # Open and load data from files using pickle
-    with open("savefiles/assignmentBoard.pkl", "rb") as file:
-        encryptedBoard = pickle.load(file)  # Load the assignment board
-    with open("savefiles/stateBoard.pkl", "rb") as file:
-        stateBoard = pickle.load(file)  # Load the state board
-    with open("savefiles/currentSelection.pkl", "rb") as file:
-        currentSelection = pickle.load(file)  # Load the current selection
-    with open("savefiles/totalMoves.pkl", "rb") as file:
-        totalMoves = pickle.load(file)  # Load the total moves
-    with open("savefiles/key.pkl", "rb") as file:
-        key = pickle.load(file)  # Load the key
-    with open("savefiles/userName.pkl", "rb") as file:
-        currentName = pickle.load(file)  # Load the userName
+    # Load data from the storage
+    saved = gameStorage.loadGame()
+    encryptedBoard = saved['assignmentBoard']  # Load the assignment board
+    stateBoard = StateBoard.fromList(saved['stateBoard'])  # Load the state board
+    currentSelection = saved['currentSelection']  # Load the current selection
+    totalMoves = saved['totalMoves']  # Load the total moves
+    key = saved['key']  # Load the key
+    currentName = saved['userName']  # Load the userName
 
     # Decrypt the encrypted assignment board
-    assignmentBoard = decryptBoard(encryptedBoard, key)
+    assignmentBoard = AssignmentBoard.fromList(decryptBoard(encryptedBoard, key))
 
     # Return the loaded data
     return assignmentBoard, stateBoard, currentSelection, totalMoves, currentName 
@@ -1591,20 +2231,14 @@ def loadBoard():
 
 def deleteBoard():
     """
-    Deletes data in save files (to be called after finishing the resumed load game)
+    Deletes the saved game (to be called after finishing the resumed load game)
 
     Parameters:
         None
     Returns:
         None
     """
-    toBeDeletedPath = ["savefiles/assignmentBoard.pkl", "savefiles/stateBoard.pkl",
-                       "savefiles/currentSelection.pkl", "savefiles/totalMoves.pkl",
-                       "savefiles/userName.pkl", "savefiles/key.pkl"]
-    
-    for path in toBeDeletedPath:
-        if os.path.exists(path):
-            os.remove(path)
+    gameStorage.deleteSave()
 
 
 def text_effect_input(text, color=Fore.WHITE, delay=0.05):
@@ -1613,11 +2247,12 @@ def text_effect_input(text, color=Fore.WHITE, delay=0.05):
     text: Text to display.
     color: Color of the text.
     delay: Delay between each character (seconds).
+    In a terminal the answer can be typed while the prompt is still being typed (see promptLine).
     """
-    for char in text:
-        sys.stdout.write(f"{color}{Style.BRIGHT}{char}")
-        sys.stdout.flush()
-        time.sleep(delay)
+    if sys.stdin.isatty():
+        return asyncio.run(promptLine(text, color, delay))
+
+    typeText(text, color, delay)
     value = input()  
     return value
 
@@ -1625,7 +2260,12 @@ def text_effect_input(text, color=Fore.WHITE, delay=0.05):
 def achievement():
     """
     Displays a table of "achievements"
+
+    The player's games are read summarized per game type (see Storage.playerStats)
     """
+    from rich.console import Console
+    from rich.table import Table
+
     currentName = getCurrentName()
 
     achievementDict = { 0:{'symbol':"🌱",'status':False,'name': "Seedling Memory (Womb)", 'message': "Memories are like seedlings, take care of them.", 'condition':"Play a single game"},
@@ -1640,70 +2280,64 @@ def achievement():
                         9:{'symbol':"🎲",'status':False,'name': "Dice Memory (Future)", 'message': "Memories are like dice, there is uncertainty", 'condition':"Unlock first 9 achievements"}
     }
 
-    # Get current path
-    currentPath = os.path.dirname(os.path.abspath(__file__))
-
-    # Specify game log folder path
-    folderpath = './gamelog'
-
-    # Specify game log file path
-    filepath = os.path.join(currentPath, 'gamelog/gamelog.csv')    
-
-   # CASE 1: Folder and csv file does not exist
-    if not os.path.exists(folderpath):
-        if not os.path.isfile(filepath):
-            text_effect("The achievement screen is currently locked. Play a game to unlock your first memory stone.")
-            text_effect("Returning to main menu...")
-            time.sleep(3)
-            return None
+   # CASE 1: No game was recorded yet
+    if not gameStorage.hasGames():
+        text_effect("The achievement screen is currently locked. Play a game to unlock your first memory stone.")
+        text_effect("Returning to main menu...")
+        animationClock.sleep(3)
+        return None
     
-    # CASE 2: CSV file exist
+    # CASE 2: Game log exists
     else:
 
-        df = pd.read_csv(filepath)
-        # print(df)
+        # (games played, total score, best score) of the current player per game type
+        stats = gameStorage.playerStats(currentName)
+        totalGames = sum(gameStats[0] for gameStats in stats.values())
+        games = {size: stats.get(size, (0, 0, 0))[0] for size in (4, 6, 8)}
+        totalScore4x4 = stats.get(4, (0, 0, 0))[1]
+        bestScore = {size: stats.get(size, (0, 0, 0))[2] for size in (4, 6, 8)}
 
         # Achievement 0: Play a single game
-        if df[(df.Name == currentName)].shape[0] >= 1:
+        if totalGames >= 1:
             achievementDict[0]['status'] = True
 
         # Achievement 1: Complete 2 4x4 games
-        if df[(df.Name == currentName) & (df.GameType == 4)].shape[0] >= 2:
+        if games[4] >= 2:
             achievementDict[1]['status'] = True
 
         # Achievement 2: Complete 2 6x6 games
-        if df[(df.Name == currentName) & (df.GameType == 6)].shape[0] >= 2:
+        if games[6] >= 2:
             achievementDict[2]['status'] = True
 
         # Achievement 3: Complete 2 8x8 game
-        if df[(df.Name == currentName) & (df.GameType == 8)].shape[0] >= 2:
+        if games[8] >= 2:
             achievementDict[3]['status'] = True
 
         # Achievement 4: Accumulate 5000 points
         scoreTarget = 5000
-        if df[(df.Name == currentName) & (df.GameType == 4)]['Score'].sum() >= scoreTarget:
+        if totalScore4x4 >= scoreTarget:
             achievementDict[4]['status'] = True
 
         # Achievement 5: Reach a certain point in 4x4
         scoreTarget4x4 = 500
-        if df[(df.Name == currentName) & (df.GameType == 4) & (df.Score >= scoreTarget4x4)].shape[0] >= 1:
+        if bestScore[4] >= scoreTarget4x4:
             achievementDict[5]['status'] = True
 
         # Achievement 6: Reach a certain point in 6x6
         scoreTarget6x6 = 750
-        if df[(df.Name == currentName) & (df.GameType == 6) & (df.Score >= scoreTarget6x6)].shape[0] >= 1:
+        if bestScore[6] >= scoreTarget6x6:
             achievementDict[6]['status'] = True
 
         # Achievement 7: Reach a certain point in 8x8
         scoreTarget8x8 = 1000
-        if df[(df.Name == currentName) & (df.GameType == 8) & (df.Score >= scoreTarget8x8)].shape[0] >= 1:
+        if bestScore[8] >= scoreTarget8x8:
             achievementDict[7]['status'] = True
 
         # Achievement 8: Complete 13 games (3 games each game mode)
-        condition1 = df[df.Name == currentName].shape[0] >= 13 # Complete 13 games
-        condition2 = df[(df.Name == currentName) & (df.GameType == 4)].shape[0] >= 3 # Complete 3 games in 4x4 mode
-        condition3 = df[(df.Name == currentName) & (df.GameType == 6)].shape[0] >= 3 # Complete 3 games in 6x6 mode
-        condition4 = df[(df.Name == currentName) & (df.GameType == 8)].shape[0] >= 3 # Complete 3 games in 8x8 mode
+        condition1 = totalGames >= 13 # Complete 13 games
+        condition2 = games[4] >= 3 # Complete 3 games in 4x4 mode
+        condition3 = games[6] >= 3 # Complete 3 games in 6x6 mode
+        condition4 = games[8] >= 3 # Complete 3 games in 8x8 mode
 
         if condition1 and condition2 and condition3 and condition4:
             achievementDict[8]['status'] = True
@@ -1724,7 +2358,7 @@ def achievement():
             achievementDict[9]['status'] = True
 
     text_effect("################################################################", Fore.RED, delay=.001) 
-    f = figlet_format("MEMORYLAND TEMPLE", font="standard")
+    f = renderBanner("MEMORYLAND TEMPLE", "standard")
     text_effect(f, Fore.GREEN, delay=.001)    
     
 
@@ -1754,7 +2388,7 @@ def achievement():
 
     while True:
 
-        time.sleep(1)
+        animationClock.sleep(1)
 
         console = Console()
         console.print(table, style="bold #2471a3")
@@ -1780,28 +2414,28 @@ def achievement():
             text_effect(f"Faded memories return to me.. Thanks for this memory {currentName}... Hopefully it won't fade soon...", Fore.CYAN)
         elif totalUnlocked == 10:
             text_effect(f"Thank you for returning these things called memory... Test your memory {currentName}... my memory...", Fore.CYAN)
-            time.sleep(1)
+            animationClock.sleep(1)
             clearScreen()
             text_effect(f"Memory crisis resolution: I passed the test of my memory... No... you passed {currentName}.. ", Fore.CYAN)
-            time.sleep(1)
+            animationClock.sleep(1)
             clearScreen()
             text_effect(f"Reinforce your memory {currentName}, keep testing them...take care of them.... so you remember....", Fore.CYAN)
-            time.sleep(1)
+            animationClock.sleep(1)
             clearScreen()
             text_effect(f"This is the end... {currentName}... of test your memory....", Fore.CYAN)
-            time.sleep(1)
+            animationClock.sleep(1)
             clearScreen()      
             text_effect(f"No this is just the beginning.............", Fore.RED)      
-            time.sleep(1)
+            animationClock.sleep(1)
             clearScreen()  
             text_effect(f"Good bye... in 3........", Fore.RED)        
-            time.sleep(1)
+            animationClock.sleep(1)
             clearScreen()  
             text_effect(f"...................2", Fore.RED)       
-            time.sleep(1)
+            animationClock.sleep(1)
             clearScreen()   
             text_effect(f".......1.........", Fore.RED)    
-            time.sleep(2)
+            animationClock.sleep(2)
             clearScreen() 
             text_effect(f"M\n")   
             text_effect(f"Me\n")   
@@ -1821,7 +2455,7 @@ def achievement():
             text_effect(f"Memory complete\n")   
             clearScreen() 
             text_effect(f"Memory complete.\n", Fore.YELLOW)       
-            time.sleep(5)      
+            animationClock.sleep(5)      
             sys.exit()
 
         else:
@@ -1835,6 +2469,63 @@ def achievement():
         return 0
 
 
+def playRounds(game, currentName):
+    """
+    Terminal front end of a match: asks the player for cards and feeds them to the game engine until the board is solved
+
+    Parameters:
+        game (MemoryGame): Game engine holding the boards, current selection and total moves
+        currentName (str): Current username of the player
+    Returns:
+        None (returns once the game is over; exits the program on save/quit)
+    """
+
+    # Redraws only the cells that change between frames
+    renderer = BoardRenderer(game.n)
+
+    message = None  # Shown below the board until the next card is selected
+    typeahead = []  # Keys typed while a mismatched pair was shown
+
+    # Simulate a complete round (complete round - flipping 2 cards)
+    while not game.is_over():
+
+        selectedCard = False # Initialize selected card (for while loop entry)
+
+        # Selecting a card of the round
+        while selectedCard == False:
+            renderer.draw(game.assignmentBoard, game.stateBoard, game.currentSelection, message)
+            selectedCard = selectCard(game, typeahead)
+            typeahead = []
+        message = None
+
+        # Case: Save and exit game
+        if selectedCard is True:
+            encryptedBoard, key = encryptBoard(game.assignmentBoard)
+            saveBoard(encryptedBoard, game.stateBoard, game.currentSelection, game.totalMoves, key)
+            sys.exit()
+
+        # Case: Return to main menu
+        elif selectedCard == 'm':
+            main('skip') # Returns to main menu
+
+        # Flip the card (also updates total moves and checks for a match on the second card)
+        # The first card of the round is shown by the next draw, while the player picks the second one
+        matchFound = game.flip(selectedCard)
+
+        # Print indicator of whether the player has found a match (the pair stays on the board as solved)
+        if matchFound == True:
+            message = Fore.GREEN + "Match :)" + Style.RESET_ALL
+
+        # Show the mismatched pair until the deadline or the next keypress, which starts the next selection
+        elif matchFound == False:
+            renderer.draw(game.assignmentBoard, game.stateBoard, game.lastSelection)
+            typeahead = animationClock.waitForInput(REVEAL_SECONDS)
+
+    # Show the last pair before leaving the board
+    renderer.draw(game.assignmentBoard, game.stateBoard, game.currentSelection, message)
+    animationClock.sleep(1)
+
+
 def playGame(type=1):
     """
     Executes the logic of the game
@@ -1845,6 +2536,9 @@ def playGame(type=1):
     Returns:
         0 (int): Signal to return back to main menu after game is over
     """
+    from rich.console import Console
+    from rich.text import Text
+
 
      # Initialize name and mapping
     currentName = getCurrentName()
@@ -1854,7 +2548,7 @@ def playGame(type=1):
         n = select_difficulty()
         clearScreen()
 
-        f = figlet_format("MEMORY ARENA", font="starwars")
+        f = renderBanner("MEMORY ARENA", "starwars")
         text_effect(f, Fore.GREEN, delay=.0005) 
 
         console = Console()
@@ -1863,126 +2557,32 @@ def playGame(type=1):
         print()
         text_effect(f"Instead of selecting a card, you can press 'Q' to quit without saving or 'S' to save and quit the game", Fore.GREEN, .02) 
         text_effect(f"You can also press 'M' to return to main menu without saving", Fore.GREEN, .01)
-        time.sleep(4)
+        animationClock.sleep(4)
         print("")
         text_effect(f"Entering the arena......", Fore.GREEN, .08)
         print(Style.RESET_ALL) 
-        time.sleep(1)
+        animationClock.sleep(1)
         clearScreen()
 
-        # Initialize boards and game variables
-        ciMapDict = coordinateToIndexMap(n)
-        icMapDict = indexToCoordinateMap(n)
-        assignmentBoard = initialAssignment(n)
-        stateBoard = initialState(n)
-        totalMoves = 0 
-        currentSelection = []
-
-        gameRunning = True
-
-        # Simulate a complete round (complete round - flipping 2 cards)
-        while gameRunning:
-
-            selectedCard = False # Initialize selected card (for while loop entry)
-
-            # Selecting first card of the round
-            while selectedCard == False:
-                displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-                selectedCard = selectCard(stateBoard, currentSelection, icMapDict)
-                clearScreen()
-
-            # Case: Save and exit game
-            if selectedCard is True:
-                encryptedBoard, key = encryptBoard(assignmentBoard)
-                saveBoard(encryptedBoard, stateBoard, currentSelection, totalMoves, key)
-                sys.exit()
-            
-            # Case: Return to main menu
-            elif selectedCard == 'm':
-                main('skip') # Returns to main menu
-
-            # Add card to current selection
-            currentSelection.append(selectedCard)
-
-            displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-            time.sleep(1) # 2 seconds delay
-            clearScreen()
-
-            # Update total moves
-            totalMoves += 1            
-
-            selectedCard = False # Initialize selected card (for while loop entry)
-
-            # Selecting second card of the round
-            while selectedCard == False:
-                displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-                selectedCard = selectCard(stateBoard, currentSelection, icMapDict)
-                clearScreen()            
-
-            # Case: Save and exit game
-            if selectedCard is True:
-                encryptedBoard, key = encryptBoard(assignmentBoard)
-                saveBoard(encryptedBoard, stateBoard, currentSelection, totalMoves, key)
-                sys.exit()
-
-            # Case: Return to main menu
-            elif selectedCard == 'm':
-                main('skip') # Returns to main menu
-
-            # Add card to current selection
-            currentSelection.append(selectedCard)
-
-            displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-            time.sleep(2) # 2 seconds delay
-            clearScreen()
-
-            # Update total moves
-            totalMoves += 1            
-
-            # Check if current selection matches or not and update if necessary
-            stateBoard, matchFound = checkMatchUpdateBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-
-            # Print indicator of whether the player has found a match
-            if matchFound == True:
-                print(Fore.GREEN + "Match :)" + Style.RESET_ALL)
-                time.sleep(1)
-                clearScreen()
-            else:
-                pass
+        # Initialize a new game
+        game = MemoryGame(n)
 
-            # Clear current selection of cards
-            currentSelection.pop()
-            currentSelection.pop()
+        playRounds(game, currentName)
 
-            # Check if game is over
-            if gameOver(stateBoard) == True:
-                recordGameLog(currentName, int(totalMovesToScore(totalMoves, n)), n)
-                congratsScreen(currentName, int(totalMovesToScore(totalMoves, n)), n)
-                return 0 # Returns user back to main menu
+        recordGameLog(currentName, game.score(), n)
+        congratsScreen(currentName, game.score(), n)
+        return 0 # Returns user back to main menu
 
     # For save game implementation
     elif type == 2:
 
-        # STEP 0: Check existence of saved files
-
-        # Specify saved files folder path
-        folderpath = './savefiles'
-
-        # CASE: Folder does not exist
-        if not os.path.exists(folderpath):
-            text_effect("There are currently no saved game availables.")
-            text_effect("Returning to main menu...")
-            time.sleep(3)
-            return 0
-
-        # Get a list of all directories (files and folder) inside the folder path
-        dir = os.listdir(folderpath)  
+        # STEP 0: Check existence of a saved game
 
-        # CASE: Savefiles folder exists but is empty
-        if len(dir) == 0:
+        # CASE: No saved game
+        if not gameStorage.hasSave():
             text_effect("There are currently no saved game available.")
             text_effect("Returning to main menu.")
-            time.sleep(1)
+            animationClock.sleep(1)
             return 0            
 
         # Load saved files (NOTE: currentName called from getCurrentName() will be overwritten by saved username)
@@ -2005,162 +2605,106 @@ def playGame(type=1):
                 # Set loaded name as currentName
                 currentName = currentNameLoaded
 
-                # Change and update current user file
-                currentNameFile = "name/currentname.txt"
-                with open(currentNameFile, 'w') as file:
-                    file.write(currentName)
+                # Change and update current user
+                gameStorage.setCurrentName(currentName)
 
             # Case: "N" - retain currentName and return to main menu
             else:
                 text_effect("Returning to main menu...", Fore.RED)
-                time.sleep(2)
+                animationClock.sleep(2)
                 return 0
 
         # Get n (use assignmentBoard as reference)
-        n = len(assignmentBoard)
-
-        # Get mapping dictionaries
-        ciMapDict = coordinateToIndexMap(n)
-        icMapDict = indexToCoordinateMap(n)
-
-        # Special case: One card has already been selected
-        if len(currentSelection) == 1:
-
-            selectedCard = False # Initialize selected card (for while loop entry)
-
-            # Selecting second card of the round
-            while selectedCard == False:
-                displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-                selectedCard = selectCard(stateBoard, currentSelection, icMapDict)
-                clearScreen()            
-
-            # Case: Save and exit game
-            if selectedCard is True:
-                encryptedBoard, key = encryptBoard(assignmentBoard)
-                saveBoard(encryptedBoard, stateBoard, currentSelection, totalMoves, key)
-                sys.exit()
-
-            # Case: Return to main menu
-            elif selectedCard == 'm':
-                main('skip') # Returns to main menu
-
-            # Add card to current selection
-            currentSelection.append(selectedCard)
-
-            displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-            time.sleep(2) # 2 seconds delay
-            clearScreen()
-
-            # Update total moves
-            totalMoves += 1            
-
-            # Check if current selection matches or not and update if necessary
-            stateBoard, matchFound = checkMatchUpdateBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
+        n = assignmentBoard.n
 
-            # Print indicator of whether the player has found a match
-            if matchFound == True:
-                print(Fore.GREEN + "Match :)!" + Style.RESET_ALL)
-                time.sleep(1)
-                clearScreen()
-            else:
-                pass
-
-            # Clear current selection of cards
-            currentSelection.pop()
-            currentSelection.pop()
+        # Resume the saved game (a card may already be selected)
+        game = MemoryGame(n, assignmentBoard, stateBoard, currentSelection, totalMoves)
 
-            # Check if game is over
-            if gameOver(stateBoard) == True:
-                recordGameLog(currentName, int(totalMovesToScore(totalMoves, n)), n)
-                congratsScreen(currentName, int(totalMovesToScore(totalMoves, n)), n)
-                deleteBoard()
-                return 0 # Returns user back to main menu
+        playRounds(game, currentName)
 
-        gameRunning = True
-
-        # Simulate a complete round (complete round - flipping 2 cards)
-        while gameRunning:
-
-            selectedCard = False # Initialize selected card (for while loop entry)
-
-            # Selecting first card of the round
-            while selectedCard == False:
-                displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-                selectedCard = selectCard(stateBoard, currentSelection, icMapDict)
-                clearScreen()
+        recordGameLog(currentName, game.score(), n)
+        congratsScreen(currentName, game.score(), n)
+        deleteBoard()
+        return 0 # Returns user back to main menu
+            
+    else:
+        pass
 
-            # Case: Save and exit game
-            if selectedCard is True:
-                encryptedBoard, key = encryptBoard(assignmentBoard)
-                saveBoard(encryptedBoard, stateBoard, currentSelection, totalMoves, key)
-                sys.exit()
 
-            # Case: Return to main menu
-            elif selectedCard == 'm':
-                main('skip') # Returns to main menu
+def migrateToSqlite():
+    """
+    Copies the game log, the players and the saved game from the files into memory.db (replacing its contents),
+    for use with MEMORY_STORAGE=sqlite. The files are left as they are.
 
-            # Add card to current selection
-            currentSelection.append(selectedCard)
+    Returns:
+        0 (int): Exit status
+    """
+    folderpath = os.path.dirname(os.path.abspath(__file__))
+    database = openStorage('sqlite', folderpath)
 
-            displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-            time.sleep(1) # 2 seconds delay
-            clearScreen()
+    start = time.perf_counter()
+    games = database.importFrom(openStorage('files', folderpath))
+    players = len(database.nameList())
+    database.close()
 
-            # Update total moves
-            totalMoves += 1            
+    print(f"Copied {games} games and {players} players into {database.filepath} in {time.perf_counter() - start:.1f} s")
+    print("Play with it by setting MEMORY_STORAGE=sqlite (or with --storage sqlite)")
+    return 0
 
-            selectedCard = False # Initialize selected card (for while loop entry)
 
-            # Selecting second card of the round
-            while selectedCard == False:
-                displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-                selectedCard = selectCard(stateBoard, currentSelection, icMapDict)
-                clearScreen()            
+# Dependencies reported by --startup-profile
+STARTUP_DEPENDENCIES = ['colorama', 'termcolor', 'pyfiglet', 'art', 'rich.console', 'rich.table', 'cryptography.fernet']
 
-            # Case: Save and exit game
-            if selectedCard is True:
-                encryptedBoard, key = encryptBoard(assignmentBoard)
-                saveBoard(encryptedBoard, stateBoard, currentSelection, totalMoves, key)
-                sys.exit()
 
-            # Case: Return to main menu
-            elif selectedCard == 'm':
-                main('skip') # Returns to main menu
+def startupProfile(budget=None):
+    """
+    Measures the cold start of the game and the import time of every dependency
 
-            # Add card to current selection
-            currentSelection.append(selectedCard)
+    The game is started in a new process that exits after drawing the main menu once (--first-frame); the time
+    until its output arrives is the time to the first frame. Every dependency is then imported on its own in a
+    new process (python -X importtime), which is what it costs when it is first used.
 
-            displayBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
-            time.sleep(2) # 2 seconds delay
-            clearScreen()
+    Parameters:
+        budget (float): Optional maximum time to the first frame (milliseconds)
+    Returns:
+        status (int): 0, or 1 if the first frame took longer than the budget
+    """
+    import subprocess
 
-            # Update total moves
-            totalMoves += 1            
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--first-frame'],
+                               stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    process.stdout.read(1)
+    firstFrame = (time.perf_counter() - start) * 1000
+    process.stdout.read()
+    loaded = json.loads(process.stderr.read() or '[]')
+    process.wait()
 
-            # Check if current selection matches or not and update if necessary
-            stateBoard, matchFound = checkMatchUpdateBoard(assignmentBoard, stateBoard, currentSelection, ciMapDict)
+    print(f"Time to first frame: {firstFrame:.1f} ms" + (f" (budget: {budget:.0f} ms)" if budget is not None else ""))
+    print()
+    print(f"{'Dependency':<22}{'Import (ms)':>12}  Loaded at startup")
+    for name in STARTUP_DEPENDENCIES:
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {name}'], capture_output=True, text=True)
+        try:
+            importTime = f"{int(result.stderr.strip().splitlines()[-1].split('|')[1]) / 1000:.1f}"
+        except (IndexError, ValueError):
+            importTime = "missing"
+        print(f"{name:<22}{importTime:>12}  {'yes' if name in loaded else 'no'}")
 
-            # Print indicator of whether the player has found a match
-            if matchFound == True:
-                print(Fore.GREEN + "Match :)!" + Style.RESET_ALL)
-                time.sleep(1)
-                clearScreen()
-            else:
-                pass
+    if budget is not None and firstFrame > budget:
+        print(f"\nStartup budget exceeded by {firstFrame - budget:.1f} ms", file=sys.stderr)
+        return 1
+    return 0
 
-            # Clear current selection of cards
-            currentSelection.pop()
-            currentSelection.pop()
 
-            # Check if game is over
-            if gameOver(stateBoard) == True:
-                recordGameLog(currentName, int(totalMovesToScore(totalMoves, n)), n)
-                congratsScreen(currentName, int(totalMovesToScore(totalMoves, n)), n)
-                deleteBoard()
-                return 0 # Returns user back to main menu
-            
-    else:
-        pass
+def firstFrame():
+    """
+    Draws the main menu once and reports (on stderr) the names of all the modules imported by then, for
+    startupProfile and tests/test_startup.py
+    """
+    show_menu(1)
+    sys.stdout.flush()
+    print(json.dumps(sorted(sys.modules)), file=sys.stderr)
 
 
 def main(status='new'):
@@ -2208,7 +2752,7 @@ def main(status='new'):
 
         # Choice 5: Leaderboards
         elif choice == 5:
-            leaderboards("gamelog/gamelog.csv")
+            leaderboards()
         
         # Choice 6: Achievements
         elif choice == 6:
@@ -2224,4 +2768,51 @@ def main(status='new'):
 
 
 if __name__ == "__main__":
+
+    # Batch simulation mode (no terminal needed): python memory.py simulate --games N --size n --strategy S --workers W
+    if len(sys.argv) > 1 and sys.argv[1] == "simulate":
+        from bot_simulation import simulateCommand
+        sys.exit(simulateCommand(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser(description="Test Your Memory: A Text Based Memory Game")
+    parser.add_argument('--speed', type=parseSpeed, help="animation speed factor, e.g. 2 for twice as fast (default: MEMORY_SPEED or 1)")
+    parser.add_argument('--turbo', action='store_true', help="turn off all animations and delays")
+    parser.add_argument('--reveal', type=float, metavar='SECONDS', help=f"how long a mismatched pair stays visible unless a key is pressed (default: {REVEAL_SECONDS}, or 0 with --turbo)")
+    parser.add_argument('--build-banner-cache', action='store_true', help="render all the banners into the banner cache and exit")
+    parser.add_argument('--startup-profile', action='store_true', help="report the time to the first frame and the import time of every dependency, then exit")
+    parser.add_argument('--startup-budget', type=float, metavar='MS', help="like --startup-profile, but exit with status 1 if the first frame takes longer than MS milliseconds")
+    parser.add_argument('--storage', choices=STORAGE_BACKENDS, help="where the game log, players and saved game are kept (default: MEMORY_STORAGE or files)")
+    parser.add_argument('--migrate-to-sqlite', action='store_true', help="copy the game log, players and saved game from the files into memory.db and exit")
+    parser.add_argument('--first-frame', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.migrate_to_sqlite:
+        sys.exit(migrateToSqlite())
+
+    if args.storage is not None:
+        gameStorage = openStorage(args.storage, os.path.dirname(os.path.abspath(__file__)))
+
+    if args.build_banner_cache:
+        buildBannerCache()
+        print(bannerCache.report())
+        sys.exit()
+
+    if args.startup_profile or args.startup_budget is not None:
+        sys.exit(startupProfile(args.startup_budget))
+
+    if args.first_frame:
+        firstFrame()
+        sys.exit()
+
+    if args.turbo:
+        animationClock.speed = 0.0
+    elif args.speed is not None:
+        animationClock.speed = args.speed
+
+    # Zero-delay mode (--turbo, --speed 0 or MEMORY_SPEED=turbo) doesn't wait on mismatches either, unless asked to
+    if args.reveal is not None:
+        REVEAL_SECONDS = args.reveal
+    elif animationClock.speed == 0:
+        REVEAL_SECONDS = 0
+
     main()
@@ -0,0 +1,749 @@
+# Test Your Memory: game engine (boards, moves, scoring and bots)
+# Only needs the standard library, so simulations and servers can use it without loading the terminal UI
+
+# Standard Libraries
+from array import array
+from collections import OrderedDict
+import itertools
+import math
+import random
+
+
+# A standard 52-card deck contains 4 suites and 13 values
+CARD_SUITS = ['\u2660','\u2663','\u2665','\u2666']
+CARD_VALUES = [
+    ' A',' 2',' 3',' 4',' 5',' 6',' 7',
+    ' 8',' 9','10',' J',' Q',' K'
+]
+
+
+class StateBoard:
+    """
+    Compact n x n state board: one byte per card (1 if solved, 0 if hidden) and a counter of matched pairs.
+
+    Cards are addressed by their "coordinate" (1 to n*n, same numbering as the card selection),
+    so checking a card is a single lookup and checking for a solved board is a counter comparison.
+
+    Parameters:
+        n (int): Size of the board
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.cells = bytearray(n * n)
+        self.solvedPairs = 0
+
+    def isSolved(self, coordinate):
+        """
+        Returns True if the card at the given coordinate is part of a matched pair, False otherwise
+        """
+        return self.cells[coordinate - 1] == 1
+
+    def markSolved(self, coordinate1, coordinate2):
+        """
+        Marks the two cards of a matched pair as solved
+        """
+        self.cells[coordinate1 - 1] = 1
+        self.cells[coordinate2 - 1] = 1
+        self.solvedPairs += 1
+
+    def isComplete(self):
+        """
+        Returns True if every card on the board is solved, False otherwise
+        """
+        return self.solvedPairs * 2 >= len(self.cells)
+
+    def toList(self):
+        """
+        Returns the state as a multidimensional list of size n x n of booleans (format used in save files)
+        """
+        n = self.n
+        return [[self.cells[r * n + c] == 1 for c in range(n)] for r in range(n)]
+
+    @classmethod
+    def fromList(cls, stateList):
+        """
+        Creates a state board from a multidimensional list of size n x n of booleans (format used in save files)
+        """
+        stateBoard = cls(len(stateList))
+        stateBoard.cells = bytearray(1 if solved else 0 for row in stateList for solved in row)
+        stateBoard.solvedPairs = sum(stateBoard.cells) // 2
+        return stateBoard
+
+
+def initialState(n):
+    """
+    Returns a n x n sized board containing the initial state
+
+    Parameters:
+        n (int): Size of the board
+
+    Returns:
+        stateBoard (StateBoard): state board of size n x n with no solved cards
+    """
+
+    return StateBoard(n)
+
+
+def generateCardFaces():
+    """
+    Generates an endless sequence of unique card faces
+
+    The first 52 faces are the standard deck (e.g. ' A♠'). Every following deck is numbered
+    to keep the faces unique (e.g. 'A♠2' for the ace of spades of the second deck)
+
+    Parameters:
+        None
+
+    Returns:
+        Generator yielding card faces (str)
+    """
+    deckNumber = 1
+    while True:
+        for suit in CARD_SUITS:
+            for value in CARD_VALUES:
+                if deckNumber == 1:
+                    yield value + suit
+                else:
+                    yield f"{value.strip()}{suit}{deckNumber}"
+        deckNumber += 1
+
+
+# Shared symbol table of card faces; card IDs stored in assignment boards index into it
+cardSymbols = []
+cardSymbolGenerator = generateCardFaces()
+
+
+def cardSymbolTable(qty):
+    """
+    Returns the shared symbol table, extended so it holds at least qty card faces
+
+    Parameters:
+        qty (int): Number of card faces needed
+
+    Returns:
+        cardSymbols (list): list of card faces, where the position of a face is its card ID
+    """
+    if len(cardSymbols) < qty:
+        cardSymbols.extend(itertools.islice(cardSymbolGenerator, qty - len(cardSymbols)))
+    return cardSymbols
+
+
+class AssignmentBoard:
+    """
+    Compact n x n assignment board: a flat array of small integer card IDs (row by row) and a symbol table.
+
+    Matching compares card IDs; the card faces are only looked up when the board is displayed or saved.
+
+    Parameters:
+        n (int): Size of the board
+        cards (array): flat array of size n*n containing the card ID of every coordinate
+        symbols (list): symbol table mapping card IDs to card faces
+        seed (int): Seed the board was generated from (None if unknown, e.g. loaded from a save file)
+    """
+
+    def __init__(self, n, cards, symbols, seed=None):
+        self.n = n
+        self.cards = cards
+        self.symbols = symbols
+        self.seed = seed
+
+    def cardAt(self, coordinate):
+        """
+        Returns the card ID (int) of the card at the given coordinate (1 to n*n)
+        """
+        return self.cards[coordinate - 1]
+
+    def faceAt(self, coordinate):
+        """
+        Returns the card face (str) of the card at the given coordinate (1 to n*n)
+        """
+        return self.symbols[self.cards[coordinate - 1]]
+
+    def toList(self):
+        """
+        Returns the card faces as a multidimensional list of size n x n (format used in save files)
+        """
+        n = self.n
+        return [[self.symbols[self.cards[r * n + c]] for c in range(n)] for r in range(n)]
+
+    @classmethod
+    def fromList(cls, faceList):
+        """
+        Creates an assignment board from a multidimensional list of size n x n of card faces (format used in save files)
+        """
+        symbols = []
+        symbolIds = {}
+        cardIds = []
+        for row in faceList:
+            for face in row:
+                if face not in symbolIds:
+                    symbolIds[face] = len(symbols)
+                    symbols.append(face)
+                cardIds.append(symbolIds[face])
+        return cls(len(faceList), array(cardIdTypecode(len(symbols)), cardIds), symbols)
+
+
+def cardIdTypecode(symbolQty):
+    """
+    Returns the smallest array typecode that holds card IDs for a symbol table of the given size
+    """
+    return 'H' if symbolQty <= 0xFFFF + 1 else 'I'
+
+
+def initialAssignment(n, seed=None):
+    """
+    Returns a n x n sized board containing the assignment of values. 
+    Values location is subjected to randomization.
+
+    Parameters:
+        n (int): Size of the board (any even size)
+        seed (int): Optional seed (e.g. a 64-bit integer). The same seed always gives the same board
+
+    Returns:
+        assignmentBoard (AssignmentBoard): board of size n x n 
+        containing card IDs with randomized placement
+    """
+    return next(generateBoards(n, [seed]))
+
+
+def generateBoards(n, seeds):
+    """
+    Generates one assignment board per seed, each the same board as initialAssignment(n, seed)
+
+    The deck size, symbol table and random generator are set up once and reused for every board,
+    so large batches of boards (e.g. for simulations) only pay for drawing and shuffling the cards
+
+    Parameters:
+        n (int): Size of the boards (any even size)
+        seeds (iterable): Seeds of the boards to generate (None draws a board from system randomness)
+
+    Returns:
+        Generator yielding assignmentBoard (AssignmentBoard) for every seed
+    """
+    if n < 2 or n % 2 != 0:
+        raise ValueError(f"Board size must be an even number of at least 2, got {n}")
+
+    # Get the number of unique cards needed for this game.
+    libraryQty = (n * n) // 2
+
+    # Use as many full decks as needed so every pair gets its own face
+    deckQty = math.ceil(libraryQty / (len(CARD_SUITS) * len(CARD_VALUES)))
+    faceQty = deckQty * len(CARD_SUITS) * len(CARD_VALUES)
+    symbols = cardSymbolTable(faceQty)
+    typecode = cardIdTypecode(faceQty)
+
+    # Private generator so seeded boards do not depend on (or disturb) the global random module
+    rng = random.Random()
+
+    for seed in seeds:
+        rng.seed(seed)
+
+        # Create a library containing unique card IDs with qty = libraryQty (drawn without replacement, no retries).
+        library = rng.sample(range(faceQty), libraryQty)
+
+        # Duplicate the cards in the library to make card-pairs.
+        library += library
+
+        # Shuffle the cards before starting the game.
+        rng.shuffle(library)
+
+        # Store the cards row by row as a flat array of card IDs.
+        yield AssignmentBoard(n, array(typecode, library), symbols, seed)
+
+
+def gameOver(stateBoard):
+    """
+    Checks if the board is in the terminal state / fully solved
+
+    Parameters:
+        stateBoard (StateBoard): state board of size n x n
+
+    Returns:
+        Returns True if the board is in the terminal state / no more cards left, False otherwise
+    """
+    # All cards are revealed once every pair has been counted as matched
+    return stateBoard.isComplete()
+
+
+def coordinateToIndexMap(n):
+    """
+    Creates a dictionary which maps a coordinate to its i and j index board position
+
+    Parameters:
+        size (n): size of the board 
+
+    Returns:
+        ciMapDict (dict): Dictionary which maps a "coordinate" to its i and j index board position
+    """
+    ciMapDict = {}
+    index = 1
+    for r in range(n):
+        for c in range(n):
+            ciMapDict[index] = (r, c)
+            index += 1
+    return ciMapDict
+
+
+def indexToCoordinateMap(n):
+    """
+    Creates a dictionary which maps the i and j index board position to its coordinate
+
+    Parameters:
+        size (n): size of the board 
+
+    Returns:
+        icMapDict (dict): Dictionary which maps the i and j index board positions to the "coordinate"     
+    """
+    icMapDict = {}
+    index = 1
+    for r in range(n):
+        for c in range(n):
+            icMapDict[(r, c)] = index
+            index += 1
+    return icMapDict
+
+
+def getAvailableCoordinates(stateBoard, currentSelection):
+    """
+    Gets the set of available coordinates (hidden cards that are not currently selected)
+
+    Only used to build the starting set of a game; afterwards the game engine keeps it up to date as cards are selected and matched
+
+    Parameters:
+        stateBoard (StateBoard): state board of size n x n
+        currentSelection (list): list containing the currently selected cards of the player
+    Returns:
+        availableCoordinates (set): set of available coordinates
+    """
+    # Get the dimension of the board (use stateBoard as reference) (Assumption: n x n board is used)
+    n = stateBoard.n
+
+    # Keep every coordinate on the board (e.g. if 4x4 board, coordinates will be from 1-16) that is not solved or selected
+    availableCoordinates = set()
+    for coordinate in range(1, (n*n) + 1):
+        if not stateBoard.isSolved(coordinate) and coordinate not in currentSelection:
+            availableCoordinates.add(coordinate)
+
+    return availableCoordinates
+
+
+def checkMatchUpdateBoard(assignmentBoard, stateBoard, currentSelection):
+    """
+    Checks if the two selections are matching and if matching updates the state board
+    
+    Returns the updated stateBoard
+
+    Parameters:
+        assignmentBoard (AssignmentBoard): assignment board of size n x n
+        stateBoard (StateBoard): state board of size n x n
+        currentSelection (list): list containing the 2 currently selected cards of the player
+    Returns:
+        Updated stateBoard
+        matchFound (bool): True if a match is found, False otherwise
+    """
+    # Compare the card IDs (integers) of both selections
+    selection1 = assignmentBoard.cardAt(currentSelection[0])
+    selection2 = assignmentBoard.cardAt(currentSelection[1])
+    if selection1 == selection2:
+        stateBoard.markSolved(currentSelection[0], currentSelection[1])
+        return stateBoard, True
+    else:
+        return stateBoard, False
+
+
+class MemoryGame:
+    """
+    Headless game engine: owns the boards, the current selection and the move counter of a single match.
+
+    The engine does no I/O (no printing, sleeping, clearing or exiting), so it can be driven by
+    the terminal front end (playGame) as well as by bots, load tests and simulations.
+
+    Parameters:
+        n (int): Size of the board
+        assignmentBoard (AssignmentBoard): Optional assignment board (e.g. from a saved game). A new one is generated if omitted
+        stateBoard (StateBoard): Optional state board (e.g. from a saved game). A new one is generated if omitted
+        currentSelection (list): Optional list of currently selected card coordinates
+        totalMoves (int): Total moves already made
+        seed (int): Optional seed of the generated assignment board (ignored if assignmentBoard is given)
+    """
+
+    def __init__(self, n, assignmentBoard=None, stateBoard=None, currentSelection=None, totalMoves=0, seed=None):
+        self.n = n
+        self.assignmentBoard = assignmentBoard if assignmentBoard is not None else initialAssignment(n, seed)
+        self.stateBoard = stateBoard if stateBoard is not None else initialState(n)
+        self.currentSelection = list(currentSelection) if currentSelection else []
+        self.lastSelection = []
+        self.totalMoves = totalMoves
+
+        # Hidden cards that are not currently selected (kept up to date on every flip)
+        self.availableCoordinates = getAvailableCoordinates(self.stateBoard, self.currentSelection)
+
+    def checkSelection(self, index):
+        """
+        Checks if a card can be flipped
+
+        Parameters:
+            index (int): Coordinate of the card to check
+
+        Returns:
+            None if the card can be flipped, otherwise the reason (str) why it cannot
+        """
+        # Anything but an int (a bool would be taken as 0 or 1) is not a coordinate
+        if not isinstance(index, int) or isinstance(index, bool):
+            return "Card selected is invalid :("
+        if index in self.availableCoordinates:
+            return None
+        elif not 1 <= index <= self.n * self.n:
+            return "Card selected is invalid :("
+        else:
+            return "Selected card already flipped :)"
+
+    def flip(self, index):
+        """
+        Flips the card at the given coordinate and counts it as a move.
+        On the second card of a round, checks for a match and clears the current selection.
+
+        Parameters:
+            index (int): Coordinate of the card to flip (1 to n*n)
+
+        Returns:
+            None if this is the first card of a round
+            matchFound (bool): True if the second card matches the first, False otherwise
+
+        Raises:
+            ValueError: If the coordinate is not an int, not on the board, already solved or already selected
+        """
+        invalidReason = self.checkSelection(index)
+        if invalidReason is not None:
+            raise ValueError(invalidReason)
+
+        self.availableCoordinates.remove(index)
+        self.currentSelection.append(index)
+        self.totalMoves += 1
+
+        if len(self.currentSelection) < 2:
+            return None
+
+        self.stateBoard, matchFound = checkMatchUpdateBoard(self.assignmentBoard, self.stateBoard, self.currentSelection)
+
+        # Mismatched cards are hidden again and can be selected in the next rounds
+        if not matchFound:
+            self.availableCoordinates.update(self.currentSelection)
+
+        # Keep the resolved pair around so front ends can still show it, then start a new round
+        self.lastSelection = self.currentSelection
+        self.currentSelection = []
+
+        return matchFound
+
+    def is_over(self):
+        """
+        Returns True if every pair on the board has been matched, False otherwise
+        """
+        return gameOver(self.stateBoard)
+
+    def score(self):
+        """
+        Returns the score (int) of the current number of moves for this board size
+        """
+        return int(totalMovesToScore(self.totalMoves, self.n))
+
+    def snapshot(self):
+        """
+        Returns a copy of the game data (safe to keep or save while the game continues)
+
+        Returns:
+            snapshot (dict): n, assignmentBoard, stateBoard, currentSelection and totalMoves
+        """
+        return {
+            'n': self.n,
+            'assignmentBoard': self.assignmentBoard.toList(),
+            'stateBoard': self.stateBoard.toList(),
+            'currentSelection': self.currentSelection[:],
+            'totalMoves': self.totalMoves
+        }
+
+
+class CoordinatePool:
+    """
+    Set of coordinates that supports adding, removing and picking a random coordinate in O(1)
+
+    Parameters:
+        coordinates (iterable): Starting coordinates
+    """
+
+    def __init__(self, coordinates=()):
+        self.coordinates = []
+        self.positions = {}
+        for coordinate in coordinates:
+            self.add(coordinate)
+
+    def __len__(self):
+        return len(self.coordinates)
+
+    def __contains__(self, coordinate):
+        return coordinate in self.positions
+
+    def add(self, coordinate):
+        """
+        Adds a coordinate (does nothing if it is already in the pool)
+        """
+        if coordinate not in self.positions:
+            self.positions[coordinate] = len(self.coordinates)
+            self.coordinates.append(coordinate)
+
+    def discard(self, coordinate):
+        """
+        Removes a coordinate (does nothing if it is not in the pool)
+        """
+        position = self.positions.pop(coordinate, None)
+        if position is not None:
+            # Move the last coordinate into the freed slot so removal is O(1)
+            last = self.coordinates.pop()
+            if position < len(self.coordinates):
+                self.coordinates[position] = last
+                self.positions[last] = position
+
+    def randomChoice(self, rng, exclude=()):
+        """
+        Returns a random coordinate of the pool that is not in exclude, or None if there is none
+
+        Parameters:
+            rng (random.Random): Random number generator
+            exclude (list): Coordinates that must not be picked (e.g. the currently selected card)
+        """
+        if len(self.coordinates) <= len(exclude):
+            candidates = [coordinate for coordinate in self.coordinates if coordinate not in exclude]
+            return rng.choice(candidates) if candidates else None
+        while True:
+            coordinate = self.coordinates[rng.randrange(len(self.coordinates))]
+            if coordinate not in exclude:
+                return coordinate
+
+
+class Bot:
+    """
+    Base class of the built-in bot players
+
+    A bot plays a MemoryGame without the terminal: playBotGame asks it for a card with chooseCard,
+    flips the card through the game engine (the same validation selectCard uses) and shows the
+    flipped card to the bot with observe. Bots only learn the cards they have flipped.
+
+    Parameters:
+        seed (int): Optional seed of the bot's random choices
+    """
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def start(self, game):
+        """
+        Prepares the bot for a new (or resumed) game
+        """
+        pass
+
+    def chooseCard(self, game):
+        """
+        Returns the coordinate (int) of the next card to flip
+        """
+        raise NotImplementedError
+
+    def observe(self, game, coordinate, card):
+        """
+        Shows the bot the card ID of the card it just flipped (called after the flip, so a
+        second card of a round is already resolved as a match or a mismatch)
+        """
+        pass
+
+
+class RandomBot(Bot):
+    """
+    Bot that flips random hidden cards and remembers nothing
+    """
+
+    def start(self, game):
+        self.hidden = CoordinatePool(list(game.availableCoordinates) + game.currentSelection)
+
+    def chooseCard(self, game):
+        return self.hidden.randomChoice(self.rng, game.currentSelection)
+
+    def observe(self, game, coordinate, card):
+        # Only matched cards leave the pool of hidden cards
+        if not game.currentSelection and game.stateBoard.isSolved(coordinate):
+            for solved in game.lastSelection:
+                self.hidden.discard(solved)
+
+
+class MemoryBot(Bot):
+    """
+    Bot that remembers the cards it has seen and flips known pairs first
+
+    With a capacity, the bot only remembers the capacity most recently seen cards (least recently
+    seen cards are forgotten first). Without a capacity it has perfect recall.
+
+    Parameters:
+        capacity (int): Number of cards the bot remembers (None for perfect recall)
+        seed (int): Optional seed of the bot's random choices
+    """
+
+    def __init__(self, capacity=None, seed=None):
+        super().__init__(seed)
+        if capacity is not None and capacity < 1:
+            raise ValueError("A memory bot must remember at least 1 card")
+        self.capacity = capacity
+
+    def start(self, game):
+        self.memory = OrderedDict()    # coordinate -> card ID, least recently seen first
+        self.cardPositions = {}        # card ID -> remembered coordinates of that card
+        self.knownPairs = set()        # card IDs with both coordinates remembered
+        self.unknown = CoordinatePool(list(game.availableCoordinates) + game.currentSelection)
+
+        # A card selected in a resumed game is face up, so the bot can see it
+        for coordinate in game.currentSelection:
+            self.remember(coordinate, game.assignmentBoard.cardAt(coordinate))
+
+    def chooseCard(self, game):
+        if game.currentSelection:
+            # Second card: the partner of the first card if remembered
+            first = game.currentSelection[0]
+            for coordinate in self.cardPositions.get(self.memory.get(first), ()):
+                if coordinate != first:
+                    return coordinate
+        elif self.knownPairs:
+            # First card: a remembered pair
+            card = next(iter(self.knownPairs))
+            return self.cardPositions[card][0]
+
+        # Otherwise a card the bot does not remember (or any hidden card once it remembers them all)
+        coordinate = self.unknown.randomChoice(self.rng, game.currentSelection)
+        if coordinate is None:
+            coordinate = self.rng.choice(list(game.availableCoordinates))
+        return coordinate
+
+    def observe(self, game, coordinate, card):
+        self.remember(coordinate, card)
+
+        # Matched cards leave the board, so there is nothing left to remember about them
+        if not game.currentSelection and game.stateBoard.isSolved(coordinate):
+            for solved in game.lastSelection:
+                self.forget(solved)
+                self.unknown.discard(solved)
+
+    def remember(self, coordinate, card):
+        """
+        Stores a seen card, forgetting the least recently seen card if the memory is full
+        """
+        if coordinate in self.memory:
+            self.memory.move_to_end(coordinate)
+            return
+
+        self.memory[coordinate] = card
+        self.unknown.discard(coordinate)
+        positions = self.cardPositions.setdefault(card, [])
+        positions.append(coordinate)
+        if len(positions) == 2:
+            self.knownPairs.add(card)
+
+        if self.capacity is not None and len(self.memory) > self.capacity:
+            oldest = next(iter(self.memory))
+            self.forget(oldest)
+            self.unknown.add(oldest)
+
+    def forget(self, coordinate):
+        """
+        Removes a card from memory (does nothing if it is not remembered)
+        """
+        card = self.memory.pop(coordinate, None)
+        if card is not None:
+            self.cardPositions[card].remove(coordinate)
+            self.knownPairs.discard(card)
+
+
+# Names of the built-in bots (used by the simulations)
+BOT_NAMES = ['random', 'perfect', 'lru']
+
+
+def createBot(name, capacity=8, seed=None):
+    """
+    Creates one of the built-in bots
+
+    Parameters:
+        name (str): 'random', 'perfect' (perfect recall) or 'lru' (remembers the capacity most recently seen cards)
+        capacity (int): Number of cards remembered by the 'lru' bot
+        seed (int): Optional seed of the bot's random choices
+
+    Returns:
+        bot (Bot): the created bot
+    """
+    if name == 'random':
+        return RandomBot(seed)
+    elif name == 'perfect':
+        return MemoryBot(None, seed)
+    elif name == 'lru':
+        return MemoryBot(capacity, seed)
+    raise ValueError(f"Unknown bot '{name}', expected one of {BOT_NAMES}")
+
+
+def playBotGame(bot, n=4, seed=None, game=None):
+    """
+    Lets a bot play a whole game without the terminal
+
+    Parameters:
+        bot (Bot): Bot that plays the game
+        n (int): Size of the board (ignored if game is given)
+        seed (int): Optional seed of the board (ignored if game is given)
+        game (MemoryGame): Optional game to play or resume
+
+    Returns:
+        game (MemoryGame): the finished game (see totalMoves and score())
+    """
+    if game is None:
+        game = MemoryGame(n, seed=seed)
+
+    bot.start(game)
+    while not game.is_over():
+        coordinate = bot.chooseCard(game)
+
+        # flip validates the card with checkSelection, the same check selectCard uses for players
+        game.flip(coordinate)
+        bot.observe(game, coordinate, game.assignmentBoard.cardAt(coordinate))
+
+    return game
+
+
+def totalMovesToScore(totalMoves,n):
+    """
+    Converts total moves to score
+
+    Parameters:
+        totalMoves (int): Total moves by the user
+        size (n): size of the board (any even size, including custom sizes)
+    Returns:
+        score (int): Score by the user    
+    """
+    #if totalMoves is calculated by counting the number of moves a player makes, regardless of whether the moves result in a correct match or not
+    #1 pair = 2 moves
+
+    min_possible_moves_actual = (n * n) #minimum moves to get all correct combinations (if 1 pair = 2 moves)
+    buffer=int(0.2*n*n) #allowing some mistakes, changes with n
+    if buffer%2!=0:
+        buffer+=1
+    min_possible_moves_theoretical= min_possible_moves_actual+buffer
+
+    if n < 4:
+        # Custom max_score formula for small grids
+        multiplier = 200 * n
+    else:
+        # Normalized max_score for n >= 4
+        # 4x4=2000, 6x6=4000, 8x8=7000
+        multiplier = math.ceil((n * n) / 10) * 1000
+
+    # display maximum score while total moves are less than or equal to minimum possible moves
+    if totalMoves<=min_possible_moves_theoretical:
+        return multiplier
+    else:
+        move_penalty=(totalMoves/min_possible_moves_theoretical) #more moves, more penalty
+    score = (min_possible_moves_theoretical / totalMoves) * multiplier / move_penalty
+    # score decreases as number of moves increases (beyond the minimum possible moves)
+    return score
@@ -0,0 +1,823 @@
+# Test Your Memory: persistent state (game log, players and saved game)
+# Two interchangeable backends: the original csv/text/pickle files and a SQLite database (see openStorage)
+
+# Standard Libraries
+import bisect
+from contextlib import contextmanager
+import csv
+import io
+import json
+from operator import itemgetter
+import os
+import pickle
+import platform
+import re
+import sqlite3
+
+
+# Parts of a saved game, each stored separately (see Storage.saveGame)
+SAVE_PARTS = ('assignmentBoard', 'stateBoard', 'currentSelection', 'totalMoves', 'key', 'userName')
+
+# Number of games kept per game type by the leaderboard index of FileStorage (more are kept if more are asked for)
+LEADERBOARD_SIZE = 5
+
+
+def leaderboardOrder(game):
+    """
+    Sort key of leaderboard entries: highest score first, then earliest date, then lowest ID (first logged)
+
+    Parameters:
+        game (list): [name, score, date, id] entry
+    """
+    return (-game[1], game[2], game[3])
+
+
+# Dates are logged as 'YYYY-MM-DD', so they are compared (and sorted) as strings
+ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def readGameLog(file):
+    """
+    Yields the entries of a csv game log one at a time (the log is never held in memory)
+
+    Only the ID, Name, Score, GameType and Date columns are kept, found by the header, and they are left as
+    text: each reader converts what it uses (see parseGames and bestGames). Entries cut short (e.g. by a
+    crash while they were written) are skipped.
+
+    Parameters:
+        file: Game log file, opened as UTF-8 with newline=''
+    Yields:
+        entry (tuple): (id, name, score, gameType, date) strings of each entry, in the order they were logged
+    """
+    reader = csv.reader(file)
+    header = next(reader, [])
+    try:
+        columns = itemgetter(*(header.index(column) for column in ('ID', 'Name', 'Score', 'GameType', 'Date')))
+    except ValueError:
+        return  # Not a game log
+
+    for row in reader:
+        try:
+            yield columns(row)
+        except IndexError:
+            continue
+
+
+def parseGames(entries):
+    """
+    Converts the entries of readGameLog to games, skipping entries that are not valid
+
+    Parameters:
+        entries: Iterable of (id, name, score, gameType, date) strings
+    Yields:
+        game (tuple): (id, name, score, gameType, date) with integer ID, score and game type
+    """
+    isDate = ISO_DATE.fullmatch
+    for id, name, score, gameType, day in entries:
+        try:
+            if isDate(day):
+                yield (int(id), name, int(score), int(gameType), day)
+        except ValueError:
+            continue
+
+
+def bestGames(entries, limit):
+    """
+    Keeps the best games of each game type while reading the entries of readGameLog, in bounded memory
+
+    Each game type has a sorted array of at most limit games. The score is the only column converted for
+    every entry: most entries score below the worst game kept and are dropped right away, and only the
+    others have their ID and date checked (as in parseGames).
+
+    Parameters:
+        entries: Iterable of (id, name, score, gameType, date) strings
+        limit (int): Number of games kept per game type
+    Returns:
+        topScores (dict): Game type (str) to [[name, score, date, id], ...] in leaderboardOrder
+    """
+    isDate = ISO_DATE.fullmatch
+    topScores = {}
+    arrays = {}  # Game type as logged to its array in topScores (None if it isn't a number)
+
+    for id, name, score, gameType, day in entries:
+        try:
+            top = arrays[gameType]
+        except KeyError:
+            try:
+                top = topScores.setdefault(int(gameType), [])
+            except ValueError:
+                top = None
+            arrays[gameType] = top
+
+        try:
+            score = int(score)
+            if top is None or (len(top) == limit and score < top[-1][1]):
+                continue  # Lower than the worst game kept
+            id = int(id)
+        except ValueError:
+            continue
+        if not isDate(day):
+            continue
+
+        if len(top) == limit:
+            worst = top[-1]
+            if score == worst[1] and (day, id) >= (worst[2], worst[3]):
+                continue  # Not better than the worst game kept
+            top.pop()
+        bisect.insort(top, [name, score, day, id], key=leaderboardOrder)
+
+    return {str(gameType): top for gameType, top in topScores.items() if top}
+
+
+def lastGameLogId(filepath):
+    """
+    Reads the ID of the newest entry of the game log from the end of the file, without reading the whole log
+
+    Only complete entries count: a last line cut short by a crash while it was written (no line end, or
+    missing fields) is skipped, so its ID is given again to the next entry.
+
+    Parameters:
+        filepath (str): Path of the game log file
+    Returns:
+        id (int): ID of the last entry (0 if the log has no entries)
+    """
+    with open(filepath, 'rb') as file:
+        size = file.seek(0, os.SEEK_END)
+        start = max(0, size - 4096)
+        while True:
+            file.seek(start)
+            lines = file.read().splitlines(keepends=True)
+
+            # The first line read may be cut in half, unless reading from the start of the file
+            if start > 0:
+                lines = lines[1:]
+
+            for line in reversed(lines):
+                if not line.endswith(b"\n"):
+                    continue
+                try:
+                    row = next(csv.reader([line.decode("utf-8")]))
+                except (UnicodeDecodeError, csv.Error, StopIteration):
+                    continue
+                if len(row) == 5 and row[0].strip().isdigit():
+                    return int(row[0])
+
+            if start == 0:
+                return 0
+            start = 0  # Unusually long lines: read the whole file
+
+
+def dropTornLine(file):
+    """
+    Cuts a last line without line end (an entry cut short by a crash while it was written) from the game log
+
+    lastGameLogId skips such a line, so its ID is given to the next entry: the line is dropped instead of
+    being completed, or the log would hold that ID twice.
+
+    Parameters:
+        file: Game log file, opened in 'a+b' mode
+    Returns:
+        None
+    """
+    size = file.seek(0, os.SEEK_END)
+
+    # Look for the last line end, reading backwards from the end of the file
+    position = size
+    while position > 0:
+        start = max(0, position - 4096)
+        file.seek(start)
+        lineEnd = file.read(position - start).rfind(b"\n")
+        if lineEnd >= 0:
+            if start + lineEnd + 1 < size:
+                file.truncate(start + lineEnd + 1)
+            return
+        position = start
+
+    # Not even the header is complete: start the entry on a line of its own
+    if size > 0:
+        file.write(b"\n")
+
+
+def nextGameLogId(filepath):
+    """
+    Returns the ID of the next entry of the game log
+
+    The next ID is kept in a file next to the log ("nextid", with the size of the log when it was written), so
+    it doesn't have to be read from the log. If that file is missing or the log was changed since (its size
+    differs), the ID is derived from the last entry of the log instead.
+
+    Parameters:
+        filepath (str): Path of the game log file
+    Returns:
+        nextID (int): ID of the next entry
+    """
+    sequencePath = os.path.join(os.path.dirname(filepath), 'nextid')
+    try:
+        with open(sequencePath) as file:
+            nextID, size = (int(value) for value in file.read().split())
+        if size == os.path.getsize(filepath):
+            return nextID
+    except (OSError, ValueError):
+        pass
+
+    return lastGameLogId(filepath) + 1
+
+
+def saveNextGameLogId(filepath, nextID):
+    """
+    Stores the ID of the next entry of the game log, together with the current size of the log (see nextGameLogId)
+
+    Parameters:
+        filepath (str): Path of the game log file
+        nextID (int): ID of the next entry
+    Returns:
+        None
+    """
+    sequencePath = os.path.join(os.path.dirname(filepath), 'nextid')
+    replaceFile(sequencePath, f"{nextID} {os.path.getsize(filepath)}")
+
+
+def replaceFile(filepath, text):
+    """
+    Replaces the contents of a file in one step: the text is written and synced to a temporary file that
+    is then renamed over the file, so a crash leaves either the old or the new contents, never half of them
+
+    The text is written as UTF-8, the encoding of every file the game log is kept in.
+
+    Parameters:
+        filepath (str): Path of the file
+        text (str): New contents of the file
+    Returns:
+        None
+    """
+    temporaryPath = f"{filepath}.{os.getpid()}.tmp"
+    with open(temporaryPath, "w", encoding="utf-8", newline="") as file:
+        file.write(text)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(temporaryPath, filepath)
+
+
+@contextmanager
+def gameLogLock(folderpath):
+    """
+    Holds an exclusive lock on the game log folder while the block runs, so processes sharing the folder
+    (e.g. several terminal stations) change the game log one at a time
+
+    The lock is advisory (gamelog.lock in the folder): only code that takes it waits for it.
+
+    Parameters:
+        folderpath (str): Path of the game log folder (created if it doesn't exist)
+    """
+    os.makedirs(folderpath, exist_ok=True)
+    with open(os.path.join(folderpath, 'gamelog.lock'), 'a+b') as lockFile:
+        if platform.system() == "Windows":
+            import msvcrt
+
+            # Lock the first byte of the file; LK_LOCK gives up after 10 seconds, so keep trying
+            lockFile.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lockFile.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    pass
+            try:
+                yield
+            finally:
+                lockFile.seek(0)
+                msvcrt.locking(lockFile.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lockFile.fileno(), fcntl.LOCK_UN)
+
+
+class Storage:
+    """
+    Interface of the persistent state of the game: the game log, the players and the saved game.
+
+    Games are (name, score, gameType, date) records, dates being 'YYYY-MM-DD' strings.
+    Saved games are dictionaries of SAVE_PARTS names to picklable objects.
+    """
+
+    # Game log
+
+    def hasGames(self):
+        """
+        Returns True if at least one game is logged (False before the first game and after all games were deleted)
+        """
+        raise NotImplementedError
+
+    def recordGame(self, name, score, gameType, day):
+        """
+        Adds a completed game to the game log
+
+        Parameters:
+            name (str): Username of the player
+            score (int): Final score
+            gameType (int): Size of the board
+            day (date): Date the game was completed
+        """
+        raise NotImplementedError
+
+    def games(self):
+        """
+        Yields every entry of the game log as an (id, name, score, gameType, date) tuple, oldest first
+        """
+        raise NotImplementedError
+
+    def topScores(self, gameTypes, limit):
+        """
+        Returns the best games of each game type, highest score first (earliest first on equal scores)
+
+        Parameters:
+            gameTypes (list): Game types (board sizes) to rank
+            limit (int): Maximum number of games per game type
+        Returns:
+            topScores (dict): Game type to list of (name, score, date) tuples
+        """
+        raise NotImplementedError
+
+    def playerStats(self, name):
+        """
+        Returns the games of a player summarized per game type
+
+        Parameters:
+            name (str): Username of the player
+        Returns:
+            stats (dict): Game type to (games played, total score, best score) tuple
+        """
+        raise NotImplementedError
+
+    def deletePlayers(self, keepNames):
+        """
+        Deletes the game log entries of every player that is not in keepNames
+
+        Parameters:
+            keepNames (list): Usernames whose games are kept
+        """
+        raise NotImplementedError
+
+    # Players
+
+    def currentName(self):
+        """
+        Returns the username of the current player (None if it was never set)
+        """
+        raise NotImplementedError
+
+    def setCurrentName(self, name):
+        """
+        Changes the current player
+        """
+        raise NotImplementedError
+
+    def nameList(self):
+        """
+        Returns the list of all created users, in the order they are shown
+        """
+        raise NotImplementedError
+
+    def setNameList(self, names):
+        """
+        Replaces the list of all created users
+        """
+        raise NotImplementedError
+
+    # Saved game
+
+    def hasSave(self):
+        """
+        Returns True if there is a saved game
+        """
+        raise NotImplementedError
+
+    def saveGame(self, parts):
+        """
+        Stores a saved game, replacing the previous one
+
+        Parameters:
+            parts (dict): SAVE_PARTS names to objects
+        """
+        raise NotImplementedError
+
+    def loadGame(self, names=SAVE_PARTS):
+        """
+        Loads (some of) the parts of the saved game
+
+        Parameters:
+            names (tuple): Names of the parts to load
+        Returns:
+            parts (dict): Part names to objects
+        """
+        raise NotImplementedError
+
+    def deleteSave(self):
+        """
+        Deletes the saved game (if any)
+        """
+        raise NotImplementedError
+
+
+class FileStorage(Storage):
+    """
+    The original storage of the game, in plain files under a folder:
+    gamelog/gamelog.csv (columns ID, Name, Score, GameType, Date), name/currentname.txt,
+    name/currentnamelist.csv (one name per line) and one pickle per part of the saved game in savefiles/.
+
+    The best games of each game type are kept in a small index next to the log (gamelog/leaderboard.json, see
+    loadLeaderboardIndex) that is updated as games are recorded, so leaderboards don't read the log.
+    Other queries read the whole game log.
+
+    Parameters:
+        folderpath (str): Folder containing the gamelog, name and savefiles folders
+    """
+
+    def __init__(self, folderpath):
+        self.gameLogFile = os.path.join(folderpath, 'gamelog', 'gamelog.csv')
+        self.leaderboardFile = os.path.join(folderpath, 'gamelog', 'leaderboard.json')
+        self.nameFile = os.path.join(folderpath, 'name', 'currentname.txt')
+        self.nameListFile = os.path.join(folderpath, 'name', 'currentnamelist.csv')
+        self.saveFolder = os.path.join(folderpath, 'savefiles')
+
+    def hasGames(self):
+        # The last entry is read from the end of the log (see lastGameLogId)
+        return os.path.isfile(self.gameLogFile) and lastGameLogId(self.gameLogFile) > 0
+
+    def recordGame(self, name, score, gameType, day):
+        # Format the entry like the csv module would (names with commas or quotes are quoted)
+        entry = io.StringIO()
+
+        with gameLogLock(os.path.dirname(self.gameLogFile)):
+
+            # Create the csv file (with its header) if it doesn't exist yet
+            if not os.path.isfile(self.gameLogFile):
+                replaceFile(self.gameLogFile, "ID,Name,Score,GameType,Date\n")
+
+            # The leaderboard index is updated below if it is up to date with the log
+            index = self.loadLeaderboardIndex()
+
+            # IDs continue from the newest entry (or start at 1 in an empty log)
+            nextID = nextGameLogId(self.gameLogFile)
+            csv.writer(entry, lineterminator="\n").writerow([nextID, name, score, gameType, day])
+
+            # Append the entry in one UTF-8 write (after dropping a line cut short by a crash, if any) and sync it to disk
+            line = entry.getvalue().encode("utf-8")
+            with open(self.gameLogFile, "a+b") as file:
+                dropTornLine(file)
+                file.write(line)
+                file.flush()
+                os.fsync(file.fileno())
+
+            saveNextGameLogId(self.gameLogFile, nextID + 1)
+
+            # Insert the game at its place among the best games of its type (if it is one of them)
+            if index is not None:
+                topScores = index['topScores'].setdefault(str(gameType), [])
+                bisect.insort(topScores, [name, score, str(day), nextID], key=leaderboardOrder)
+                del topScores[index['limit']:]
+                self.saveLeaderboardIndex(index)
+
+    def loadLeaderboardIndex(self):
+        """
+        Reads the leaderboard index: the best games of each game type, as {'limit': number of games kept per
+        game type, 'topScores': {game type (str): [[name, score, date, id], ...] in leaderboardOrder}}
+
+        The index holds the size of the log it was written for, like the next ID (see nextGameLogId).
+
+        Returns:
+            index (dict): The index, or None if it is missing or the log was changed since it was written
+        """
+        try:
+            with open(self.leaderboardFile, encoding='utf-8') as file:
+                index = json.load(file)
+            if index['logSize'] == os.path.getsize(self.gameLogFile):
+                return index
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def saveLeaderboardIndex(self, index):
+        """
+        Stores the leaderboard index (see loadLeaderboardIndex) for the current size of the log
+        """
+        index['logSize'] = os.path.getsize(self.gameLogFile)
+        replaceFile(self.leaderboardFile, json.dumps(index))
+
+    def buildLeaderboardIndex(self, limit):
+        """
+        Builds the leaderboard index (see loadLeaderboardIndex) in a single pass over the log (see bestGames)
+
+        Parameters:
+            limit (int): Number of games kept per game type
+        Returns:
+            index (dict): The index
+        """
+        try:
+            with open(self.gameLogFile, 'r', encoding='utf-8', newline='') as file:
+                return {'limit': limit, 'topScores': bestGames(readGameLog(file), limit)}
+        except FileNotFoundError:
+            return {'limit': limit, 'topScores': {}}
+
+    def games(self):
+        try:
+            file = open(self.gameLogFile, 'r', encoding='utf-8', newline='')
+        except FileNotFoundError:
+            return
+        with file:
+            yield from parseGames(readGameLog(file))
+
+    def topScores(self, gameTypes, limit):
+        if not self.hasGames():
+            return {gameType: [] for gameType in gameTypes}
+
+        # Rebuild the index from the log if it is missing, out of date or too short
+        index = self.loadLeaderboardIndex()
+        if index is None or index['limit'] < limit:
+            with gameLogLock(os.path.dirname(self.gameLogFile)):
+                index = self.buildLeaderboardIndex(max(limit, LEADERBOARD_SIZE))
+                self.saveLeaderboardIndex(index)
+
+        return {
+            gameType: [(name, score, day) for name, score, day, id in index['topScores'].get(str(gameType), [])[:limit]]
+            for gameType in gameTypes
+        }
+
+    def playerStats(self, name):
+        stats = {}
+        for id, player, score, gameType, day in self.games():
+            if player == name:
+                games, totalScore, bestScore = stats.get(gameType, (0, 0, score))
+                stats[gameType] = (games + 1, totalScore + score, max(bestScore, score))
+        return stats
+
+    def deletePlayers(self, keepNames):
+        if not self.hasGames():
+            return
+        keepNames = set(keepNames)
+
+        with gameLogLock(os.path.dirname(self.gameLogFile)):
+
+            # Keep the header and the entries of the remaining players as they are
+            log = io.StringIO()
+            writer = csv.writer(log, lineterminator="\n")
+            with open(self.gameLogFile, 'r', encoding='utf-8', newline='') as file:
+                reader = csv.reader(file)
+                writer.writerow(next(reader, ['ID', 'Name', 'Score', 'GameType', 'Date']))
+                writer.writerows(row for row in reader if len(row) > 1 and row[1] in keepNames)
+
+            # Replace the log in one step (see replaceFile)
+            replaceFile(self.gameLogFile, log.getvalue())
+
+            # The next ID and the leaderboard index are derived from the rewritten log again
+            sequencePath = os.path.join(os.path.dirname(self.gameLogFile), 'nextid')
+            for path in (sequencePath, self.leaderboardFile):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def currentName(self):
+        try:
+            with open(self.nameFile, 'r') as file:
+                return file.readline().strip()
+        except FileNotFoundError:
+            return None
+
+    def setCurrentName(self, name):
+        os.makedirs(os.path.dirname(self.nameFile), exist_ok=True)
+        with open(self.nameFile, 'w') as file:
+            file.write(name)
+
+    def nameList(self):
+        try:
+            with open(self.nameListFile, 'r') as file:
+                return [name.strip() for name in file]
+        except FileNotFoundError:
+            return []
+
+    def setNameList(self, names):
+        os.makedirs(os.path.dirname(self.nameListFile), exist_ok=True)
+        with open(self.nameListFile, 'w') as file:
+            file.write("\n".join(names))
+
+    def hasSave(self):
+        return os.path.isdir(self.saveFolder) and len(os.listdir(self.saveFolder)) > 0
+
+    def saveGame(self, parts):
+        os.makedirs(self.saveFolder, exist_ok=True)
+        for name, value in parts.items():
+            with open(os.path.join(self.saveFolder, f"{name}.pkl"), "wb") as file:
+                pickle.dump(value, file)
+
+    def loadGame(self, names=SAVE_PARTS):
+        parts = {}
+        for name in names:
+            with open(os.path.join(self.saveFolder, f"{name}.pkl"), "rb") as file:
+                parts[name] = pickle.load(file)
+        return parts
+
+    def deleteSave(self):
+        for name in SAVE_PARTS:
+            path = os.path.join(self.saveFolder, f"{name}.pkl")
+            if os.path.exists(path):
+                os.remove(path)
+
+
+class SqliteStorage(Storage):
+    """
+    Storage in a single SQLite database (write-ahead logging, so players can read while a game is recorded).
+
+    Games are indexed by game type and score (leaderboards read only the top entries) and by name, and
+    the games of each player are summarized per game type as they are recorded (achievements read a few rows).
+    The database is opened on first use.
+
+    Parameters:
+        filepath (str): Path of the database file
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS Games (
+            ID INTEGER PRIMARY KEY, Name TEXT NOT NULL, Score INTEGER NOT NULL, GameType INTEGER NOT NULL, Date TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS GamesByScore ON Games (GameType, Score DESC, Date);
+        CREATE INDEX IF NOT EXISTS GamesByName ON Games (Name);
+        CREATE TABLE IF NOT EXISTS PlayerStats (
+            Name TEXT NOT NULL, GameType INTEGER NOT NULL, Games INTEGER NOT NULL, TotalScore INTEGER NOT NULL,
+            BestScore INTEGER NOT NULL, PRIMARY KEY (Name, GameType)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS Players (Position INTEGER PRIMARY KEY, Name TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS Settings (Key TEXT PRIMARY KEY, Value TEXT NOT NULL);
+        CREATE TABLE IF NOT EXISTS SavedGame (Part TEXT PRIMARY KEY, Data BLOB NOT NULL);
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.connection = None
+
+    def connect(self):
+        """
+        Returns the connection to the database, opening it (and creating the tables) on first use
+        """
+        if self.connection is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.filepath)), exist_ok=True)
+
+            # Transactions are started explicitly (see transaction); wait for other processes instead of failing
+            connection = sqlite3.connect(self.filepath, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(self.SCHEMA)
+            self.connection = connection
+        return self.connection
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    @contextmanager
+    def transaction(self):
+        """
+        Runs the block in a write transaction (taking the write lock up front, so it never has to be upgraded)
+        """
+        connection = self.connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def hasGames(self):
+        return self.connect().execute("SELECT EXISTS (SELECT 1 FROM Games)").fetchone()[0] == 1
+
+    def recordGame(self, name, score, gameType, day):
+        with self.transaction() as connection:
+            connection.execute("INSERT INTO Games (Name, Score, GameType, Date) VALUES (?, ?, ?, ?)",
+                               (name, score, gameType, str(day)))
+            connection.execute("""
+                INSERT INTO PlayerStats VALUES (?, ?, 1, ?, ?)
+                ON CONFLICT (Name, GameType) DO UPDATE SET
+                    Games = Games + 1, TotalScore = TotalScore + excluded.TotalScore, BestScore = MAX(BestScore, excluded.BestScore)
+            """, (name, gameType, score, score))
+
+    def games(self):
+        yield from self.connect().execute("SELECT ID, Name, Score, GameType, Date FROM Games ORDER BY ID")
+
+    def topScores(self, gameTypes, limit):
+        connection = self.connect()
+        return {
+            gameType: connection.execute("""
+                SELECT Name, Score, Date FROM Games WHERE GameType = ? ORDER BY Score DESC, Date, ID LIMIT ?
+            """, (gameType, limit)).fetchall()
+            for gameType in gameTypes
+        }
+
+    def playerStats(self, name):
+        rows = self.connect().execute("SELECT GameType, Games, TotalScore, BestScore FROM PlayerStats WHERE Name = ?", (name,))
+        return {gameType: (games, totalScore, bestScore) for gameType, games, totalScore, bestScore in rows}
+
+    def deletePlayers(self, keepNames):
+        keepNames = set(keepNames)
+        with self.transaction() as connection:
+            deletedNames = [name for (name,) in connection.execute("SELECT DISTINCT Name FROM PlayerStats") if name not in keepNames]
+            for name in deletedNames:
+                connection.execute("DELETE FROM Games WHERE Name = ?", (name,))
+                connection.execute("DELETE FROM PlayerStats WHERE Name = ?", (name,))
+
+    def currentName(self):
+        row = self.connect().execute("SELECT Value FROM Settings WHERE Key = 'currentName'").fetchone()
+        return row[0] if row else None
+
+    def setCurrentName(self, name):
+        with self.transaction() as connection:
+            connection.execute("INSERT OR REPLACE INTO Settings VALUES ('currentName', ?)", (name,))
+
+    def nameList(self):
+        return [name for (name,) in self.connect().execute("SELECT Name FROM Players ORDER BY Position")]
+
+    def setNameList(self, names):
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM Players")
+            connection.executemany("INSERT INTO Players (Name) VALUES (?)", ((name,) for name in names))
+
+    def hasSave(self):
+        return self.connect().execute("SELECT EXISTS (SELECT 1 FROM SavedGame)").fetchone()[0] == 1
+
+    def saveGame(self, parts):
+        with self.transaction() as connection:
+            connection.executemany("INSERT OR REPLACE INTO SavedGame VALUES (?, ?)",
+                                   ((name, pickle.dumps(value)) for name, value in parts.items()))
+
+    def loadGame(self, names=SAVE_PARTS):
+        connection = self.connect()
+        parts = {}
+        for name in names:
+            row = connection.execute("SELECT Data FROM SavedGame WHERE Part = ?", (name,)).fetchone()
+            if row is None:
+                raise FileNotFoundError(f"No saved {name}")
+            parts[name] = pickle.loads(row[0])
+        return parts
+
+    def deleteSave(self):
+        with self.transaction() as connection:
+            connection.execute("DELETE FROM SavedGame")
+
+    def importFrom(self, source):
+        """
+        Replaces the contents of the database with the contents of another storage (e.g. the files of FileStorage).
+        Game IDs are kept.
+
+        Parameters:
+            source (Storage): Storage to copy
+        Returns:
+            games (int): Number of games copied
+        """
+        with self.transaction() as connection:
+            for table in ('Games', 'PlayerStats', 'Players', 'Settings', 'SavedGame'):
+                connection.execute(f"DELETE FROM {table}")
+
+            connection.executemany("INSERT INTO Games VALUES (?, ?, ?, ?, ?)", source.games())
+            connection.execute("""
+                INSERT INTO PlayerStats
+                SELECT Name, GameType, COUNT(*), SUM(Score), MAX(Score) FROM Games GROUP BY Name, GameType
+            """)
+            games = connection.execute("SELECT COUNT(*) FROM Games").fetchone()[0]
+
+            connection.executemany("INSERT INTO Players (Name) VALUES (?)", ((name,) for name in source.nameList()))
+            currentName = source.currentName()
+            if currentName is not None:
+                connection.execute("INSERT INTO Settings VALUES ('currentName', ?)", (currentName,))
+
+            if source.hasSave():
+                try:
+                    parts = source.loadGame()
+                except (OSError, EOFError, pickle.UnpicklingError):
+                    parts = {}  # Incomplete saved game: not copied
+                connection.executemany("INSERT INTO SavedGame VALUES (?, ?)",
+                                       ((name, pickle.dumps(value)) for name, value in parts.items()))
+        return games
+
+
+# Names of the storage backends, as accepted by openStorage
+STORAGE_BACKENDS = ('files', 'sqlite')
+
+
+def openStorage(backend, folderpath):
+    """
+    Returns the storage of the game
+
+    Parameters:
+        backend (str): 'files' (csv, text and pickle files) or 'sqlite' (memory.db)
+        folderpath (str): Folder the state is stored in
+    Returns:
+        storage (Storage): FileStorage or SqliteStorage
+    """
+    if backend == 'files':
+        return FileStorage(folderpath)
+    elif backend == 'sqlite':
+        return SqliteStorage(os.path.join(folderpath, 'memory.db'))
+    raise ValueError(f"Unknown storage backend: {backend} (expected one of {', '.join(STORAGE_BACKENDS)})")
@@ -0,0 +1,424 @@
+# Test Your Memory: Monte Carlo simulator used to calibrate the scoring curve (totalMovesToScore)
+# Vectorized player models; the bots are played in worker processes by bot_simulation.py
+
+# Standard Libraries
+import sys
+
+# Third Party Libraries
+import numpy as np
+
+# Game Modules
+from memory_core import totalMovesToScore
+
+
+# Player models that can be simulated
+PLAYER_MODELS = ['random', 'perfect', 'limited']
+
+# Number of games simulated at once (one row per game)
+BATCH_SIZE = 4096
+
+
+def simulateGames(n, games, model='random', memorySize=None, seed=None, batchSize=BATCH_SIZE):
+    """
+    Simulates many games of a n x n board at once and returns the total moves of every game
+
+    A move is a single card flip, the same way playGame counts totalMoves (1 pair = 2 moves)
+
+    Parameters:
+        n (int): Size of the board (any even size)
+        games (int): Number of games to simulate
+        model (str): Player model - 'random' (flips random hidden cards), 'perfect' (remembers every card seen)
+                     or 'limited' (remembers only the memorySize most recently seen cards)
+        memorySize (int): Number of cards a 'limited' player remembers
+        seed (int): Optional seed to make the simulation reproducible
+        batchSize (int): Number of games simulated together (bounds the memory used)
+
+    Returns:
+        totalMoves (numpy.ndarray): total moves of every simulated game
+    """
+    if n < 2 or n % 2 != 0:
+        raise ValueError(f"Board size must be an even number of at least 2, got {n}")
+    if model not in PLAYER_MODELS:
+        raise ValueError(f"Unknown player model '{model}', expected one of {PLAYER_MODELS}")
+    if model == 'limited' and (memorySize is None or memorySize < 1):
+        raise ValueError("The 'limited' player model needs a memorySize of at least 1")
+
+    rng = np.random.default_rng(seed)
+    totalMoves = np.empty(games, dtype=np.int64)
+
+    for start in range(0, games, batchSize):
+        batch = min(batchSize, games - start)
+        if model == 'random':
+            totalMoves[start:start + batch] = simulateRandomPlayer(n, batch, rng)
+        elif model == 'perfect':
+            totalMoves[start:start + batch] = simulateMemoryPlayer(n, batch, n * n, rng)
+        else:
+            totalMoves[start:start + batch] = simulateMemoryPlayer(n, batch, memorySize, rng)
+
+    return totalMoves
+
+
+def simulateRandomPlayer(n, games, rng):
+    """
+    Simulates games of a player who flips two random hidden cards every round
+
+    With p pairs left, two random hidden cards match with probability 1/(2p-1), independent of the
+    board and of earlier rounds, so the rounds needed to clear each pair are drawn directly as
+    geometric random numbers instead of playing the board
+
+    Parameters:
+        n (int): Size of the board
+        games (int): Number of games to simulate
+        rng (numpy.random.Generator): Random number generator
+
+    Returns:
+        totalMoves (numpy.ndarray): total moves of every simulated game
+    """
+    pairsLeft = np.arange(1, (n * n) // 2 + 1)
+    rounds = rng.geometric(1 / (2 * pairsLeft - 1), size=(games, len(pairsLeft)))
+    return 2 * rounds.sum(axis=1)
+
+
+def simulateMemoryPlayer(n, games, memorySize, rng):
+    """
+    Simulates games of a player who remembers the memorySize most recently seen cards
+
+    Every round the player flips a remembered pair if there is one. Otherwise they flip a card they
+    do not remember, followed by its partner if they remember it, or else by another card they do not remember.
+    Matched cards leave the memory; once it is full, the card seen the longest time ago is forgotten.
+
+    The state is updated card by card instead of being recomputed from the whole board, so a round costs
+    the same on any board size:
+    - cards never seen are flipped in index order (the board is random, so that is as good as a random
+      pick) and a cursor marks the first of them; forgotten cards are picked with pickForgotten
+    - remembered cards are kept in the order they were seen (see MemoryQueue), as a remembered card is only
+      flipped again to be matched
+    - a remembered pair is found when its second card is seen and matched in the next round, so there is
+      at most one at a time, kept with the card seen last
+
+    Parameters:
+        n (int): Size of the board
+        games (int): Number of games to simulate
+        memorySize (int): Number of cards the player remembers (n*n for perfect memory)
+        rng (numpy.random.Generator): Random number generator
+
+    Returns:
+        totalMoves (numpy.ndarray): total moves of every simulated game
+    """
+    cells = n * n
+
+    # Random boards, stored as the position of each card's partner (one row per game)
+    order = np.argsort(rng.random((games, cells)), axis=1)
+    partner = np.empty_like(order)
+    rows = np.arange(games)[:, None]
+    partner[rows, order[:, 0::2]] = order[:, 1::2]
+    partner[rows, order[:, 1::2]] = order[:, 0::2]
+
+    # Game state: matched and remembered cards, first card never seen, cards remembered and forgotten,
+    # the remembered pair (-1 if none), moves and pairs left
+    matched = np.zeros((games, cells), dtype=bool)
+    remembered = np.zeros((games, cells), dtype=bool)
+    cursor = np.zeros(games, dtype=np.int64)
+    rememberedQty = np.zeros(games, dtype=np.int64)
+    forgottenQty = np.zeros(games, dtype=np.int64)
+    knownPair = np.full(games, -1, dtype=np.int64)
+    moves = np.zeros(games, dtype=np.int64)
+    pairsLeft = np.full(games, cells // 2, dtype=np.int64)
+
+    # Order the cards were seen in, only needed if cards can be forgotten
+    memory = MemoryQueue(games, cells) if memorySize < cells else None
+
+    # Games still running (finished games keep their rows, untouched)
+    active = np.arange(games)
+
+    while len(active) > 0:
+        rows = active
+
+        # The remembered pair, unless one of its cards was forgotten since
+        first = knownPair[rows]
+        knownPair[rows] = -1
+        guessing = first < 0
+        pairRows, pairCards = rows[~guessing], first[~guessing]
+        guessing[~guessing] = ~(remembered[pairRows, pairCards] & remembered[pairRows, partner[pairRows, pairCards]])
+
+        # First card: the remembered pair if there is one, otherwise a card the player does not remember
+        guessing = np.flatnonzero(guessing)
+        guessRows = rows[guessing]
+        first[guessing] = pickUnknown(guessRows, cursor, forgottenQty, matched, remembered, rng)
+        remember(guessRows, first[guessing], remembered, rememberedQty, memory)
+        forgetOldest(guessRows, remembered, rememberedQty, forgottenQty, matched, memory, memorySize)
+
+        # Second card: the partner of the first card if remembered, otherwise another card the player does not remember
+        second = partner[rows, first]
+        guessing = guessing[~remembered[guessRows, second[guessing]]]
+        guessRows = rows[guessing]
+        second[guessing] = pickUnknown(guessRows, cursor, forgottenQty, matched, remembered, rng)
+        remember(guessRows, second[guessing], remembered, rememberedQty, memory)
+
+        # Matched cards (both remembered at this point) leave the board and the memory
+        matchFound = second == partner[rows, first]
+        matchRows = rows[matchFound]
+        for cards in (first[matchFound], second[matchFound]):
+            matched[matchRows, cards] = True
+            remembered[matchRows, cards] = False
+        rememberedQty[matchRows] -= 2
+        pairsLeft[matchRows] -= 1
+
+        # Mismatched cards stay remembered; a second card whose partner is remembered makes a remembered pair
+        missRows, missCards = rows[~matchFound], second[~matchFound]
+        forgetOldest(missRows, remembered, rememberedQty, forgottenQty, matched, memory, memorySize)
+        pairFound = remembered[missRows, missCards] & remembered[missRows, partner[missRows, missCards]]
+        knownPair[missRows[pairFound]] = missCards[pairFound]
+
+        moves[rows] += 2
+        active = rows[pairsLeft[rows] > 0]
+
+    return moves
+
+
+class MemoryQueue:
+    """
+    Remembered cards of every game in the order they were seen: one ring buffer of n*n cards per game.
+
+    A card is added when it is remembered and removed when it reaches the head, so each card is in a
+    buffer at most once. Matched cards are not removed right away: they are skipped at the head.
+
+    Parameters:
+        games (int): Number of games
+        cells (int): Number of cards of a board
+    """
+
+    def __init__(self, games, cells):
+        self.cells = cells
+        self.cards = np.empty((games, cells), dtype=np.int64)
+        self.head = np.zeros(games, dtype=np.int64)
+        self.tail = np.zeros(games, dtype=np.int64)
+
+    def add(self, rows, cards):
+        self.cards[rows, self.tail[rows] % self.cells] = cards
+        self.tail[rows] += 1
+
+    def popOldest(self, rows, matched):
+        """
+        Removes and returns the card seen the longest time ago of every row that is not matched yet
+        """
+        oldest = np.empty(len(rows), dtype=np.int64)
+        pending = np.arange(len(rows))
+        while len(pending) > 0:
+            pendingRows = rows[pending]
+            cards = self.cards[pendingRows, self.head[pendingRows] % self.cells]
+            self.head[pendingRows] += 1
+            found = ~matched[pendingRows, cards]
+            oldest[pending[found]] = cards[found]
+            pending = pending[~found]
+        return oldest
+
+
+def remember(rows, cards, remembered, rememberedQty, memory):
+    """
+    Adds a card the player did not remember to the memory of every given game
+    """
+    remembered[rows, cards] = True
+    rememberedQty[rows] += 1
+    if memory is not None:
+        memory.add(rows, cards)
+
+
+def forgetOldest(rows, remembered, rememberedQty, forgottenQty, matched, memory, memorySize):
+    """
+    Forgets the least recently seen card of every given game that remembers more than memorySize cards
+
+    Parameters:
+        rows (numpy.ndarray): games to check
+        remembered (numpy.ndarray): remembered cards, one row per game
+        rememberedQty (numpy.ndarray): number of cards remembered in every game
+        forgottenQty (numpy.ndarray): number of cards forgotten (seen, not matched, not remembered) in every game
+        matched (numpy.ndarray): matched cards, one row per game
+        memory (MemoryQueue): order the cards were seen in (None for perfect memory)
+        memorySize (int): Number of cards the player remembers
+    """
+    if memory is None:
+        return
+    overCapacity = rows[rememberedQty[rows] > memorySize]
+    if len(overCapacity) > 0:
+        remembered[overCapacity, memory.popOldest(overCapacity, matched)] = False
+        rememberedQty[overCapacity] -= 1
+        forgottenQty[overCapacity] += 1
+
+
+def pickUnknown(rows, cursor, forgottenQty, matched, remembered, rng):
+    """
+    Picks a random card the player does not remember (never seen or forgotten) in every given game
+
+    Cards never seen are all alike (the board is random), so one of them is simply the next one in index
+    order; a forgotten card is picked as often as there are forgotten cards among the unknown ones.
+
+    Parameters:
+        rows (numpy.ndarray): games to pick a card in
+        cursor (numpy.ndarray): first card never seen in every game (updated)
+        forgottenQty (numpy.ndarray): number of cards forgotten in every game (updated)
+        matched (numpy.ndarray): matched cards, one row per game
+        remembered (numpy.ndarray): remembered cards, one row per game
+        rng (numpy.random.Generator): Random number generator
+
+    Returns:
+        picked (numpy.ndarray): picked card of every given game
+    """
+    picked = cursor[rows]
+    forgotten = forgottenQty[rows]
+    if not forgotten.any():
+        cursor[rows] += 1
+        return picked
+
+    unseen = matched.shape[1] - picked
+    pickForgottenCard = rng.random(len(rows)) * (unseen + forgotten) < forgotten
+
+    forgottenRows = rows[pickForgottenCard]
+    picked[pickForgottenCard] = pickForgotten(forgottenRows, cursor, matched, remembered, rng)
+    forgottenQty[forgottenRows] -= 1
+    cursor[rows[~pickForgottenCard]] += 1
+    return picked
+
+
+# Random guesses pickForgotten makes before looking at every seen card
+FORGOTTEN_GUESSES = 8
+
+
+def pickForgotten(rows, cursor, matched, remembered, rng):
+    """
+    Picks a random forgotten card (seen, neither matched nor remembered) in every given game
+
+    Random seen cards are tried a few times (forgotten cards are usually most of the seen cards that are
+    left); games where that fails pick among all of their seen cards
+
+    Parameters:
+        rows (numpy.ndarray): games to pick a card in (each with at least one forgotten card)
+        cursor (numpy.ndarray): first card never seen in every game
+        matched (numpy.ndarray): matched cards, one row per game
+        remembered (numpy.ndarray): remembered cards, one row per game
+        rng (numpy.random.Generator): Random number generator
+
+    Returns:
+        picked (numpy.ndarray): picked card of every given game
+    """
+    picked = np.empty(len(rows), dtype=np.int64)
+    pending = np.arange(len(rows))
+    for guess in range(FORGOTTEN_GUESSES):
+        pendingRows = rows[pending]
+        cards = rng.integers(0, cursor[pendingRows])
+        found = ~matched[pendingRows, cards] & ~remembered[pendingRows, cards]
+        picked[pending[found]] = cards[found]
+        pending = pending[~found]
+        if len(pending) == 0:
+            return picked
+
+    pendingRows = rows[pending]
+    seen = np.arange(matched.shape[1]) < cursor[pendingRows, None]
+    picked[pending] = pickRandom(seen & ~matched[pendingRows] & ~remembered[pendingRows], rng)
+    return picked
+
+
+def pickRandom(mask, rng):
+    """
+    Picks one random True position per row of a boolean mask (rows without any True position get 0)
+
+    Parameters:
+        mask (numpy.ndarray): boolean array with one row per game
+        rng (numpy.random.Generator): Random number generator
+
+    Returns:
+        picked (numpy.ndarray): picked column of every row
+    """
+    # Random keys in [1, 2) for True positions and 0 for False positions; the largest key wins
+    keys = rng.random(mask.shape, dtype=np.float32)
+    keys += 1.0
+    keys *= mask
+    return keys.argmax(axis=1)
+
+
+def scoreMoves(totalMoves, n):
+    """
+    Converts an array of total moves to scores with the game's scoring curve (totalMovesToScore)
+
+    Parameters:
+        totalMoves (numpy.ndarray): total moves of every game
+        n (int): Size of the board
+
+    Returns:
+        scores (numpy.ndarray): score of every game
+    """
+    uniqueMoves, inverse = np.unique(totalMoves, return_inverse=True)
+    uniqueScores = np.array([int(totalMovesToScore(int(moves), n)) for moves in uniqueMoves], dtype=np.int64)
+    return uniqueScores[inverse]
+
+
+def summarizeMoves(totalMoves, n):
+    """
+    Summarizes the distribution of total moves (and the scores they give) of simulated games
+
+    Parameters:
+        totalMoves (numpy.ndarray): total moves of every game
+        n (int): Size of the board
+
+    Returns:
+        summary (dict): number of games, mean/std/min/max and percentiles of the total moves,
+                        plus the mean and median score of the current scoring curve
+    """
+    percentiles = np.percentile(totalMoves, [5, 25, 50, 75, 95])
+    scores = scoreMoves(totalMoves, n)
+
+    return {
+        'games': len(totalMoves),
+        'mean': float(totalMoves.mean()),
+        'std': float(totalMoves.std()),
+        'min': int(totalMoves.min()),
+        'p5': float(percentiles[0]),
+        'p25': float(percentiles[1]),
+        'p50': float(percentiles[2]),
+        'p75': float(percentiles[3]),
+        'p95': float(percentiles[4]),
+        'max': int(totalMoves.max()),
+        'meanScore': float(scores.mean()),
+        'medianScore': float(np.median(scores))
+    }
+
+
+def calibrationTable(sizes=(4, 6, 8), games=20000, memorySize=8, seed=None):
+    """
+    Simulates every player model on every board size
+
+    Parameters:
+        sizes (iterable): Board sizes to simulate
+        games (int): Number of games per board size and player model
+        memorySize (int): Number of cards remembered by the 'limited' player model
+        seed (int): Optional seed to make the simulation reproducible
+
+    Returns:
+        table (list): one summary dict (see summarizeMoves) per board size and player model,
+                      with the added keys 'n' and 'model'
+    """
+    rng = np.random.default_rng(seed)
+    table = []
+    for n in sizes:
+        for model in PLAYER_MODELS:
+            totalMoves = simulateGames(n, games, model, memorySize, seed=rng.integers(2**63))
+            table.append({'n': n, 'model': model, **summarizeMoves(totalMoves, n)})
+    return table
+
+
+def printCalibrationTable(table, file=sys.stdout):
+    """
+    Prints a calibration table (see calibrationTable) as CSV
+
+    Parameters:
+        table (list): rows returned by calibrationTable
+        file: Text stream to write to
+    """
+    columns = list(table[0].keys())
+    print(",".join(columns), file=file)
+    for row in table:
+        print(",".join(f"{row[column]:.2f}" if isinstance(row[column], float) else str(row[column]) for column in columns), file=file)
+
+
+if __name__ == "__main__":
+    printCalibrationTable(calibrationTable())
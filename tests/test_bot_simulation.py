@@ -0,0 +1,19 @@
+# Batch simulation regression test: the worker processes must not import numpy
+
+# Standard Libraries
+import json
+import os
+import subprocess
+import sys
+
+
+# Folder of the game
+PACKAGE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_workersSkipNumpy():
+    # A spawned worker imports the module of the function it runs (simulateBotChunk), so that module must not need numpy
+    code = "import bot_simulation, json, sys; print(json.dumps(sorted(sys.modules)))"
+    output = subprocess.run([sys.executable, '-c', code], cwd=PACKAGE_FOLDER, capture_output=True, text=True, check=True).stdout
+    loadedPackages = {name.split('.')[0] for name in json.loads(output)}
+    assert 'numpy' not in loadedPackages, "bot_simulation imports numpy"
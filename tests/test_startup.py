@@ -0,0 +1,52 @@
+# Startup regression test: the main menu must appear quickly and without the heavy dependencies
+
+# Standard Libraries
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+# Path of the game
+MEMORY_PY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'memory.py')
+
+# Maximum time from starting the game to the first byte of the main menu (milliseconds), interpreter startup included
+# (about 300 ms when this was set; importing pandas alone takes over 800 ms)
+FIRST_FRAME_BUDGET_MS = 600
+
+# Dependencies that must only be imported by the functions that use them
+LAZY_DEPENDENCIES = ['rich', 'cryptography', 'pandas']
+
+
+def startFirstFrame():
+    """
+    Starts the game with --first-frame and waits for the first byte of the main menu
+
+    Returns:
+        firstFrame (float): Time to the first byte (milliseconds)
+        loaded (list): Names of the modules imported when the menu was drawn (printed by the game on stderr)
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, MEMORY_PY, '--first-frame'], cwd=os.path.dirname(MEMORY_PY),
+                               stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert process.stdout.read(1), "the game printed nothing"
+    firstFrame = (time.perf_counter() - start) * 1000
+    process.stdout.read()
+    loaded = json.loads(process.stderr.read())
+    assert process.wait() == 0
+    return firstFrame, loaded
+
+
+def test_firstFrameWithinBudget():
+    # The first start compiles the modules and fills the banner cache; the best of the next three is measured
+    startFirstFrame()
+    firstFrame = min(startFirstFrame()[0] for attempt in range(3))
+    assert firstFrame < FIRST_FRAME_BUDGET_MS, f"first frame took {firstFrame:.0f} ms (budget: {FIRST_FRAME_BUDGET_MS} ms)"
+
+
+def test_firstFrameSkipsHeavyDependencies():
+    firstFrame, loaded = startFirstFrame()
+    loadedPackages = {name.split('.')[0] for name in loaded}
+    for dependency in LAZY_DEPENDENCIES:
+        assert dependency not in loadedPackages, f"{dependency} is imported before the first frame"
@@ -0,0 +1,76 @@
+# Game log regression tests: the leaderboard index and the next ID kept next to the csv log (see FileStorage)
+
+# Standard Libraries
+from datetime import date
+import os
+import random
+import sys
+
+# Game Modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from memory_storage import LEADERBOARD_SIZE, FileStorage, nextGameLogId
+
+
+# Players, game types and days of the logged games (few of each, so equal scores and dates are common)
+NAMES = ['Ana', 'Ben', 'José', 'Zoë']
+GAME_TYPES = [4, 6, 8]
+DAYS = [date(2026, 1, day) for day in (1, 2, 3)]
+
+
+def recordRandomGames(storage, games, rng):
+    """
+    Records games with random players, scores, game types and days
+    """
+    for game in range(games):
+        storage.recordGame(rng.choice(NAMES), rng.randrange(0, 2000, 50), rng.choice(GAME_TYPES), rng.choice(DAYS))
+
+
+def test_updatedIndexMatchesRebuild(tmp_path):
+    storage = FileStorage(tmp_path)
+    rng = random.Random(7)
+    recordRandomGames(storage, 20, rng)
+
+    # The first leaderboard builds the index, the next games update it in place
+    storage.topScores(GAME_TYPES, LEADERBOARD_SIZE)
+    recordRandomGames(storage, 200, rng)
+
+    index = storage.loadLeaderboardIndex()
+    assert index is not None, "recordGame left the index out of date"
+    assert index['topScores'] == storage.buildLeaderboardIndex(index['limit'])['topScores']
+
+
+def test_tornLineDoesNotDuplicateId(tmp_path):
+    storage = FileStorage(tmp_path)
+    for score in (100, 200, 300):
+        storage.recordGame('Ana', score, 4, DAYS[0])
+
+    # A crash while entry 4 was written leaves it without its line end (all its fields are there)
+    with open(storage.gameLogFile, 'ab') as file:
+        file.write(b"4,Ben,900,4,2026-01-01")
+    storage.recordGame('Zoë', 50, 4, DAYS[1])
+
+    ids = [id for id, name, score, gameType, day in storage.games()]
+    assert ids == [1, 2, 3, 4]
+    assert storage.topScores([4], 1) == {4: [('Ana', 300, '2026-01-01')]}
+
+
+def test_deletePlayersInvalidatesIdAndIndex(tmp_path):
+    storage = FileStorage(tmp_path)
+    recordRandomGames(storage, 30, random.Random(11))
+    storage.topScores(GAME_TYPES, LEADERBOARD_SIZE)
+
+    storage.deletePlayers(['Ana', 'Ben'])
+
+    games = list(storage.games())
+    assert {name for id, name, score, gameType, day in games} <= {'Ana', 'Ben'}
+    assert not os.path.exists(os.path.join(tmp_path, 'gamelog', 'nextid'))
+    assert storage.loadLeaderboardIndex() is None
+
+    # IDs continue from the last remaining entry, and leaderboards only show the remaining players
+    assert nextGameLogId(storage.gameLogFile) == max(id for id, name, score, gameType, day in games) + 1
+    expected = {}
+    for id, name, score, gameType, day in games:
+        expected.setdefault(gameType, []).append((name, score, day, id))
+    for gameType in GAME_TYPES:
+        best = sorted(expected.get(gameType, []), key=lambda game: (-game[1], game[2], game[3]))[:LEADERBOARD_SIZE]
+        assert storage.topScores([gameType], LEADERBOARD_SIZE)[gameType] == [(name, score, day) for name, score, day, id in best]